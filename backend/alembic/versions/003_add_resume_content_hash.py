@@ -0,0 +1,24 @@
+"""add content hash to resumes
+
+Revision ID: 003_add_resume_content_hash
+Revises: 002_create_resumes_analyses
+Create Date: 2026-10-18
+
+Stores the SHA-256 of the uploaded bytes so the background worker can
+populate / reuse the extracted-text cache without re-reading the upload.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "003_add_resume_content_hash"
+down_revision = "002_create_resumes_analyses"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("resumes", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("resumes", "content_hash")
@@ -0,0 +1,30 @@
+"""add parent_id to resumes
+
+Revision ID: 004_add_resume_parent_id
+Revises: 003_add_resume_content_hash
+Create Date: 2026-10-18
+
+Links a re-upload to the version it revises, so the pipeline can analyse
+it incrementally from its predecessor.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "004_add_resume_parent_id"
+down_revision = "003_add_resume_content_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resumes",
+        sa.Column("parent_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("resumes.id"), nullable=True),
+    )
+    op.create_index("ix_resumes_parent_id", "resumes", ["parent_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_parent_id", table_name="resumes")
+    op.drop_column("resumes", "parent_id")
@@ -0,0 +1,31 @@
+"""add (user_id, created_at, id) index to resumes
+
+Revision ID: 005_add_resume_listing_index
+Revises: 004_add_resume_parent_id
+Create Date: 2026-10-18
+
+Serves the newest-first, keyset-paginated resume listing and the
+dashboard's recent-resumes query from an index range scan. It leads with
+user_id, so it replaces ix_resumes_user_id.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "005_add_resume_listing_index"
+down_revision = "004_add_resume_parent_id"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_resumes_user_created",
+        "resumes",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("ix_resumes_user_id", table_name="resumes")
+
+
+def downgrade() -> None:
+    op.create_index("ix_resumes_user_id", "resumes", ["user_id"])
+    op.drop_index("ix_resumes_user_created", table_name="resumes")
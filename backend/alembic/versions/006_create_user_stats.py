@@ -0,0 +1,41 @@
+"""create user_stats rollup table
+
+Revision ID: 006_create_user_stats
+Revises: 005_add_resume_listing_index
+Create Date: 2026-10-18
+
+Per-user resume count and score totals, maintained on write so dashboard
+stats are a primary-key lookup. Backfilled here from resumes/analyses;
+`python -m app.workers.reconcile_stats` rebuilds it the same way.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "006_create_user_stats"
+down_revision = "005_add_resume_listing_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("resume_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("scored_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.execute(
+        """
+        INSERT INTO user_stats (user_id, resume_count, scored_count, score_sum, updated_at)
+        SELECT r.user_id, count(r.id), count(a.overall_score), coalesce(sum(a.overall_score), 0), now()
+        FROM resumes r LEFT OUTER JOIN analyses a ON a.resume_id = r.id
+        GROUP BY r.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_stats")
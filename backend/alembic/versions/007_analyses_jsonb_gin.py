@@ -0,0 +1,48 @@
+"""store analysis documents as JSONB and index them with GIN
+
+Revision ID: 007_analyses_jsonb_gin
+Revises: 006_create_user_stats
+Create Date: 2026-10-18
+
+sections / suggestions / keywords become JSONB so they can be filtered
+in SQL. GIN (jsonb_path_ops) indexes serve the @> containment queries of
+GET /api/resume/search: one on keywords, and an expression index on the
+list of missing sections rather than the whole (large) sections document.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "007_analyses_jsonb_gin"
+down_revision = "006_create_user_stats"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("sections", "suggestions", "keywords")
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "analyses", column,
+            type_=postgresql.JSONB(), postgresql_using=f"{column}::jsonb",
+        )
+    op.create_index(
+        "ix_analyses_keywords_gin", "analyses", ["keywords"],
+        postgresql_using="gin", postgresql_ops={"keywords": "jsonb_path_ops"},
+    )
+    # Must match app.models.analysis.MISSING_SECTIONS
+    op.execute(
+        "CREATE INDEX ix_analyses_missing_sections_gin ON analyses "
+        "USING gin ((sections -> 'sections' -> 'missing') jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analyses_missing_sections_gin", table_name="analyses")
+    op.drop_index("ix_analyses_keywords_gin", table_name="analyses")
+    for column in _COLUMNS:
+        op.alter_column(
+            "analyses", column,
+            type_=postgresql.JSON(), postgresql_using=f"{column}::json",
+        )
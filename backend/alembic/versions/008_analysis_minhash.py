@@ -0,0 +1,39 @@
+"""add MinHash signatures to analyses and their LSH band index
+
+Revision ID: 008_analysis_minhash
+Revises: 007_analyses_jsonb_gin
+Create Date: 2026-10-18
+
+analyses.minhash holds a 256-byte text signature (app.utils.minhash);
+analysis_minhash_bands has one row per LSH band of it, indexed on
+(band, bucket) so near-duplicate candidates are an index lookup. Existing
+analyses are signed by `python -m app.workers.backfill_minhash`.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "008_analysis_minhash"
+down_revision = "007_analyses_jsonb_gin"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("analyses", sa.Column("minhash", sa.LargeBinary(), nullable=True))
+    op.create_table(
+        "analysis_minhash_bands",
+        sa.Column(
+            "analysis_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("analyses.id", ondelete="CASCADE"), primary_key=True,
+        ),
+        sa.Column("band", sa.SmallInteger(), primary_key=True),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+    )
+    op.create_index("ix_minhash_bands_bucket", "analysis_minhash_bands", ["band", "bucket"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_minhash_bands_bucket", table_name="analysis_minhash_bands")
+    op.drop_table("analysis_minhash_bands")
+    op.drop_column("analyses", "minhash")
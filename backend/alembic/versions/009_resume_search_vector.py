@@ -0,0 +1,32 @@
+"""add a generated full-text search vector to resumes
+
+Revision ID: 009_resume_search_vector
+Revises: 008_analysis_minhash
+Create Date: 2026-10-18
+
+resumes.search_vector is a stored generated column over raw_text, so
+PostgreSQL fills it on insert and refreshes it whenever raw_text changes;
+nothing in the application writes it. The GIN index serves the @@ matches
+of GET /api/resume/search/text. The text search configuration must match
+app.models.resume.SEARCH_CONFIG.
+"""
+from alembic import op
+
+revision = "009_resume_search_vector"
+down_revision = "008_analysis_minhash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rewrites the table once to compute the vector for existing resumes
+    op.execute(
+        "ALTER TABLE resumes ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english'::regconfig, coalesce(raw_text, ''))) STORED"
+    )
+    op.create_index("ix_resumes_search_vector", "resumes", ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_search_vector", table_name="resumes")
+    op.drop_column("resumes", "search_vector")
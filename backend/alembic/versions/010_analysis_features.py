@@ -0,0 +1,27 @@
+"""store each analysis's raw measurements as a feature vector
+
+Revision ID: 010_analysis_features
+Revises: 009_resume_search_vector
+Create Date: 2026-10-18
+
+analyses.features packs the counts the dimension scores are derived from
+(app.services.rescoring.FEATURES, float32), so a change to the scoring
+weights or bands re-scores the history with `python -m app.workers.rescore`
+instead of re-analysing every text. Existing analyses get theirs from
+`python -m app.workers.rescore --backfill`.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "010_analysis_features"
+down_revision = "009_resume_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("analyses", sa.Column("features", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("analyses", "features")
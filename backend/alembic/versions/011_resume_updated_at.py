@@ -0,0 +1,34 @@
+"""track when each resume last changed, for the stalled-job recovery sweep
+
+Revision ID: 011_resume_updated_at
+Revises: 010_analysis_features
+Create Date: 2026-10-18
+
+resumes.updated_at tells the recovery sweep (app.workers.queue.recover_stalled)
+how long an "uploaded" resume has waited and how long a "processing" one has
+run. A partial index keeps the sweep to the few unfinished rows. Existing rows
+take their created_at.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "011_resume_updated_at"
+down_revision = "010_analysis_features"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("resumes", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE resumes SET updated_at = created_at")
+    op.create_index(
+        "ix_resumes_unfinished",
+        "resumes",
+        ["status", "updated_at"],
+        postgresql_where=sa.text("status IN ('uploaded', 'processing')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_unfinished", table_name="resumes")
+    op.drop_column("resumes", "updated_at")
@@ -11,7 +11,7 @@ from app.dependencies import get_current_user
 from app.core.database import get_db
 from app.models.user import User
 from app.schemas.user import UserResponse
-from app.services.resume_service import ResumeService
+from app.services.dashboard_service import DashboardService
 
 router = APIRouter()
 
@@ -22,14 +22,12 @@ async def get_dashboard(
     db: AsyncSession = Depends(get_db),
 ):
     """Get user dashboard data with resume stats and recent resumes."""
-    service = ResumeService(db)
-    stats = await service.get_user_stats(current_user.id)
-    resumes = await service.list_user_resumes(current_user.id)
+    summary = await DashboardService(db).summary(current_user.id)
     return {
         "message": f"Welcome back, {current_user.full_name or current_user.email}!",
         "user": UserResponse.model_validate(current_user).model_dump(),
-        "stats": stats,
-        "recent_resumes": resumes[:5],
+        "stats": summary["stats"],
+        "recent_resumes": summary["recent_resumes"],
     }
 
 
@@ -39,10 +37,9 @@ async def get_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get user statistics and analytics."""
-    service = ResumeService(db)
-    stats = await service.get_user_stats(current_user.id)
+    summary = await DashboardService(db).summary(current_user.id)
     return {
         "user_id": str(current_user.id),
         "tier": current_user.tier,
-        **stats,
+        **summary["stats"],
     }
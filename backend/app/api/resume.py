@@ -4,13 +4,26 @@ Upload, analyse, and retrieve resumes.
 All endpoints require authentication.
 """
 
-from fastapi import APIRouter, UploadFile, File, Depends
+import uuid
+
+from fastapi import APIRouter, UploadFile, File, Form, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+from starlette.datastructures import UploadFile as StarletteUploadFile
 
 from app.dependencies import get_current_user
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.events import event_bus
 from app.models.user import User
+from app.schemas.match import JobMatchRequest, JobRankRequest
+from app.services.bulk_upload_service import BulkUploadService
+from app.services.duplicate_service import DuplicateService
+from app.services.match_service import MatchService
+from app.services.resume_events import status_stream, topic
 from app.services.resume_service import ResumeService
+from app.services.search_service import SearchService
 
 router = APIRouter()
 
@@ -18,43 +31,174 @@ router = APIRouter()
 @router.post("/upload")
 async def upload_resume(
     file: UploadFile = File(...),
+    previous_id: uuid.UUID | None = Form(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Upload a resume (PDF / DOCX / TXT) for AI analysis."""
+    """Upload a resume (PDF / DOCX / TXT) for AI analysis, optionally as a new version of `previous_id`."""
     service = ResumeService(db)
-    return await service.upload_and_analyze(file, current_user.id)
+    return await service.upload_and_analyze(file, current_user.id, previous_id)
+
+
+# The body is read in the handler (see bulk_upload), so describe it for the docs by hand
+_BULK_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"multipart/form-data": {"schema": {
+            "type": "object",
+            "required": ["files"],
+            "properties": {"files": {
+                "type": "array",
+                "items": {"type": "string", "format": "binary"},
+                "description": "ZIP archives and/or individual PDF / DOCX / TXT resumes",
+            }},
+        }}},
+    },
+}
+
+
+@router.post("/bulk", openapi_extra=_BULK_BODY, response_class=StreamingResponse)
+async def bulk_upload(request: Request, current_user: User = Depends(get_current_user)):
+    """
+    Upload many resumes at once (`files`: ZIPs and/or resumes) and analyse them.
+    Streams NDJSON: one line per file as it is stored, then a `{"done": true, ...}` summary.
+    """
+    # Parsed here rather than as File(...) parameters: FastAPI closes those
+    # before a streaming response starts, and the stream still reads them
+    form = await request.form(max_files=settings.BULK_MAX_FILES, max_fields=10)
+    files = [part for part in form.getlist("files") if isinstance(part, StarletteUploadFile)]
+    service = BulkUploadService(current_user.id, files)
+    try:
+        service.validate()
+    except Exception:
+        await form.close()
+        raise
+    # StreamingResponse doesn't close its iterator when the client disconnects; this does
+    stream = service.stream()
+    return StreamingResponse(stream, media_type="application/x-ndjson", background=BackgroundTask(stream.aclose))
 
 
 @router.get("/")
 async def list_resumes(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """List the authenticated user's resumes, newest first; follow `next_cursor` for more."""
+    service = ResumeService(db)
+    return await service.list_user_resumes(current_user.id, limit, cursor)
+
+
+@router.get("/search")
+async def search_resumes(
+    keyword: list[str] = Query([], description="found by the analysis (all must match)"),
+    missing_section: list[str] = Query([], description="reported missing (all must match)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all resumes for the authenticated user."""
+    """Find the user's analysed resumes by detected keywords and missing sections."""
     service = ResumeService(db)
-    resumes = await service.list_user_resumes(current_user.id)
-    return {"resumes": resumes}
+    return await service.search_resumes(current_user.id, keyword, missing_section, limit, cursor)
+
+
+@router.get("/search/text")
+async def search_resume_text(
+    q: str = Query(..., min_length=1, max_length=500, description='e.g. python AND kubernetes NOT intern'),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Full-text search over the user's resumes (AND / OR / NOT, "phrases", -exclusions), best match first."""
+    service = SearchService(db)
+    return await service.search(current_user, q, limit, cursor)
+
+
+@router.post("/match")
+async def rank_resumes(
+    body: JobRankRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Rank the user's resumes against a job description (BM25)."""
+    service = MatchService(db)
+    return await service.rank_resumes(current_user.id, body.job_description, body.limit)
 
 
 @router.get("/{resume_id}")
 async def get_resume(
     resume_id: str,
+    fields: str | None = Query(None, description="e.g. resume.filename,analysis.overall_score"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get resume details and analysis by ID."""
+    """Get resume details and analysis by ID, optionally only the selected `fields`."""
     service = ResumeService(db)
-    return await service.get_resume_with_analysis(resume_id, current_user.id)
+    return await service.get_resume_with_analysis(resume_id, current_user.id, fields)
 
 
 @router.get("/{resume_id}/analysis")
 async def get_analysis(
     resume_id: str,
+    fields: str | None = Query(None, description="e.g. overall_score,suggestions"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get just the AI analysis for a resume."""
+    """Get just the AI analysis for a resume, optionally only the selected `fields`."""
     service = ResumeService(db)
-    data = await service.get_resume_with_analysis(resume_id, current_user.id)
-    return data.get("analysis")
+    return await service.get_analysis(resume_id, current_user.id, fields)
+
+
+@router.get("/{resume_id}/events", response_class=StreamingResponse)
+async def resume_events(
+    resume_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Server-Sent Events: the resume's current status, then each change
+    (`event: status`, data `{resume_id, status, analysis_id, overall_score}`)
+    until it is analyzed or failed.
+    """
+    # Subscribe before reading, so a change committed in between still arrives
+    subscription = event_bus.subscribe(topic(resume_id))
+    try:
+        current = await ResumeService(db).get_status(resume_id, current_user.id)
+    except BaseException:
+        subscription.close()
+        raise
+    stream = status_stream(subscription, current, current_user.id)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(stream.aclose),
+    )
+
+
+@router.get("/{resume_id}/duplicates")
+async def near_duplicates(
+    resume_id: uuid.UUID,
+    threshold: float | None = Query(None, ge=0, le=1, description="minimum similarity (default NEAR_DUPLICATE_THRESHOLD)"),
+    limit: int = Query(10, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """The user's other resumes whose text is a near-duplicate of this one (MinHash LSH), most similar first."""
+    service = DuplicateService(db)
+    return await service.near_duplicates(resume_id, current_user.id, threshold, limit)
+
+
+@router.post("/{resume_id}/match")
+async def match_resume(
+    resume_id: uuid.UUID,
+    body: JobMatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Score a resume against a job description and list matched / missing keywords."""
+    service = MatchService(db)
+    return await service.match_resume(resume_id, current_user.id, body.job_description)
@@ -0,0 +1,150 @@
+"""
+Caching Utilities
+Size-bounded in-process LRU with an optional Redis tier behind it.
+Values are stored as JSON so both tiers hold the same bytes and callers
+always get a fresh copy they are free to mutate.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# After a Redis error the tier is skipped for this long instead of timing out on every call
+_REDIS_BACKOFF_SECONDS = 30
+
+
+class LRUCache:
+    """LRU keyed by string, evicting least-recently-used entries once ``max_bytes`` is exceeded."""
+
+    def __init__(self, max_bytes: int, ttl: float | None = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._data: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        payload, expires_at = item
+        if expires_at is not None and expires_at < time.monotonic():
+            self.delete(key)
+            return None
+        self._data.move_to_end(key)
+        return payload
+
+    def set(self, key: str, payload: str) -> None:
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        self.delete(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._data[key] = (payload, expires_at)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (evicted, _) = self._data.popitem(last=False)
+            self.size -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.size -= len(item[0])
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """Local LRU in front of an optional shared Redis tier, with hit/miss counters."""
+
+    def __init__(
+        self,
+        namespace: str,
+        max_bytes: int,
+        ttl: int | None = None,
+        use_redis: bool = False,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local = LRUCache(max_bytes, ttl)
+        self.use_redis = use_redis
+        self._redis = None
+        self._redis_down_until = 0.0
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    # ── public API ───────────────────────────────────────────────────────
+    async def get(self, key: str) -> Any | None:
+        payload = self.local.get(key)
+        if payload is not None:
+            self.local_hits += 1
+            return json.loads(payload)
+        payload = await self._redis_get(key)
+        if payload is not None:
+            self.redis_hits += 1
+            self.local.set(key, payload)
+            return json.loads(payload)
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        self.local.set(key, payload)
+        await self._redis_call("set", self._redis_key(key), payload, ex=self.ttl)
+
+    async def delete(self, key: str) -> None:
+        self.local.delete(key)
+        await self._redis_call("delete", self._redis_key(key))
+
+    def stats(self) -> dict:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self.local),
+            "bytes": self.local.size,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    # ── Redis tier ───────────────────────────────────────────────────────
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _client(self):
+        if not self.use_redis or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(
+                settings.REDIS_URL, socket_connect_timeout=0.5, socket_timeout=0.5,
+            )
+        return self._redis
+
+    async def _redis_get(self, key: str) -> str | None:
+        payload = await self._redis_call("get", self._redis_key(key))
+        if isinstance(payload, bytes):
+            return payload.decode("utf-8")
+        return payload
+
+    async def _redis_call(self, method: str, *args, **kwargs):
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            return await getattr(client, method)(*args, **kwargs)
+        except Exception as exc:  # the cache must never fail a request
+            logger.warning("Redis cache '%s' unavailable: %s", self.namespace, exc)
+            self._redis_down_until = time.monotonic() + _REDIS_BACKOFF_SECONDS
+            return None
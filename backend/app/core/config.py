@@ -22,6 +22,68 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Uploads
+    MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_CHUNK_BYTES: int = 1024 * 1024
+    BULK_MAX_BYTES: int = 200 * 1024 * 1024  # whole POST /api/resume/bulk body (ZIPs included)
+    BULK_MAX_FILES: int = 500
+    BULK_CONCURRENCY: int = 4  # files extracted / scored at once per bulk request
+    BULK_INSERT_BATCH: int = 50  # most rows per group commit
+
+    # Analysis executor (CPU-bound extraction + scoring)
+    ANALYSIS_EXECUTOR: str = "process"  # process, thread, inline
+    ANALYSIS_WORKERS: int = 2
+    ANALYSIS_MAX_PENDING: int = 32
+    ANALYSIS_RETRY_AFTER: int = 5
+
+    # PDF extraction (0 disables a budget / parallel extraction)
+    PDF_MAX_PAGES: int = 50
+    PDF_MAX_CHARS: int = 200_000
+    PDF_PARALLEL_MIN_PAGES: int = 8
+    PDF_PAGES_PER_TASK: int = 4
+
+    # Job-description matching (per-user BM25 partitions kept in memory)
+    MATCH_INDEX_MAX_USERS: int = 1000
+
+    # Full-text resume search (GET /api/resume/search/text)
+    FULLTEXT_SEARCH_TIERS: List[str] = ["pro", "enterprise"]  # plans that may use it
+    FULLTEXT_MAX_TERMS: int = 16  # words / phrases per query
+
+    # Near-duplicate detection (MinHash LSH over analysed resume text)
+    NEAR_DUPLICATE_THRESHOLD: float = 0.7  # estimated Jaccard similarity of word 3-shingles
+    NEAR_DUPLICATE_MAX_CANDIDATES: int = 200  # LSH candidates checked per lookup
+    NEAR_DUPLICATE_REUSE: bool = False  # re-score new uploads incrementally from their closest near-duplicate
+
+    # Password hashing executor (bcrypt off the event loop)
+    PASSWORD_EXECUTOR: str = "thread"  # thread, inline
+    PASSWORD_WORKERS: int = 2
+    PASSWORD_MAX_PENDING: int = 64
+    PASSWORD_RETRY_AFTER: int = 2
+
+    # Resume processing queue
+    RESUME_QUEUE_BACKEND: str = "inprocess"  # inprocess, redis, celery
+    RESUME_QUEUE_CONCURRENCY: int = 4
+    RESUME_REQUEUE_AFTER: int = 300  # re-enqueue resumes still "uploaded" after this many seconds (lost or failed enqueue)
+    RESUME_PROCESSING_TIMEOUT: int = 900  # "processing" this long means the worker died; reset and re-enqueue
+    RESUME_RECOVERY_INTERVAL: int = 60  # seconds between recovery sweeps (0 disables them)
+
+    # Resume status events (GET /api/resume/{id}/events)
+    EVENTS_BACKEND: str = "inprocess"  # inprocess, redis (needed when workers run in other processes)
+    SSE_HEARTBEAT_SECONDS: int = 15  # keep-alive comment, and a status re-read in case an event was missed
+
+    # Caching (in-process LRU, optionally backed by Redis)
+    CACHE_REDIS_ENABLED: bool = False
+    ANALYSIS_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    ANALYSIS_CACHE_TTL: int = 7 * 24 * 3600
+    ANALYSIS_LINE_CACHE_SIZE: int = 20_000  # per-line features kept for incremental re-analysis
+    AUTH_CACHE_MAX_BYTES: int = 4 * 1024 * 1024  # user snapshots for get_current_user
+    AUTH_CACHE_TTL: int = 30  # upper bound on how stale another process's copy can be
+    DASHBOARD_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    DASHBOARD_CACHE_TTL: int = 60
+
+    # Observability (/metrics, Server-Timing header)
+    METRICS_ENABLED: bool = True
+
     # Stripe
     STRIPE_SECRET_KEY: str = ""
     STRIPE_WEBHOOK_SECRET: str = ""
@@ -0,0 +1,143 @@
+"""
+Event Bus
+Fans small JSON events out to subscribers waiting in this process, keyed by
+topic (e.g. one resume). Delivery is best-effort: subscribers that can miss
+an event must be able to re-read the state it describes.
+
+Backends (settings.EVENTS_BACKEND):
+- "inprocess": publish() hands events straight to local subscribers (the
+               in-process queue, a single API worker)
+- "redis":     publish() goes to one Redis pub/sub channel and a listener
+               task in every API process relays it to local subscribers, so
+               events from Redis/Celery queue workers and other API workers
+               arrive too
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVENT_BACKENDS = ("inprocess", "redis")
+
+_REDIS_RETRY_SECONDS = 5.0
+
+
+class Subscription:
+    """Events for one topic, oldest first. Use as a context manager (or call close())."""
+
+    # Enough for every status transition; past this a stalled reader loses the oldest
+    MAX_BUFFERED = 16
+
+    def __init__(self, bus: "EventBus", topic: str):
+        self.bus = bus
+        self.topic = topic
+        self._events: asyncio.Queue[dict] = asyncio.Queue(self.MAX_BUFFERED)
+
+    async def get(self, timeout: float | None = None) -> dict | None:
+        """The next event, or None if ``timeout`` seconds pass without one."""
+        try:
+            return await asyncio.wait_for(self._events.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus._unsubscribe(self)
+
+    def _put(self, event: dict) -> None:
+        if self._events.full():
+            self._events.get_nowait()
+        self._events.put_nowait(event)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventBus:
+    CHANNEL = "resume-analyzer:events"
+
+    def __init__(self, backend: str = "inprocess"):
+        if backend not in EVENT_BACKENDS:
+            raise ValueError(f"Unknown EVENTS_BACKEND '{backend}'. Expected one of {EVENT_BACKENDS}.")
+        self.backend = backend
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+        self._redis = None
+        self._listener: asyncio.Task | None = None
+
+    # ── lifecycle (API processes; publishers need neither) ───────────────
+    async def start(self) -> None:
+        if self.backend == "redis" and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    # ── pub / sub ────────────────────────────────────────────────────────
+    def subscribe(self, topic: str) -> Subscription:
+        subscription = Subscription(self, topic)
+        self._subscribers[topic].add(subscription)
+        return subscription
+
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    async def publish(self, topic: str, event: dict) -> None:
+        if self.backend == "inprocess":
+            self._deliver(topic, event)
+            return
+        try:
+            await self._client().publish(self.CHANNEL, json.dumps({"topic": topic, "event": event}))
+        except Exception as exc:  # subscribers resync on their own; never fail the publisher
+            logger.warning("Publishing %s event failed: %s", topic, exc)
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subs = self._subscribers.get(subscription.topic)
+        if subs is not None:
+            subs.discard(subscription)
+            if not subs:
+                del self._subscribers[subscription.topic]
+
+    def _deliver(self, topic: str, event: dict) -> None:
+        for subscription in self._subscribers.get(topic, ()):
+            subscription._put(event)
+
+    # ── Redis relay ──────────────────────────────────────────────────────
+    def _client(self):
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    async def _listen(self) -> None:
+        """Relay the shared channel to local subscribers, reconnecting if Redis goes away."""
+        while True:
+            try:
+                pubsub = self._client().pubsub(ignore_subscribe_messages=True)
+                try:
+                    await pubsub.subscribe(self.CHANNEL)
+                    async for message in pubsub.listen():
+                        payload = json.loads(message["data"])
+                        self._deliver(payload["topic"], payload["event"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Event relay lost Redis (%s); retrying in %.0fs", exc, _REDIS_RETRY_SECONDS)
+                await asyncio.sleep(_REDIS_RETRY_SECONDS)
+
+
+event_bus = EventBus(settings.EVENTS_BACKEND)
@@ -0,0 +1,199 @@
+"""
+Task Executor
+Runs CPU-bound work (text extraction, resume analysis, password hashing)
+off the event loop.
+
+Modes (settings.ANALYSIS_EXECUTOR):
+- "process": warm ProcessPoolExecutor; falls back to threads if it can't start
+- "thread":  ThreadPoolExecutor
+- "inline":  runs the callable directly in the calling coroutine (tests)
+
+The number of queued + running tasks is capped. When the cap is reached,
+run() raises ExecutorSaturatedError, which the app turns into a
+503 with a Retry-After header.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import collect_stages, replay_stages
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_MODES = ("process", "thread", "inline")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when an executor's queue is full; surfaced as HTTP 503."""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} executor is saturated.")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def _warm_worker() -> None:
+    """Process-pool initializer: import the analysis stack once per worker."""
+    import app.services.ai_service  # noqa: F401  (builds compiled patterns / automaton)
+    import app.services.text_extraction  # noqa: F401
+
+
+def _noop() -> None:
+    return None
+
+
+class TaskExecutor:
+    """Bounded wrapper around a process/thread pool."""
+
+    def __init__(
+        self,
+        name: str,
+        mode: str = "process",
+        max_workers: int = 2,
+        max_pending: int = 32,
+        retry_after: int = 5,
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode '{mode}'. Expected one of {EXECUTOR_MODES}.")
+        self.name = name
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.retry_after = retry_after
+        self._pool: Executor | None = None
+        self._start_lock = asyncio.Lock()
+        self._pending = 0
+        self.peak_pending = 0
+        self.completed = 0  # tasks that returned a result
+        self.failed = 0  # tasks that raised (including a worker dying under them)
+        self.rejected = 0
+        self.busy_seconds = 0.0  # summed submit-to-result time of completed tasks
+
+    # ── lifecycle ────────────────────────────────────────────────────────
+    def start(self) -> None:
+        """Create the pool and spin every worker up so the first request is not cold."""
+        if self._pool is not None or self.mode == "inline":
+            return
+        if self.mode == "process":
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+                for future in [self._pool.submit(_noop) for _ in range(self.max_workers)]:
+                    future.result()
+                return
+            except (OSError, NotImplementedError, AssertionError, BrokenProcessPool) as exc:
+                # AssertionError: daemonic parents (e.g. Celery prefork children) can't spawn
+                logger.warning("%s: process pool unavailable (%s); falling back to threads", self.name, exc)
+                self._discard_pool()
+                self.mode = "thread"
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+
+    async def _ensure_pool(self) -> None:
+        """(Re)build a missing pool off the event loop; one caller builds it, the rest wait."""
+        if self._pool is not None:
+            return
+        async with self._start_lock:
+            if self._pool is None:
+                # start() spawns and warms every worker, which takes seconds with spawn
+                await asyncio.to_thread(self.start)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _discard_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ── submission ───────────────────────────────────────────────────────
+    @property
+    def pending(self) -> int:
+        """Tasks currently queued or running."""
+        return self._pending
+
+    def check_capacity(self) -> None:
+        """Fail fast before doing work that will need the executor."""
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise ExecutorSaturatedError(self.name, self.retry_after)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result."""
+        self.check_capacity()
+        self._pending += 1
+        self.peak_pending = max(self.peak_pending, self._pending)
+        started = time.perf_counter()
+        try:
+            # Stages timed inside fn come back with the result so they count in this process
+            if self.mode == "inline":
+                result, stages = collect_stages(fn, *args, **kwargs)
+            else:
+                await self._ensure_pool()
+                pool = self._pool
+                loop = asyncio.get_running_loop()
+                try:
+                    result, stages = await loop.run_in_executor(
+                        pool, partial(collect_stages, fn, *args, **kwargs),
+                    )
+                except BrokenProcessPool:
+                    # A worker died (e.g. OOM on a hostile PDF); drop the pool so the next caller
+                    # rebuilds it (unless a concurrent caller already replaced it)
+                    if self._pool is pool:
+                        self._discard_pool()
+                    raise
+            replay_stages(stages)
+        except Exception:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            self.busy_seconds += time.perf_counter() - started
+            return result
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "peak_pending": self.peak_pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_latency_ms": round(self.busy_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+
+# Shared executor for extraction + analysis
+analysis_executor = TaskExecutor(
+    "analysis",
+    mode=settings.ANALYSIS_EXECUTOR,
+    max_workers=settings.ANALYSIS_WORKERS,
+    max_pending=settings.ANALYSIS_MAX_PENDING,
+    retry_after=settings.ANALYSIS_RETRY_AFTER,
+)
+
+# bcrypt releases the GIL, so a small thread pool keeps password hashing off the event loop
+password_executor = TaskExecutor(
+    "password",
+    mode=settings.PASSWORD_EXECUTOR,
+    max_workers=settings.PASSWORD_WORKERS,
+    max_pending=settings.PASSWORD_MAX_PENDING,
+    retry_after=settings.PASSWORD_RETRY_AFTER,
+)
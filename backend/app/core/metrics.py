@@ -0,0 +1,223 @@
+"""
+Metrics
+In-process latency histograms and gauges, rendered in the Prometheus text
+format on /metrics, plus a Server-Timing header on every response.
+
+- MetricsMiddleware (pure ASGI) times each request by route template.
+- ``with stage("pipeline.extract"):`` times a hot-path stage. Stages that
+  run on a TaskExecutor are collected in the worker and replayed by the
+  caller (see collect_stages), so process-pool work is counted too.
+- Gauges read live values (queue depth, cache hit rates, ...) through
+  callbacks when /metrics is scraped.
+
+Recording is a perf_counter pair, a bisect and a few integer adds, so it
+is cheap enough to leave on in production.
+"""
+
+import inspect
+import logging
+import math
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans sub-millisecond analysers through multi-second PDF extractions
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Samples = Iterable[tuple[dict[str, str], float]]
+
+# Stage timings of the current request (Server-Timing) or executor task (replayed by the caller)
+_stage_sink: ContextVar[list[tuple[str, float]] | None] = ContextVar("stage_sink", default=None)
+# False inside executor tasks: the caller observes the replayed timings instead
+_observe_here: ContextVar[bool] = ContextVar("observe_here", default=True)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with one series per label-value tuple."""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple[str, ...], list] = {}  # labels -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, series in sorted(self._series.items()):
+            labels = dict(zip(self.labels, label_values))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), series):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                yield f"{self.name}_bucket{_labels({**labels, 'le': le})} {cumulative}"
+            yield f"{self.name}_sum{_labels(labels)} {series[-2]:.6f}"
+            yield f"{self.name}_count{_labels(labels)} {series[-1]}"
+
+
+class Gauge:
+    """Values read through a (sync or async) callback at scrape time."""
+
+    def __init__(self, name: str, help: str, callback: Callable[[], Samples | Awaitable[Samples]], kind: str):
+        self.name = name
+        self.help = help
+        self.callback = callback
+        self.kind = kind
+
+    async def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        try:
+            samples = self.callback()
+            if inspect.isawaitable(samples):
+                samples = await samples
+            lines.extend(f"{self.name}{_labels(labels)} {value}" for labels, value in samples)
+        except Exception as exc:  # one broken source (e.g. Redis down) must not fail the scrape
+            logger.warning("Metric %s unavailable: %s", self.name, exc)
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.histograms: list[Histogram] = []
+        self.gauges: list[Gauge] = []
+
+    def histogram(self, name: str, help: str, labels: tuple[str, ...] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        histogram = Histogram(name, help, labels, buckets)
+        self.histograms.append(histogram)
+        return histogram
+
+    def gauge(self, name: str, help: str, callback, kind: str = "gauge") -> None:
+        """Register a callback returning ``[(labels, value), ...]``; ``kind`` may be "counter"."""
+        self.gauges.append(Gauge(name, help, callback, kind))
+
+    async def render(self) -> str:
+        lines: list[str] = []
+        for histogram in self.histograms:
+            lines.extend(histogram.render())
+        for gauge in self.gauges:
+            lines.extend(await gauge.render())
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+request_seconds = registry.histogram(
+    "http_request_duration_seconds", "Time to produce a response, by route template.",
+    ("method", "route", "status"),
+)
+stage_seconds = registry.histogram(
+    "stage_duration_seconds", "Time spent in each instrumented hot-path stage.", ("stage",),
+)
+
+
+# ── stages ───────────────────────────────────────────────────────────────
+def record_stage(name: str, seconds: float) -> None:
+    if _observe_here.get():
+        stage_seconds.observe(seconds, name)
+    sink = _stage_sink.get()
+    if sink is not None:
+        sink.append((name, seconds))
+
+
+class stage:
+    """``with stage(name):`` times the enclosed block as stage ``name``."""
+
+    __slots__ = ("name", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        record_stage(self.name, time.perf_counter() - self.started)
+
+
+def collect_stages(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, list[tuple[str, float]]]:
+    """Executor-side wrapper: run ``fn`` and return its result with the stages it recorded."""
+    sink: list[tuple[str, float]] = []
+    sink_token = _stage_sink.set(sink)
+    observe_token = _observe_here.set(False)
+    try:
+        return fn(*args, **kwargs), sink
+    finally:
+        _observe_here.reset(observe_token)
+        _stage_sink.reset(sink_token)
+
+
+def replay_stages(stages: list[tuple[str, float]]) -> None:
+    """Caller-side counterpart of collect_stages."""
+    for name, seconds in stages:
+        record_stage(name, seconds)
+
+
+# ── ASGI middleware ──────────────────────────────────────────────────────
+class MetricsMiddleware:
+    """Times every HTTP request and adds a Server-Timing header built from its stages."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stages: list[tuple[str, float]] = []
+        token = _stage_sink.set(stages)
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing = (b"server-timing", _server_timing(stages, started))
+                message["headers"] = [*message.get("headers", []), timing]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _stage_sink.reset(token)
+            route = scope.get("route")
+            request_seconds.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            )
+
+
+def _server_timing(stages: list[tuple[str, float]], started: float) -> bytes:
+    totals: dict[str, float] = {}
+    for name, seconds in stages:
+        totals[name] = totals.get(name, 0.0) + seconds
+    parts = [f"{name.replace('.', '-')};dur={seconds * 1000:.2f}" for name, seconds in totals.items()]
+    parts.append(f"app;dur={(time.perf_counter() - started) * 1000:.2f}")
+    return ", ".join(parts).encode("latin-1")
@@ -2,6 +2,8 @@
 Security Utilities
 Password hashing with bcrypt and JWT token creation/validation.
 Uses bcrypt directly (passlib is incompatible with bcrypt 4.1+).
+Async callers use the *_async variants, which run bcrypt on the bounded
+password executor instead of the event loop.
 """
 
 from datetime import datetime, timedelta
@@ -9,6 +11,7 @@ from jose import JWTError, jwt
 import bcrypt
 
 from app.core.config import settings
+from app.core.executor import password_executor
 
 
 def hash_password(password: str) -> str:
@@ -21,6 +24,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password on the password executor; raises ExecutorSaturatedError when it is full."""
+    return await password_executor.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password executor; raises ExecutorSaturatedError when it is full."""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token with an expiration claim."""
     to_encode = data.copy()
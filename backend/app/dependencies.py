@@ -5,13 +5,12 @@ Reusable FastAPI dependencies for authentication and database access.
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 from app.services.auth_service import AuthService
+from app.services.user_cache import user_cache
 
 # OAuth2 scheme points to the login endpoint for token acquisition
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -25,8 +24,11 @@ async def get_current_user(
     Dependency to extract and validate the current user from JWT token.
     - Decodes the JWT token using the secret key
     - Extracts the user ID from the 'sub' claim
-    - Fetches the user from the database
+    - Fetches the user from the snapshot cache or the database
     - Raises 401 if token is invalid or user not found
+
+    A cached user is a detached snapshot (no hashed_password); load the row
+    through the session before modifying it.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,21 +36,20 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        # Decode the JWT token
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+    # Decode the JWT token (verified tokens are cached until they expire)
+    user_id = user_cache.user_id_for(token)
+    if user_id is None:
         raise credentials_exception
 
-    # Fetch the user from the database
-    auth_service = AuthService(db)
-    try:
-        user = await auth_service.get_user_by_id(user_id)
-    except HTTPException:
-        raise credentials_exception
+    # Serve the user from the snapshot cache, falling back to the database
+    user = await user_cache.get_user(user_id)
+    if user is None:
+        auth_service = AuthService(db)
+        try:
+            user = await auth_service.get_user_by_id(user_id)
+        except HTTPException:
+            raise credentials_exception
+        await user_cache.set_user(user)
 
     # Ensure the account is active
     if not user.is_active:
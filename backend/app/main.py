@@ -1,12 +1,44 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api import auth, resume, payment, dashboard
 from app.core.config import settings
+from app.core.events import event_bus
+from app.core.executor import ExecutorSaturatedError, analysis_executor, password_executor
+from app.core.metrics import MetricsMiddleware, registry
+from app.services.analysis_cache import analysis_cache
+from app.services.dashboard_service import dashboard_cache
+from app.services.user_cache import user_cache
+from app.workers.queue import get_resume_queue, run_recovery
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the analysis pool before taking traffic
+    analysis_executor.start()
+    password_executor.start()
+    queue = get_resume_queue()
+    await queue.start()
+    await event_bus.start()
+    # Re-enqueue resumes whose job was lost (broker down at upload, dead worker, restart)
+    recovery = asyncio.create_task(run_recovery(queue))
+    yield
+    recovery.cancel()
+    await asyncio.gather(recovery, return_exceptions=True)
+    await event_bus.stop()
+    await queue.stop()
+    password_executor.shutdown()
+    analysis_executor.shutdown()
+
 
 app = FastAPI(
     title="AI Resume Analyzer",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -15,7 +47,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+_SATURATED_DETAIL = {
+    "analysis": "The server is busy processing other resumes. Please retry shortly.",
+    "password": "Too many sign-in requests are being processed. Please retry shortly.",
+}
+
+
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": _SATURATED_DETAIL.get(exc.name, "The server is busy. Please retry shortly.")},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(resume.router, prefix="/api/resume", tags=["resume"])
@@ -25,4 +76,75 @@ app.include_router(dashboard.router, prefix="/api/dashboard", tags=["dashboard"]
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    return {
+        "status": "ok",
+        "executors": {ex.name: ex.stats() for ex in (analysis_executor, password_executor)},
+        "auth_cache": user_cache.stats(),
+    }
+
+
+# ── metrics ──────────────────────────────────────────────────────────────
+_EXECUTORS = (analysis_executor, password_executor)
+_CACHES = {
+    "resume_text": analysis_cache.texts,
+    "analysis": analysis_cache.results,
+    "line_features": analysis_cache.features,
+    "auth_user": user_cache.users,
+    "dashboard": dashboard_cache,
+}
+
+
+async def _queue_depth():
+    depth = getattr(get_resume_queue(), "depth", None)
+    if depth is None:  # Celery: the broker owns the queue
+        return []
+    value = depth()
+    if not isinstance(value, int):
+        value = await value
+    return [({"backend": settings.RESUME_QUEUE_BACKEND}, value)]
+
+
+registry.gauge("resume_queue_depth", "Resumes waiting to be processed.", _queue_depth)
+registry.gauge(
+    "event_subscribers", "Open resume status streams in this process.",
+    lambda: [({}, event_bus.subscriber_count())],
+)
+registry.gauge(
+    "executor_pending", "Tasks queued or running on each executor.",
+    lambda: [({"executor": ex.name}, ex.pending) for ex in _EXECUTORS],
+)
+registry.gauge(
+    "executor_completed_total", "Tasks each executor has finished successfully.",
+    lambda: [({"executor": ex.name}, ex.completed) for ex in _EXECUTORS], kind="counter",
+)
+registry.gauge(
+    "executor_failed_total", "Tasks on each executor that raised or lost their worker.",
+    lambda: [({"executor": ex.name}, ex.failed) for ex in _EXECUTORS], kind="counter",
+)
+registry.gauge(
+    "executor_rejected_total", "Tasks each executor shed with a 503.",
+    lambda: [({"executor": ex.name}, ex.rejected) for ex in _EXECUTORS], kind="counter",
+)
+
+
+def _cache_hits():
+    for name, cache in _CACHES.items():
+        yield {"cache": name, "tier": "local"}, cache.local_hits
+        yield {"cache": name, "tier": "redis"}, cache.redis_hits
+
+
+registry.gauge("cache_hits_total", "Cache hits by cache and tier.", _cache_hits, kind="counter")
+registry.gauge(
+    "cache_misses_total", "Cache misses by cache.",
+    lambda: [({"cache": name}, cache.misses) for name, cache in _CACHES.items()], kind="counter",
+)
+registry.gauge(
+    "cache_hit_ratio", "Lifetime hit ratio by cache.",
+    lambda: [({"cache": name}, cache.stats()["hit_rate"]) for name, cache in _CACHES.items()],
+)
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(await registry.render(), media_type="text/plain; version=0.0.4")
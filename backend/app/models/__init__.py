@@ -2,3 +2,5 @@
 from app.models.user import User
 from app.models.resume import Resume
 from app.models.analysis import Analysis
+from app.models.minhash_band import MinHashBand
+from app.models.user_stats import UserStats
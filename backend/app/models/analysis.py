@@ -1,18 +1,29 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, JSON, LargeBinary, literal_column
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred
 from datetime import datetime
 import uuid
 
 from app.core.database import Base
 
+# JSONB on PostgreSQL (indexable containment queries), plain JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Analysis(Base):
     __tablename__ = "analyses"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=False)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=False, index=True)
     overall_score = Column(Float, nullable=True)
-    sections = Column(JSON, nullable=True)  # Detailed section-by-section scores
-    suggestions = Column(JSON, nullable=True)  # AI-generated improvement suggestions
-    keywords = Column(JSON, nullable=True)  # Extracted keywords
+    sections = deferred(Column(JSONDocument, nullable=True), raiseload=True)  # Detailed section-by-section scores
+    suggestions = Column(JSONDocument, nullable=True)  # AI-generated improvement suggestions
+    keywords = Column(JSONDocument, nullable=True)  # Extracted keywords
+    minhash = deferred(Column(LargeBinary, nullable=True))  # text signature (app.utils.minhash), LSH-indexed
+    features = deferred(Column(LargeBinary, nullable=True))  # float32 measurements (app.services.rescoring)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Sections the analysis found missing. Spelled exactly like the expression
+# index in migration 007 (with literal keys) so PostgreSQL can use it.
+MISSING_SECTIONS = literal_column("(analyses.sections -> 'sections' -> 'missing')", JSONB)
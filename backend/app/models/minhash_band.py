@@ -0,0 +1,40 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, SmallInteger, delete, event, insert
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+from app.models.analysis import Analysis
+from app.utils.minhash import band_buckets
+
+
+class MinHashBand(Base):
+    """
+    LSH index over Analysis.minhash: one row per band of each signature.
+    Analyses sharing a (band, bucket) are near-duplicate candidates. The ORM
+    events below keep it in step with analysis inserts and deletes.
+    """
+
+    __tablename__ = "analysis_minhash_bands"
+
+    analysis_id = Column(UUID(as_uuid=True), ForeignKey("analyses.id", ondelete="CASCADE"), primary_key=True)
+    band = Column(SmallInteger, primary_key=True)
+    bucket = Column(BigInteger, nullable=False)
+
+    __table_args__ = (Index("ix_minhash_bands_bucket", "band", "bucket"),)
+
+
+@event.listens_for(Analysis, "after_insert")
+def _index_signature(mapper, connection, target: Analysis) -> None:
+    # Written here rather than added to the session: with no relationship() the
+    # unit of work would not order these rows after their analysis
+    signature = target.__dict__.get("minhash")  # deferred: never load it from here
+    if signature is None:
+        return
+    connection.execute(insert(MinHashBand), [
+        {"analysis_id": target.id, "band": band, "bucket": bucket}
+        for band, bucket in enumerate(band_buckets(signature))
+    ])
+
+
+@event.listens_for(Analysis, "after_delete")
+def _unindex_signature(mapper, connection, target: Analysis) -> None:
+    connection.execute(delete(MinHashBand).where(MinHashBand.analysis_id == target.id))
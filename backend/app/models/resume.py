@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Text, literal_column
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from datetime import datetime
 import uuid
 
@@ -11,8 +12,32 @@ class Resume(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    parent_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=True, index=True)  # previous version
     filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
-    raw_text = Column(Text, nullable=True)
+    # Loaded only on request (undefer / explicit select); touching it unloaded raises
+    raw_text = deferred(Column(Text, nullable=True), raiseload=True)
+    content_hash = Column(String(64), nullable=True)  # SHA-256 of the uploaded bytes
     status = Column(String, default="uploaded")  # uploaded, processing, analyzed, failed
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Last write; for an uploaded/processing row, when it entered that status (read by the recovery sweep)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # Newest-first listing per user (also serves plain user_id lookups);
+        # the id breaks created_at ties for keyset paging
+        Index("ix_resumes_user_created", "user_id", created_at.desc(), id.desc()),
+        # The few rows the recovery sweep looks for (app.workers.queue.recover_stalled)
+        Index(
+            "ix_resumes_unfinished", "status", "updated_at",
+            postgresql_where=status.in_(("uploaded", "processing")),
+        ),
+    )
+
+
+# Full-text search document: a tsvector column generated from raw_text and
+# GIN-indexed (migration 009), so PostgreSQL keeps it current on every insert
+# and update. It is not mapped, which keeps it out of ORM loads and out of
+# SQLite schemas; use it only in PostgreSQL queries.
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+SEARCH_VECTOR = literal_column("resumes.search_vector", TSVECTOR)
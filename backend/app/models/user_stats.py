@@ -0,0 +1,73 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, event, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from app.core.database import Base
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+
+
+class UserStats(Base):
+    """
+    Per-user dashboard totals. The ORM events below adjust the row inside the
+    same transaction as the resume/analysis write that changes it;
+    `python -m app.workers.reconcile_stats` rebuilds it from the source tables.
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    resume_count = Column(Integer, nullable=False, default=0)
+    scored_count = Column(Integer, nullable=False, default=0)  # analyses with an overall_score
+    score_sum = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+_UPSERT = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+@event.listens_for(Resume, "after_insert")
+def _resume_added(mapper, connection, target: Resume) -> None:
+    now = datetime.utcnow()
+    stmt = _UPSERT[connection.dialect.name](UserStats).values(
+        user_id=target.user_id, resume_count=1, scored_count=0, score_sum=0.0, updated_at=now,
+    )
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=[UserStats.user_id],
+        set_={"resume_count": UserStats.resume_count + 1, "updated_at": now},
+    ))
+
+
+@event.listens_for(Resume, "after_delete")
+def _resume_removed(mapper, connection, target: Resume) -> None:
+    connection.execute(
+        update(UserStats)
+        .where(UserStats.user_id == target.user_id)
+        .values(resume_count=UserStats.resume_count - 1, updated_at=datetime.utcnow())
+    )
+
+
+@event.listens_for(Analysis, "after_insert")
+def _analysis_added(mapper, connection, target: Analysis) -> None:
+    _add_score(connection, target, 1)
+
+
+@event.listens_for(Analysis, "after_delete")
+def _analysis_removed(mapper, connection, target: Analysis) -> None:
+    _add_score(connection, target, -1)
+
+
+def _add_score(connection, target: Analysis, sign: int) -> None:
+    if target.overall_score is None:
+        return
+    owner = select(Resume.user_id).where(Resume.id == target.resume_id).scalar_subquery()
+    connection.execute(
+        update(UserStats)
+        .where(UserStats.user_id == owner)
+        .values(
+            scored_count=UserStats.scored_count + sign,
+            score_sum=UserStats.score_sum + sign * target.overall_score,
+            updated_at=datetime.utcnow(),
+        )
+    )
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+
+class JobMatchRequest(BaseModel):
+    job_description: str = Field(..., min_length=1, max_length=50_000)
+
+
+class JobRankRequest(JobMatchRequest):
+    limit: int = Field(10, ge=1, le=100)
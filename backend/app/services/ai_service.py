@@ -5,8 +5,16 @@ No external API dependency — runs entirely locally.
 """
 
 import re
-from typing import Any
+import string
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator
 
+from app.core.metrics import stage
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+# Bump whenever scoring rules or keyword pools change; it keys cached results.
+RULESET_VERSION = "2"
 
 # ── Strong action verbs ──────────────────────────────────────────────────────
 ACTION_VERBS = {
@@ -39,6 +47,8 @@ SECTION_PATTERNS = {
     "languages": r"(?i)(languages?|fluency|proficiency)",
     "volunteer": r"(?i)(volunteer|community|extracurricular)",
 }
+# Sections whose absence is reported as "missing" (and costs score)
+ESSENTIAL_SECTIONS = frozenset({"summary", "experience", "education", "skills"})
 
 # ── ATS keyword pools ────────────────────────────────────────────────────────
 ATS_KEYWORDS: dict[str, list[str]] = {
@@ -61,183 +71,355 @@ ATS_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+# ── Dimension weights for the overall score ──────────────────────────────────
+SCORING_WEIGHTS: dict[str, float] = {
+    "contact_info": 0.10,
+    "sections": 0.20,
+    "length": 0.10,
+    "action_verbs": 0.15,
+    "quantifiable_achievements": 0.20,
+    "keyword_optimization": 0.15,
+    "formatting": 0.10,
+}
+
+
+# ── Score bands ──────────────────────────────────────────────────────────────
+# (lower bounds, scores): a measurement scores scores[i], where i is the number
+# of bounds it reaches. The analysers below and the vectorised re-scoring of
+# stored feature vectors (app.services.rescoring) both read these tables.
+LENGTH_BANDS = ((200, 300, 801, 1201), (40, 70, 100, 80, 60))  # words
+LENGTH_FEEDBACK = (
+    "Too short — your resume likely lacks sufficient detail.",
+    "A bit short — consider adding more detail to your experience.",
+    "Great length for a one-page resume.",
+    "Slightly long — consider trimming to keep it concise.",
+    "Very long — consider limiting to 1-2 pages.",
+)
+ACTION_VERB_BANDS = ((1, 3, 6, 10), (15, 40, 60, 80, 100))  # distinct action verbs
+QUANTIFIABLE_BANDS = ((1, 3, 5, 8), (15, 50, 70, 85, 100))  # metric matches
+KEYWORD_BANDS = ((0.08, 0.15, 0.25, 0.35), (25, 50, 70, 85, 100))  # share of ATS keywords found
+
+# Formatting: each limit exceeded (and a missing bullet list) is one issue
+BLANK_RUN_LIMIT = 2  # runs of 3+ blank lines
+CAPS_LINE_LIMIT = 5
+LONG_LINE_LIMIT = 10
+FORMATTING_ISSUE_COST = 20
+SECTION_BONUS = 6.67  # per optional section found, up to three
+
+
+def band_index(value: float, bands: tuple[tuple, tuple]) -> int:
+    return bisect_right(bands[0], value)
+
+
+def band_score(value: float, bands: tuple[tuple, tuple]) -> int:
+    return bands[1][band_index(value, bands)]
+
+
+# ── Precompiled patterns ─────────────────────────────────────────────────────
+# Case-insensitive checks are compiled twice: the ``(?i)`` form for the original
+# text and a plain form that runs much faster against the lower-cased text. The
+# two agree on every character except the few whose case mapping crosses into
+# ASCII letters, so ResumeText only takes the fast path when none are present.
+_CASE_UNSAFE_RE = re.compile("[\u0130\u0131\u017f\u212a]")
+
+
+def _caseless(pattern: str) -> tuple[re.Pattern, re.Pattern]:
+    bare = pattern.removeprefix("(?i)")
+    return re.compile(f"(?i){bare}"), re.compile(bare)
+
+
+_SECTION_RES = {name: _caseless(pattern) for name, pattern in SECTION_PATTERNS.items()}
+_LINKEDIN_RE = _caseless(r"linkedin\.com/in/")
+_GITHUB_RE = _caseless(r"github\.com/")
+_IMPACT_RE = _caseless(r"(?:increased|decreased|reduced|improved|grew|saved|generated|raised)\s+(?:by\s+)?\d")
+# Existence-only checks: one leading character / no optional "+" finds a match
+# exactly when the longer original patterns would, with far less backtracking.
+_EMAIL_RE = re.compile(r"[\w.+-]@[\w-]+\.[\w.-]+")
+_PHONE_RE = re.compile(r"\d[\d\s\-().]{7,}\d")
+_BLANK_RUN_RE = re.compile(r"\n{4,}")
+_BULLET_RE = re.compile(r"^[\s]*[•\-\*\u2022]", re.MULTILINE)
+_DOLLAR_RE = re.compile(r"\$[\d,]+\.?\d*")
+_LARGE_NUMBER_RE = re.compile(r"\b\d{1,3}(?:,\d{3})+\b")
+# ``\d\s*%`` yields one match per qualifying "%" — the same count as ``\d+\s*%``.
+QUANTIFIABLE_PATTERNS: list[tuple[re.Pattern, str]] = [
+    (re.compile(r"\d\s*%"), "percentage"),
+    (_DOLLAR_RE, "dollar_amount"),
+    (_LARGE_NUMBER_RE, "large_number"),
+]
+
+# Patterns that can never match across a line break (no \s, bare ".", "^" or "$"),
+# so their counts over a text are the sum of their counts over its lines. The
+# incremental analyser keeps those per-line counts; keep this list in sync.
+LINE_LOCAL_PATTERNS: tuple = (
+    _EMAIL_RE,
+    _LINKEDIN_RE,
+    _GITHUB_RE,
+    _DOLLAR_RE,
+    _LARGE_NUMBER_RE,
+    *(_SECTION_RES[name] for name, pattern in SECTION_PATTERNS.items() if r"\s" not in pattern),
+)
+
+
+# ── Keyword / action-verb automaton ──────────────────────────────────────────
+# Built once at import. ATS keywords keep their substring semantics ("sql" in
+# "postgresql"); action verbs only count as whole [a-z] words.
+ACTION_VERB_TAG = "action_verbs"
+
+
+def _build_term_matcher() -> KeywordMatcher:
+    matcher = KeywordMatcher(word_chars=string.ascii_lowercase)
+    for category, kws in ATS_KEYWORDS.items():
+        matcher.add_pool(kws, category)
+    matcher.add_pool(ACTION_VERBS, ACTION_VERB_TAG, whole_word=True)
+    return matcher.build()
+
+
+TERM_MATCHER = _build_term_matcher()
+
+
+class ResumeText:
+    """
+    Tokenized view of a resume shared by every analyser.
+    Built once per analysis so the dimensions read the same lines, word count
+    and keyword/verb hits instead of re-splitting the text each time.
+    """
+
+    __slots__ = ("text", "lower", "lines", "word_count", "terms", "fold_safe")
+
+    def __init__(self, text: str):
+        self._prepare(text)
+        self.lines = text.split("\n")
+        self.word_count = len(text.split())
+        self.terms = TERM_MATCHER.find_terms(self.lower)
+
+    def _prepare(self, text: str) -> None:
+        """Set the raw/lower-cased text that every full-text scan reads."""
+        self.text = text
+        self.lower = text.lower()
+        self.fold_safe = _CASE_UNSAFE_RE.search(text) is None
+
+    def caseless(self, patterns: tuple[re.Pattern, re.Pattern]) -> tuple[re.Pattern, str]:
+        """Pick the pattern/haystack pair for a case-insensitive scan."""
+        if self.fold_safe:
+            return patterns[1], self.lower
+        return patterns[0], self.text
+
+    def search(self, patterns: re.Pattern | tuple[re.Pattern, re.Pattern]) -> bool:
+        """Whether a pattern (or a caseless pair from _caseless) matches anywhere."""
+        if isinstance(patterns, tuple):
+            pattern, haystack = self.caseless(patterns)
+            return pattern.search(haystack) is not None
+        return patterns.search(self.text) is not None
+
+    def count(self, patterns: re.Pattern | tuple[re.Pattern, re.Pattern]) -> int:
+        """Number of non-overlapping matches of a pattern (or caseless pair)."""
+        if isinstance(patterns, tuple):
+            pattern, haystack = self.caseless(patterns)
+            return len(pattern.findall(haystack))
+        return len(patterns.findall(self.text))
+
+    def line_shape(self) -> tuple[int, int]:
+        """(ALL-CAPS lines, lines over 120 characters) in one pass over the line index."""
+        caps_lines = long_lines = 0
+        for ln in self.lines:
+            if len(ln) > 120:
+                long_lines += 1
+            stripped = ln.strip()
+            if len(stripped) > 20 and stripped.isupper():
+                caps_lines += 1
+        return caps_lines, long_lines
+
+
+def formatting_issues(blank_runs: int, caps_lines: int, long_lines: int, bullets: bool) -> list[str]:
+    issues: list[str] = []
+    if blank_runs > BLANK_RUN_LIMIT:
+        issues.append("Excessive blank lines detected — tighten spacing.")
+    if caps_lines > CAPS_LINE_LIMIT:
+        issues.append("Too many ALL-CAPS lines — use title case for headings.")
+    if long_lines > LONG_LINE_LIMIT:
+        issues.append("Many lines exceed 120 characters — improve text wrapping.")
+    if not bullets:
+        issues.append("No bullet points found — use bullets to improve readability.")
+    return issues
+
+
 class AIService:
     """Rule-based resume analysis engine."""
 
-    # ── public entry point ───────────────────────────────────────────────
+    # ── public entry points ──────────────────────────────────────────────
     async def analyze_resume(self, resume_text: str) -> dict[str, Any]:
         """Run a full analysis on resume text and return structured results."""
-        text = resume_text.strip()
+        return self.analyze(resume_text)
+
+    def analyze(self, resume_text: str) -> dict[str, Any]:
+        """Synchronous core of analyze_resume (safe to run in a worker pool)."""
+        return self._analyze_batch([resume_text])[0]
+
+    def analyze_doc(self, doc: ResumeText) -> dict[str, Any]:
+        """Score an already-built (non-empty) ResumeText, e.g. an incremental revision view."""
+        dimensions = self._dimensions(doc)
+        return self._build_result(dimensions, self._weighted_scores([dimensions])[0])
+
+    def analyze_many(
+        self, texts: Iterable[str], stream: bool = False, batch_size: int = 64,
+    ) -> list[dict[str, Any]] | Iterator[dict[str, Any]]:
+        """
+        Analyse many resumes, returning results in input order.
+        Texts are scored in batches of ``batch_size``; with ``stream=True`` a
+        generator is returned that yields each batch's results as it completes.
+        """
+        results = self._iter_batches(texts, max(1, batch_size))
+        return results if stream else list(results)
+
+    def _iter_batches(self, texts: Iterable[str], batch_size: int) -> Iterator[dict[str, Any]]:
+        batch: list[str] = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) == batch_size:
+                yield from self._analyze_batch(batch)
+                batch = []
+        if batch:
+            yield from self._analyze_batch(batch)
+
+    def _analyze_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        details = [self._analyze_dimensions(text.strip()) for text in texts]
+        scored = [d for d in details if d is not None]
+        overall = iter(self._weighted_scores(scored))
+        return [
+            self._build_result(d, next(overall)) if d is not None else self._empty_result()
+            for d in details
+        ]
+
+    def _analyze_dimensions(self, text: str) -> dict[str, dict] | None:
+        """Run every analyser over one shared ResumeText; None for empty input."""
         if not text:
-            return self._empty_result()
-
-        contact = self._analyze_contact(text)
-        sections = self._analyze_sections(text)
-        length = self._analyze_length(text)
-        action_verbs = self._analyze_action_verbs(text)
-        quantifiable = self._analyze_quantifiable(text)
-        keywords = self._extract_keywords(text)
-        formatting = self._analyze_formatting(text)
-
-        # weighted scoring
-        weights = {
-            "contact_info": 0.10,
-            "sections": 0.20,
-            "length": 0.10,
-            "action_verbs": 0.15,
-            "quantifiable_achievements": 0.20,
-            "keyword_optimization": 0.15,
-            "formatting": 0.10,
-        }
+            return None
+        return self._dimensions(ResumeText(text))
+
+    def _dimensions(self, doc: ResumeText) -> dict[str, dict]:
+        dimensions = {}
+        for key, stage_name, analyser in (
+            ("contact_info", "analyze.contact_info", self._analyze_contact),
+            ("sections", "analyze.sections", self._analyze_sections),
+            ("length", "analyze.length", self._analyze_length),
+            ("action_verbs", "analyze.action_verbs", self._analyze_action_verbs),
+            ("quantifiable_achievements", "analyze.quantifiable_achievements", self._analyze_quantifiable),
+            ("keyword_optimization", "analyze.keyword_optimization", self._extract_keywords),
+            ("formatting", "analyze.formatting", self._analyze_formatting),
+        ):
+            with stage(stage_name):
+                dimensions[key] = analyser(doc)
+        return dimensions
+
+    @staticmethod
+    def _weighted_scores(batch: list[dict[str, dict]]) -> list[float]:
+        """Weighted overall score for a batch, accumulated one dimension column at a time."""
+        totals = [0] * len(batch)
+        for key, weight in SCORING_WEIGHTS.items():
+            column = [dims[key]["score"] for dims in batch]
+            totals = [total + score * weight for total, score in zip(totals, column)]
+        return [round(total, 1) for total in totals]
+
+    def _build_result(self, dimensions: dict[str, dict], overall_score: float) -> dict[str, Any]:
         section_details = {
-            "contact_info": {**contact, "weight": weights["contact_info"]},
-            "sections": {**sections, "weight": weights["sections"]},
-            "length": {**length, "weight": weights["length"]},
-            "action_verbs": {**action_verbs, "weight": weights["action_verbs"]},
-            "quantifiable_achievements": {**quantifiable, "weight": weights["quantifiable_achievements"]},
-            "keyword_optimization": {**keywords, "weight": weights["keyword_optimization"]},
-            "formatting": {**formatting, "weight": weights["formatting"]},
+            key: {**dimensions[key], "weight": weight} for key, weight in SCORING_WEIGHTS.items()
         }
-        overall_score = round(
-            sum(section_details[k]["score"] * weights[k] for k in weights), 1
-        )
         suggestions = self._generate_suggestions(section_details)
-
         return {
             "overall_score": overall_score,
             "sections": section_details,
             "suggestions": suggestions,
-            "keywords": keywords.get("found", []),
+            "keywords": dimensions["keyword_optimization"].get("found", []),
         }
 
     # ── individual analysers ─────────────────────────────────────────────
-    def _analyze_contact(self, text: str) -> dict:
+    def _analyze_contact(self, doc: ResumeText) -> dict:
         found: list[str] = []
         missing: list[str] = []
-        if re.search(r"[\w.+-]+@[\w-]+\.[\w.-]+", text):
+        if doc.search(_EMAIL_RE):
             found.append("email")
         else:
             missing.append("email")
-        if re.search(r"(\+?\d[\d\s\-().]{7,}\d)", text):
+        if doc.search(_PHONE_RE):
             found.append("phone")
         else:
             missing.append("phone")
-        if re.search(r"(?i)linkedin\.com/in/", text):
+        if doc.search(_LINKEDIN_RE):
             found.append("linkedin")
         else:
             missing.append("linkedin")
-        if re.search(r"(?i)github\.com/", text):
+        if doc.search(_GITHUB_RE):
             found.append("github")
         score = min(100, round((len(found) / 3) * 100))
         return {"score": score, "found": found, "missing": missing, "label": "Contact Information"}
 
-    def _analyze_sections(self, text: str) -> dict:
+    def _analyze_sections(self, doc: ResumeText) -> dict:
         found: list[str] = []
         missing: list[str] = []
-        essential = {"summary", "experience", "education", "skills"}
-        for name, pattern in SECTION_PATTERNS.items():
-            if re.search(pattern, text):
+        essential = ESSENTIAL_SECTIONS
+        for name, patterns in _SECTION_RES.items():
+            if doc.search(patterns):
                 found.append(name)
             elif name in essential:
                 missing.append(name)
         essential_found = len(essential & set(found))
-        bonus = min(len(found) - essential_found, 3) * 6.67 if len(found) > essential_found else 0
+        bonus = min(len(found) - essential_found, 3) * SECTION_BONUS if len(found) > essential_found else 0
         score = min(100, round((essential_found / len(essential)) * 80 + bonus))
         return {"score": score, "found": found, "missing": missing, "label": "Resume Sections"}
 
-    def _analyze_length(self, text: str) -> dict:
-        words = len(text.split())
-        if 300 <= words <= 800:
-            score, feedback = 100, "Great length for a one-page resume."
-        elif 200 <= words < 300:
-            score, feedback = 70, "A bit short — consider adding more detail to your experience."
-        elif 800 < words <= 1200:
-            score, feedback = 80, "Slightly long — consider trimming to keep it concise."
-        elif words < 200:
-            score, feedback = 40, "Too short — your resume likely lacks sufficient detail."
-        else:
-            score, feedback = 60, "Very long — consider limiting to 1-2 pages."
+    def _analyze_length(self, doc: ResumeText) -> dict:
+        words = doc.word_count
+        band = band_index(words, LENGTH_BANDS)
+        score, feedback = LENGTH_BANDS[1][band], LENGTH_FEEDBACK[band]
         return {"score": score, "word_count": words, "feedback": feedback, "label": "Resume Length"}
 
-    def _analyze_action_verbs(self, text: str) -> dict:
-        words_lower = set(re.findall(r"[a-z]+", text.lower()))
-        found = sorted(words_lower & ACTION_VERBS)
+    def _analyze_action_verbs(self, doc: ResumeText) -> dict:
+        found = sorted(doc.terms.get(ACTION_VERB_TAG, ()))
         count = len(found)
-        if count >= 10:
-            score = 100
-        elif count >= 6:
-            score = 80
-        elif count >= 3:
-            score = 60
-        elif count >= 1:
-            score = 40
-        else:
-            score = 15
+        score = band_score(count, ACTION_VERB_BANDS)
         return {"score": score, "found": found, "count": count, "label": "Action Verbs"}
 
-    def _analyze_quantifiable(self, text: str) -> dict:
-        patterns = [
-            (r"\d+\s*%", "percentage"),
-            (r"\$[\d,]+\.?\d*", "dollar_amount"),
-            (r"\b\d{1,3}(?:,\d{3})+\b", "large_number"),
-            (r"(?i)(?:increased|decreased|reduced|improved|grew|saved|generated|raised)\s+(?:by\s+)?\d", "impact_metric"),
-        ]
-        found_types: set[str] = set()
-        total = 0
-        for pat, ptype in patterns:
-            matches = re.findall(pat, text)
-            if matches:
-                found_types.add(ptype)
-                total += len(matches)
-        if total >= 8:
-            score = 100
-        elif total >= 5:
-            score = 85
-        elif total >= 3:
-            score = 70
-        elif total >= 1:
-            score = 50
-        else:
-            score = 15
-        return {"score": score, "match_count": total, "types_found": sorted(found_types), "label": "Quantifiable Achievements"}
+    def _analyze_quantifiable(self, doc: ResumeText) -> dict:
+        counts = {ptype: doc.count(pat) for pat, ptype in QUANTIFIABLE_PATTERNS}
+        counts["impact_metric"] = doc.count(_IMPACT_RE)
+        total = sum(counts.values())
+        score = band_score(total, QUANTIFIABLE_BANDS)
+        return {
+            "score": score,
+            "match_count": total,
+            "counts": counts,
+            "types_found": sorted(ptype for ptype, matches in counts.items() if matches),
+            "label": "Quantifiable Achievements",
+        }
 
-    def _extract_keywords(self, text: str) -> dict:
-        text_lower = text.lower()
+    def _extract_keywords(self, doc: ResumeText) -> dict:
         found: list[str] = []
         by_category: dict[str, list[str]] = {}
         for category, kws in ATS_KEYWORDS.items():
-            cat_found = [kw for kw in kws if kw.lower() in text_lower]
+            hits = doc.terms.get(category, ())
+            cat_found = [kw for kw in kws if kw.lower() in hits]
             if cat_found:
                 by_category[category] = cat_found
             found.extend(cat_found)
         total_possible = sum(len(v) for v in ATS_KEYWORDS.values())
         ratio = len(found) / total_possible if total_possible else 0
-        if ratio >= 0.35:
-            score = 100
-        elif ratio >= 0.25:
-            score = 85
-        elif ratio >= 0.15:
-            score = 70
-        elif ratio >= 0.08:
-            score = 50
-        else:
-            score = 25
+        score = band_score(ratio, KEYWORD_BANDS)
         return {"score": score, "found": sorted(set(found)), "by_category": by_category, "label": "Keyword Optimization"}
 
-    def _analyze_formatting(self, text: str) -> dict:
-        issues: list[str] = []
-        lines = text.split("\n")
-        if len(re.findall(r"\n{4,}", text)) > 2:
-            issues.append("Excessive blank lines detected — tighten spacing.")
-        caps_lines = sum(1 for ln in lines if ln.strip() and ln.strip().isupper() and len(ln.strip()) > 20)
-        if caps_lines > 5:
-            issues.append("Too many ALL-CAPS lines — use title case for headings.")
-        if sum(1 for ln in lines if len(ln) > 120) > 10:
-            issues.append("Many lines exceed 120 characters — improve text wrapping.")
-        if not re.search(r"^[\s]*[•\-\*\u2022]", text, re.MULTILINE):
-            issues.append("No bullet points found — use bullets to improve readability.")
-        score = max(20, 100 - len(issues) * 20)
-        return {"score": score, "issues": issues, "label": "Formatting Quality"}
+    def _analyze_formatting(self, doc: ResumeText) -> dict:
+        blank_runs = doc.count(_BLANK_RUN_RE)
+        caps_lines, long_lines = doc.line_shape()
+        bullets = doc.search(_BULLET_RE)
+        issues = formatting_issues(blank_runs, caps_lines, long_lines, bullets)
+        return {
+            "score": max(20, 100 - len(issues) * FORMATTING_ISSUE_COST),
+            "issues": issues,
+            "blank_runs": blank_runs,
+            "caps_lines": caps_lines,
+            "long_lines": long_lines,
+            "bullets": bullets,
+            "label": "Formatting Quality",
+        }
 
     # ── suggestions generator ────────────────────────────────────────────
     def _generate_suggestions(self, sections: dict) -> list[str]:
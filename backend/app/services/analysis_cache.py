@@ -0,0 +1,81 @@
+"""
+Analysis Cache
+Content-addressed cache that lets repeat uploads skip parsing and scoring.
+
+- raw file bytes (SHA-256)            -> extracted text
+- ruleset version + normalized text   -> analysis result
+- ruleset version + normalized text   -> line features (incremental re-analysis)
+"""
+
+import hashlib
+from typing import Any
+
+from app.core.cache import TieredCache
+from app.core.config import settings
+from app.services.ai_service import RULESET_VERSION
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def normalize_text(text: str) -> str:
+    """The text exactly as the analyser sees it, so equal keys give equal results."""
+    return text.strip()
+
+
+class AnalysisCache:
+    """Content-addressed tiers: file bytes → text, text → analysis / line features."""
+
+    def __init__(self):
+        self.texts = TieredCache(
+            "resume-text",
+            max_bytes=settings.ANALYSIS_CACHE_MAX_BYTES // 2,
+            ttl=settings.ANALYSIS_CACHE_TTL,
+            use_redis=settings.CACHE_REDIS_ENABLED,
+        )
+        self.results = TieredCache(
+            f"resume-analysis:{RULESET_VERSION}",
+            max_bytes=settings.ANALYSIS_CACHE_MAX_BYTES // 4,
+            ttl=settings.ANALYSIS_CACHE_TTL,
+            use_redis=settings.CACHE_REDIS_ENABLED,
+        )
+        self.features = TieredCache(
+            f"resume-features:{RULESET_VERSION}",
+            max_bytes=settings.ANALYSIS_CACHE_MAX_BYTES // 4,
+            ttl=settings.ANALYSIS_CACHE_TTL,
+            use_redis=settings.CACHE_REDIS_ENABLED,
+        )
+
+    @staticmethod
+    def analysis_key(text: str) -> str:
+        normalized = normalize_text(text)
+        return hashlib.sha256(f"{RULESET_VERSION}\0{normalized}".encode("utf-8")).hexdigest()
+
+    async def get_text(self, file_hash: str) -> str | None:
+        return await self.texts.get(file_hash)
+
+    async def set_text(self, file_hash: str, text: str) -> None:
+        await self.texts.set(file_hash, text)
+
+    async def get_analysis(self, text: str) -> dict[str, Any] | None:
+        return await self.results.get(self.analysis_key(text))
+
+    async def set_analysis(self, text: str, result: dict[str, Any]) -> None:
+        await self.results.set(self.analysis_key(text), result)
+
+    async def get_features(self, text: str) -> dict[str, Any] | None:
+        return await self.features.get(self.analysis_key(text))
+
+    async def set_features(self, text: str, features: dict[str, Any]) -> None:
+        await self.features.set(self.analysis_key(text), features)
+
+    def stats(self) -> dict:
+        return {
+            "text": self.texts.stats(),
+            "analysis": self.results.stats(),
+            "features": self.features.stats(),
+        }
+
+
+analysis_cache = AnalysisCache()
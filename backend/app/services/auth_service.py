@@ -4,11 +4,13 @@ Handles user registration, login, and token management.
 All database operations are async using SQLAlchemy.
 """
 
+import uuid
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password_async, verify_password_async, create_access_token
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 
@@ -41,7 +43,7 @@ class AuthService:
         # Create the new user with a hashed password
         new_user = User(
             email=user_data.email,
-            hashed_password=hash_password(user_data.password),
+            hashed_password=await hash_password_async(user_data.password),
             full_name=user_data.full_name,
         )
         self.db.add(new_user)
@@ -64,7 +66,7 @@ class AuthService:
         user = result.scalar_one_or_none()
 
         # Verify user exists and password matches
-        if not user or not verify_password(user_data.password, user.hashed_password):
+        if not user or not await verify_password_async(user_data.password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password.",
@@ -84,10 +86,11 @@ class AuthService:
 
     async def get_user_by_id(self, user_id: str) -> User:
         """Fetch a user by their UUID. Used for token validation."""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        try:
+            uid = uuid.UUID(str(user_id))
+        except ValueError:
+            uid = None
+        user = await self.db.get(User, uid) if uid else None
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
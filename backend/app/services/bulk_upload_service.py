@@ -0,0 +1,300 @@
+"""
+Bulk Upload Service
+Accepts many resumes in one request — ZIP archives and/or several files in
+one multipart body — and streams one NDJSON result line per file.
+
+Parts are spooled to disk by the multipart parser and ZIP members are
+decompressed straight to the upload directory one chunk at a time, so no
+archive is ever held in memory. Up to BULK_CONCURRENCY files are extracted
+and scored at once on the analysis executor. Finished files are inserted
+in group commits of up to BULK_INSERT_BATCH rows, and each file's line is
+sent once its row is committed.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import AsyncIterator, Iterable, Iterator
+
+from fastapi import HTTPException, UploadFile, status
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.executor import ExecutorSaturatedError
+from app.core.metrics import stage
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+import app.services.resume_service as resume_service
+from app.services.resume_service import ALLOWED_EXTENSIONS, ResumeService, UnreadableResumeError
+from app.utils.uploads import UploadTooLargeError, save_upload
+from app.workers.queue import enqueue_resume
+
+logger = logging.getLogger(__name__)
+
+# Jobs whose client went away, kept referenced while they wind down
+_jobs: set[asyncio.Task] = set()
+
+
+@dataclass
+class BulkItem:
+    index: int
+    filename: str
+    resume: Resume | None = None
+    result: dict | None = None
+    analysis: Analysis | None = None
+    file_path: Path | None = None
+    status: str = "analyzed"  # analyzed, queued, failed, skipped
+    detail: str | None = None
+
+
+class _MemberReader:
+    """AsyncReadable over an open ZIP member, so save_upload can stream it."""
+
+    def __init__(self, fh):
+        self.fh = fh
+
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self.fh.read, size)
+
+
+class BulkUploadService:
+    def __init__(self, user_id: uuid.UUID, files: list[UploadFile]):
+        self.user_id = user_id
+        self.files = files
+        self.archives: list[zipfile.ZipFile] = []
+        self.saved_bytes = 0
+        self.done: asyncio.Queue[BulkItem | None] = asyncio.Queue()  # None: stop consuming
+        self.counts = dict.fromkeys(("analyzed", "queued", "failed", "skipped"), 0)
+
+    def validate(self) -> None:
+        """Reject oversized or malformed requests up front, before the 200 and the stream start."""
+        if not self.files:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No files were uploaded.")
+        total_bytes = sum(file.size or 0 for file in self.files)
+        if total_bytes > settings.BULK_MAX_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Bulk upload is too large. Maximum size is {settings.BULK_MAX_BYTES // (1024 * 1024)} MB.",
+            )
+        entries = 0
+        for file in self.files:
+            if Path(file.filename or "").suffix.lower() != ".zip":
+                entries += 1
+                continue
+            try:
+                archive = zipfile.ZipFile(file.file)
+            except zipfile.BadZipFile:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"'{file.filename}' is not a valid ZIP archive.",
+                )
+            self.archives.append(archive)
+            entries += sum(1 for info in archive.infolist() if _is_resume_entry(info))
+        if entries > settings.BULK_MAX_FILES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many files ({entries}). A bulk upload may contain at most {settings.BULK_MAX_FILES}.",
+            )
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """
+        NDJSON: one line per file as its row commits, then a summary line.
+        The work runs in its own task. If the client goes away (the response
+        is cancelled or this iterator closed), the task is told to stop after
+        the batch it is writing — never cancelled mid-commit — and cleans up.
+        """
+        lines: asyncio.Queue[bytes | None] = asyncio.Queue()
+        job = asyncio.create_task(self._run(lines))
+        try:
+            while (line := await lines.get()) is not None:
+                yield line
+            await job  # surfaces a failed job (the stream just ends early)
+        finally:
+            if not job.done():
+                self.done.put_nowait(None)
+                _jobs.add(job)
+                job.add_done_callback(_jobs.discard)
+
+    async def _run(self, lines: asyncio.Queue) -> None:
+        slots = asyncio.Semaphore(max(1, settings.BULK_CONCURRENCY))
+        tasks: set[asyncio.Task] = set()
+        batch: list[BulkItem] = []
+        unsaved: dict[int, BulkItem] = {}  # files on disk whose row isn't committed yet
+
+        async def process(item: BulkItem) -> None:
+            try:
+                await self._score(item)
+            finally:
+                slots.release()
+                self.done.put_nowait(item)
+
+        async def produce() -> None:
+            try:
+                for index, (filename, source) in enumerate(self._entries()):
+                    await slots.acquire()
+                    item = unsaved[index] = BulkItem(index=index, filename=filename)
+                    await self._save(item, source)
+                    if item.resume is None:  # skipped / rejected; nothing to score
+                        slots.release()
+                        self.done.put_nowait(item)
+                        continue
+                    task = asyncio.create_task(process(item))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                await asyncio.gather(*tasks)
+            finally:
+                self.done.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        sent = 0
+        try:
+            async with async_session() as db:
+                scorer = ResumeService(db)
+                item = await self.done.get()
+                while item is not None:
+                    # Group commit: everything that finished while the last batch was being written
+                    batch.append(item)
+                    while len(batch) < settings.BULK_INSERT_BATCH and not self.done.empty():
+                        if (item := self.done.get_nowait()) is None:
+                            break
+                        batch.append(item)
+                    await self._commit(scorer, batch)
+                    sent += len(batch)
+                    for committed in batch:
+                        unsaved.pop(committed.index)
+                        lines.put_nowait(self._line(committed))
+                    batch.clear()
+                    if item is not None:
+                        item = await self.done.get()
+            if producer.done():
+                producer.result()  # re-raise a failed producer
+                lines.put_nowait((json.dumps({"done": True, "total": sent, **self.counts}) + "\n").encode())
+        finally:
+            producer.cancel()
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(producer, *tasks, return_exceptions=True)
+            self._discard(unsaved.values())
+            for archive in self.archives:
+                archive.close()
+            for file in self.files:
+                await file.close()
+            lines.put_nowait(None)
+
+    # ── per-file steps ───────────────────────────────────────────────────
+    def _entries(self) -> Iterator[tuple[str, object]]:
+        """(filename, AsyncReadable) for every file part and every resume inside each ZIP."""
+        archives = iter(self.archives)
+        for file in self.files:
+            if Path(file.filename or "").suffix.lower() != ".zip":
+                yield file.filename or "resume", file
+                continue
+            archive = next(archives)
+            for info in archive.infolist():
+                if _is_resume_entry(info):
+                    yield PurePosixPath(info.filename).name, (archive, info)
+
+    async def _save(self, item: BulkItem, source) -> None:
+        """Write one file to the upload directory and attach its (uncommitted) Resume to ``item``."""
+        ext = Path(item.filename).suffix.lower()
+        if ext not in ALLOWED_EXTENSIONS:
+            item.status, item.detail = "skipped", f"Unsupported file type '{ext}'."
+            return
+
+        file_id = uuid.uuid4()
+        file_path = item.file_path = resume_service.UPLOAD_DIR / f"{file_id}{ext}"
+        member = None
+        try:
+            if isinstance(source, tuple):
+                archive, info = source
+                member = archive.open(info)
+                source = _MemberReader(member)
+            # Members are capped individually and, decompressed, in total (ZIP bombs)
+            budget = min(settings.MAX_UPLOAD_BYTES, settings.BULK_MAX_BYTES - self.saved_bytes)
+            with stage("upload.save"):
+                file_hash, size = await save_upload(source, file_path, budget, settings.UPLOAD_CHUNK_BYTES)
+        except UploadTooLargeError:
+            item.status = "skipped"
+            if budget < settings.MAX_UPLOAD_BYTES:
+                item.detail = f"Bulk upload exceeds {settings.BULK_MAX_BYTES // (1024 * 1024)} MB once unpacked."
+            else:
+                item.detail = f"File is too large. Maximum size is {settings.MAX_UPLOAD_BYTES // (1024 * 1024)} MB."
+            return
+        except (RuntimeError, zipfile.BadZipFile, OSError) as exc:  # encrypted / corrupt member
+            item.status, item.detail = "skipped", f"Could not read the file from the archive: {exc}"
+            return
+        finally:
+            if member is not None:
+                member.close()
+
+        self.saved_bytes += size
+        item.resume = Resume(
+            id=file_id,
+            user_id=self.user_id,
+            filename=item.filename,
+            file_path=str(file_path),
+            content_hash=file_hash,
+            status="uploaded",
+        )
+
+    async def _score(self, item: BulkItem) -> None:
+        try:
+            # A session per file: files are scored concurrently, and scoring reads
+            # (the near-duplicate lookup) must not share the committing session
+            async with async_session() as db:
+                item.result = await ResumeService(db).extract_and_score(item.resume)
+        except ExecutorSaturatedError:
+            # The pool is busy with other work; hand this file to the regular background pipeline
+            item.status = "queued"
+        except UnreadableResumeError as exc:
+            item.status, item.detail = "failed", str(exc)
+        except Exception:
+            logger.exception("Bulk upload: analysis of %s failed", item.filename)
+            item.status, item.detail = "failed", "Analysis failed."
+
+    async def _commit(self, scorer: ResumeService, items: list[BulkItem]) -> None:
+        stored = [item for item in items if item.resume is not None]
+        with stage("pipeline.persist"):
+            for item in stored:
+                item.resume.status = "failed" if item.status == "failed" else "uploaded"
+            scorer.db.add_all([item.resume for item in stored])
+            await scorer.db.flush()  # resumes before analyses (see upload_and_analyze)
+            for item in stored:
+                if item.result is not None:
+                    item.analysis = scorer.store_analysis(item.resume, item.result)
+            await scorer.db.commit()
+        for item in items:
+            self.counts[item.status] += 1
+            if item.status == "queued":
+                await enqueue_resume(str(item.resume.id))
+
+    def _line(self, item: BulkItem) -> bytes:
+        analysis = item.analysis
+        line = {
+            "index": item.index,
+            "filename": item.filename,
+            "status": item.status,
+            "resume_id": str(item.resume.id) if item.resume is not None else None,
+            "analysis_id": str(analysis.id) if analysis is not None else None,
+            "overall_score": analysis.overall_score if analysis is not None else None,
+        }
+        if item.detail:
+            line["detail"] = item.detail
+        return (json.dumps(line) + "\n").encode()
+
+    @staticmethod
+    def _discard(items: Iterable[BulkItem]) -> None:
+        """Remove files saved for rows that never got committed (client went away mid-stream)."""
+        for item in items:
+            if item.file_path is not None:
+                item.file_path.unlink(missing_ok=True)
+
+
+def _is_resume_entry(info: zipfile.ZipInfo) -> bool:
+    """Files only; skips directories and macOS/hidden metadata such as __MACOSX/ and ._ forks."""
+    path = PurePosixPath(info.filename)
+    return not info.is_dir() and "__MACOSX" not in path.parts and not path.name.startswith(".")
@@ -0,0 +1,124 @@
+"""
+Dashboard Service
+Builds the dashboard summary (stats + most recent resumes) in one query
+and caches it per user. Stats are read from the user_stats rollup.
+
+Cached summaries are dropped when one of the user's resumes is inserted,
+updated (status changes, analysis stored) or deleted through the ORM —
+see the session events at the bottom. Core UPDATEs bypass those events, so
+code changing resumes that way calls mark_dashboards_changed(). Copies held
+by other processes age out within DASHBOARD_CACHE_TTL.
+"""
+
+import asyncio
+import uuid
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TieredCache
+from app.core.config import settings
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+from app.models.user_stats import UserStats
+
+RECENT_RESUMES = 5
+_PENDING_KEY = "dashboard_cache_invalidate"
+
+dashboard_cache = TieredCache(
+    "dashboard",
+    max_bytes=settings.DASHBOARD_CACHE_MAX_BYTES,
+    ttl=settings.DASHBOARD_CACHE_TTL,
+    use_redis=settings.CACHE_REDIS_ENABLED,
+)
+
+
+class DashboardService:
+    """Per-user dashboard summary backed by a single query."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.cache = dashboard_cache
+
+    async def summary(self, user_id: uuid.UUID) -> dict:
+        """``{"stats": {...}, "recent_resumes": [...]}`` for the user, cached."""
+        key = str(user_id)
+        summary = await self.cache.get(key)
+        if summary is None:
+            summary = await self._load(user_id)
+            await self.cache.set(key, summary)
+        return summary
+
+    async def _load(self, user_id: uuid.UUID) -> dict:
+        # Totals come from the user_stats rollup row (a primary-key lookup) as
+        # scalar subqueries, so they share a round trip with the newest resumes.
+        stats = select(UserStats).where(UserStats.user_id == user_id).subquery()
+        result = await self.db.execute(
+            select(
+                Resume.id,
+                Resume.parent_id,
+                Resume.filename,
+                Resume.status,
+                Resume.created_at,
+                Analysis.overall_score,
+                select(stats.c.resume_count).scalar_subquery().label("total"),
+                select(stats.c.scored_count).scalar_subquery().label("scored"),
+                select(stats.c.score_sum).scalar_subquery().label("score_sum"),
+            )
+            .outerjoin(Analysis, Resume.id == Analysis.resume_id)
+            .where(Resume.user_id == user_id)
+            .order_by(Resume.created_at.desc(), Resume.id.desc())
+            .limit(RECENT_RESUMES)
+        )
+        rows = result.all()
+        total = rows[0].total if rows else 0
+        average = rows[0].score_sum / rows[0].scored if rows and rows[0].scored else None
+        return {
+            "stats": {
+                "resumes_analyzed": total or 0,
+                "average_score": round(float(average), 1) if average else None,
+            },
+            "recent_resumes": [
+                {
+                    "id": str(row.id),
+                    "parent_id": str(row.parent_id) if row.parent_id else None,
+                    "filename": row.filename,
+                    "status": row.status,
+                    "overall_score": row.overall_score,
+                    "created_at": row.created_at.isoformat(),
+                }
+                for row in rows
+            ],
+        }
+
+
+# ── invalidation on ORM writes ───────────────────────────────────────────
+def mark_dashboards_changed(session: Session | AsyncSession, user_ids) -> None:
+    """Drop these users' cached dashboards when ``session`` commits (for Core UPDATEs the ORM events miss)."""
+    session.info.setdefault(_PENDING_KEY, set()).update(str(user_id) for user_id in user_ids)
+
+
+@event.listens_for(Resume, "after_insert")
+@event.listens_for(Resume, "after_update")
+@event.listens_for(Resume, "after_delete")
+def _mark_dashboard_changed(mapper, connection, target: Resume) -> None:
+    session = object_session(target)
+    if session is not None:
+        mark_dashboards_changed(session, (target.user_id,))
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_changed_dashboards(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        dashboard_cache.local.delete(user_id)
+        if dashboard_cache.use_redis:
+            try:
+                asyncio.get_running_loop().create_task(dashboard_cache.delete(user_id))
+            except RuntimeError:  # committed outside the event loop; Redis copy expires within the TTL
+                pass
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_dashboards(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,120 @@
+"""
+Duplicate Service
+Finds near-duplicate resumes through the MinHash LSH index.
+
+Candidates are the analyses sharing at least one band bucket with the query
+signature (an index lookup on analysis_minhash_bands), most shared bands
+first; only those are then compared on their full signatures. Used by
+GET /api/resume/{id}/duplicates and by the analysis pipeline, which
+re-scores a new upload incrementally from its closest near-duplicate; both
+look only at the user's own resumes.
+"""
+
+import uuid
+from typing import NamedTuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.analysis import Analysis
+from app.models.minhash_band import MinHashBand
+from app.models.resume import Resume
+from app.utils import minhash
+
+
+class NearDuplicate(NamedTuple):
+    similarity: float
+    resume_id: uuid.UUID
+    analysis_id: uuid.UUID
+    filename: str
+    overall_score: float | None
+
+
+class DuplicateService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def similar(
+        self,
+        signature: bytes,
+        user_id: uuid.UUID | None = None,
+        exclude: uuid.UUID | None = None,
+        threshold: float | None = None,
+        limit: int = 10,
+    ) -> list[NearDuplicate]:
+        """Resumes whose text is at least ``threshold`` similar, most similar first."""
+        threshold = settings.NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+        # OR of (band, bucket) pairs rather than a row-value IN: SQLite only uses the index for the former
+        candidates = (
+            select(MinHashBand.analysis_id, func.count().label("shared"))
+            .where(or_(*(
+                and_(MinHashBand.band == band, MinHashBand.bucket == bucket)
+                for band, bucket in enumerate(minhash.band_buckets(signature))
+            )))
+            .group_by(MinHashBand.analysis_id)
+            .subquery()
+        )
+        # Similar signatures share more bands, so when popular buckets overflow the
+        # candidate cap, the ones dropped are the least likely matches
+        query = (
+            select(Analysis.id, Analysis.resume_id, Analysis.minhash, Analysis.overall_score, Resume.filename)
+            .join(candidates, candidates.c.analysis_id == Analysis.id)
+            .join(Resume, Resume.id == Analysis.resume_id)
+            .order_by(candidates.c.shared.desc(), Analysis.id)
+            .limit(settings.NEAR_DUPLICATE_MAX_CANDIDATES)
+        )
+        if user_id is not None:
+            query = query.where(Resume.user_id == user_id)
+        if exclude is not None:
+            query = query.where(Analysis.resume_id != exclude)
+
+        matches = []
+        for row in await self.db.execute(query):
+            score = minhash.similarity(signature, row.minhash)
+            if score >= threshold:
+                matches.append(NearDuplicate(score, row.resume_id, row.id, row.filename, row.overall_score))
+        matches.sort(key=lambda match: -match.similarity)
+        return matches[:limit]
+
+    async def closest_text(self, signature: bytes, user_id: uuid.UUID) -> str | None:
+        """Text of the user's most similar analysed resume, to diff a new upload against."""
+        matches = await self.similar(signature, user_id, limit=1)
+        if not matches:
+            return None
+        return await self.db.scalar(select(Resume.raw_text).where(Resume.id == matches[0].resume_id))
+
+    async def near_duplicates(
+        self, resume_id: uuid.UUID, user_id: uuid.UUID, threshold: float | None = None, limit: int = 10,
+    ) -> dict:
+        """The user's other resumes that are near-duplicates of this one."""
+        row = (await self.db.execute(
+            select(Resume.user_id, Analysis.id.label("analysis_id"), Analysis.minhash)
+            .outerjoin(Analysis, Analysis.resume_id == Resume.id)
+            .where(Resume.id == resume_id)
+        )).first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Resume not found.")
+        if row.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied.")
+        if row.analysis_id is None:
+            raise HTTPException(status_code=409, detail="Resume has not been analysed yet.")
+        signature = row.minhash
+        if signature is None:  # analysed before signatures existed and not backfilled yet
+            raw_text = await self.db.scalar(select(Resume.raw_text).where(Resume.id == resume_id))
+            signature = minhash.signature(raw_text or "")
+        matches = await self.similar(signature, user_id, resume_id, threshold, limit) if signature else []
+        return {
+            "resume_id": str(resume_id),
+            "duplicates": [
+                {
+                    "resume_id": str(match.resume_id),
+                    "analysis_id": str(match.analysis_id),
+                    "filename": match.filename,
+                    "similarity": round(match.similarity, 3),
+                    "overall_score": match.overall_score,
+                }
+                for match in matches
+            ],
+        }
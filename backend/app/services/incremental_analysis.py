@@ -0,0 +1,168 @@
+"""
+Incremental Analysis
+Re-scores a revised resume from its predecessor instead of from scratch.
+
+Everything the analysers read that adds up over lines (word count, keyword /
+action-verb hits, ALL-CAPS and long lines, and the LINE_LOCAL_PATTERNS
+counts) is kept as per-line features, LRU-cached by line content and summed
+into a DocFeatures aggregate. A revision takes its predecessor's aggregate,
+subtracts the removed lines and adds the new ones. Patterns that can span a
+line break are still scanned over the full text, so the result is identical
+to AIService.analyze().
+"""
+
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Iterable, NamedTuple
+
+from app.core.config import settings
+from app.services.ai_service import LINE_LOCAL_PATTERNS, AIService, ResumeText
+
+_LINE_PATTERN_INDEX = {patterns: index for index, patterns in enumerate(LINE_LOCAL_PATTERNS)}
+
+
+class LineFeatures(NamedTuple):
+    words: int
+    caps: int
+    long: int
+    counts: tuple[int, ...]  # aligned with LINE_LOCAL_PATTERNS
+    terms: tuple[tuple[str, str], ...]  # (tag, term) pairs present on the line
+
+
+@lru_cache(maxsize=settings.ANALYSIS_LINE_CACHE_SIZE)
+def line_features(line: str) -> LineFeatures:
+    doc = ResumeText(line)
+    caps, long = doc.line_shape()
+    return LineFeatures(
+        words=doc.word_count,
+        caps=caps,
+        long=long,
+        counts=tuple(doc.count(patterns) for patterns in LINE_LOCAL_PATTERNS),
+        terms=tuple((tag, term) for tag, terms in doc.terms.items() for term in terms),
+    )
+
+
+class DocFeatures:
+    """Line features summed over a document; ``terms`` counts the lines containing each term."""
+
+    __slots__ = ("words", "caps", "long", "counts", "terms")
+
+    def __init__(self):
+        self.words = 0
+        self.caps = 0
+        self.long = 0
+        self.counts = [0] * len(LINE_LOCAL_PATTERNS)
+        self.terms: Counter[tuple[str, str]] = Counter()
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "DocFeatures":
+        features = cls()
+        features.update(lines)
+        return features
+
+    def update(self, lines: Iterable[str], sign: int = 1) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) the features of ``lines``."""
+        counts = self.counts
+        terms = self.terms
+        for line in lines:
+            feat = line_features(line)
+            self.words += sign * feat.words
+            self.caps += sign * feat.caps
+            self.long += sign * feat.long
+            for index, n in enumerate(feat.counts):
+                if n:
+                    counts[index] += sign * n
+            for term in feat.terms:
+                terms[term] += sign
+
+    def term_sets(self) -> dict[str, set[str]]:
+        """The distinct terms present, grouped by tag (same shape as KeywordMatcher.find_terms)."""
+        found: dict[str, set[str]] = {}
+        for (tag, term), n in self.terms.items():
+            if n > 0:
+                found.setdefault(tag, set()).add(term)
+        return found
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "words": self.words,
+            "caps": self.caps,
+            "long": self.long,
+            "counts": self.counts,
+            "terms": [[tag, term, n] for (tag, term), n in self.terms.items() if n > 0],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "DocFeatures":
+        features = cls()
+        features.words = data["words"]
+        features.caps = data["caps"]
+        features.long = data["long"]
+        features.counts = list(data["counts"])
+        features.terms = Counter({(tag, term): n for tag, term, n in data["terms"]})
+        return features
+
+
+def diff_lines(old: list[str], new: list[str]) -> tuple[list[str], list[str]]:
+    """(removed, added) lines: the common prefix/suffix is trimmed, the rest compared as multisets."""
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    old_mid = Counter(old[start:len(old) - end])
+    new_mid = Counter(new[start:len(new) - end])
+    return list((old_mid - new_mid).elements()), list((new_mid - old_mid).elements())
+
+
+class RevisionText(ResumeText):
+    """ResumeText that answers line-local questions from a DocFeatures aggregate."""
+
+    __slots__ = ("features",)
+
+    def __init__(self, text: str, lines: list[str], features: DocFeatures):
+        self._prepare(text)
+        self.lines = lines
+        self.features = features
+        self.word_count = features.words
+        self.terms = features.term_sets()
+
+    def search(self, patterns) -> bool:
+        index = _LINE_PATTERN_INDEX.get(patterns)
+        if index is None:
+            return super().search(patterns)
+        return self.features.counts[index] > 0
+
+    def count(self, patterns) -> int:
+        index = _LINE_PATTERN_INDEX.get(patterns)
+        if index is None:
+            return super().count(patterns)
+        return self.features.counts[index]
+
+    def line_shape(self) -> tuple[int, int]:
+        return self.features.caps, self.features.long
+
+
+def analyze_revision(
+    text: str, previous_text: str | None = None, previous_features: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """
+    Analyse ``text``, starting from the previous version's features when given.
+    Returns (result, features): ``result`` equals AIService().analyze(text) and
+    ``features`` (JSON-safe) makes the next revision incremental.
+    """
+    service = AIService()
+    text = text.strip()
+    if not text:
+        return service.analyze(text), None
+    lines = text.split("\n")
+    if previous_text is not None and previous_features is not None:
+        features = DocFeatures.from_json(previous_features)
+        removed, added = diff_lines(previous_text.strip().split("\n"), lines)
+        features.update(removed, sign=-1)
+        features.update(added)
+    else:
+        features = DocFeatures.from_lines(lines)
+    return service.analyze_doc(RevisionText(text, lines, features)), features.to_json()
@@ -0,0 +1,133 @@
+"""
+Match Service
+Scores resumes against a job description with BM25 over their extracted text.
+
+Each user's resumes live in their own InvertedIndex partition, so IDF reflects
+that user's documents and ranking never touches anyone else's postings.
+Partitions are built lazily and kept in step with the database: a request
+adds only the resumes indexed since the last one (and drops deleted ones),
+so the index grows incrementally rather than being rebuilt. The user's
+user_stats.updated_at, bumped in the same transaction as every resume or
+analysis insert and delete, tells whether anything changed at all, so an
+unchanged partition costs one primary-key read instead of listing its ids.
+"""
+
+import math
+import uuid
+from collections import Counter, OrderedDict
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.resume import Resume
+from app.models.user_stats import UserStats
+from app.utils.inverted_index import InvertedIndex, tokenize
+
+
+class ResumeMatchIndex:
+    """LRU of per-user InvertedIndex partitions keyed by user id."""
+
+    def __init__(self, max_users: int):
+        self.max_users = max(1, max_users)
+        self._partitions: OrderedDict[uuid.UUID, InvertedIndex] = OrderedDict()
+        self._synced_at: dict[uuid.UUID, object] = {}  # user_stats.updated_at at the last full sync
+
+    async def partition(self, db: AsyncSession, user_id: uuid.UUID) -> InvertedIndex:
+        """The user's partition, synced with their resumes that have extracted text."""
+        index = self._partitions.get(user_id)
+        if index is None:
+            index = self._partitions[user_id] = InvertedIndex()
+            while len(self._partitions) > self.max_users:
+                evicted, _ = self._partitions.popitem(last=False)
+                self._synced_at.pop(evicted, None)
+        self._partitions.move_to_end(user_id)
+
+        # Read before listing: a change committed in between moves it again and forces the next sync
+        version = await db.scalar(select(UserStats.updated_at).where(UserStats.user_id == user_id))
+        if version is not None and self._synced_at.get(user_id) == version:
+            return index
+        result = await db.execute(
+            select(Resume.id).where(Resume.user_id == user_id, Resume.raw_text.is_not(None))
+        )
+        current = set(result.scalars().all())
+        for doc_id in [doc_id for doc_id in index.doc_lengths if doc_id not in current]:
+            index.remove(doc_id)
+        missing = [doc_id for doc_id in current if doc_id not in index]
+        if missing:
+            result = await db.execute(select(Resume.id, Resume.raw_text).where(Resume.id.in_(missing)))
+            for doc_id, raw_text in result.all():
+                index.add(doc_id, tokenize(raw_text))
+        self._synced_at[user_id] = version
+        return index
+
+    def clear(self) -> None:
+        self._partitions.clear()
+        self._synced_at.clear()
+
+
+match_index = ResumeMatchIndex(settings.MATCH_INDEX_MAX_USERS)
+
+
+class MatchService:
+    """Job-description matching for one user's resumes."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.index = match_index
+
+    async def match_resume(self, resume_id: uuid.UUID, user_id: uuid.UUID, job_description: str) -> dict:
+        """Score one resume against a job description and list the JD terms it covers / lacks."""
+        result = await self.db.execute(
+            select(Resume.user_id, Resume.filename, Resume.raw_text.is_not(None).label("has_text"))
+            .where(Resume.id == resume_id)
+        )
+        resume = result.first()
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found.")
+        if resume.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied.")
+        if not resume.has_text:
+            raise HTTPException(status_code=409, detail="Resume has not been analysed yet.")
+
+        query = self._query_terms(job_description)
+        index = await self.index.partition(self.db, user_id)
+        weights = {term: index.idf(term) * (1 + math.log(qtf)) for term, qtf in query.items()}
+        matched = [term for term in weights if index.postings.get(term, {}).get(resume_id)]
+        total = sum(weights.values())
+        by_weight = lambda terms: sorted(terms, key=lambda t: (-weights[t], t))  # noqa: E731
+        return {
+            "resume_id": str(resume_id),
+            "filename": resume.filename,
+            "score": round(100 * sum(weights[t] for t in matched) / total, 1),
+            "bm25": round(index.score(resume_id, query), 3),
+            "matched_keywords": by_weight(matched)[:25],
+            "missing_keywords": by_weight(set(weights) - set(matched))[:25],
+        }
+
+    async def rank_resumes(self, user_id: uuid.UUID, job_description: str, limit: int = 10) -> dict:
+        """The user's resumes that best fit a job description, best first."""
+        query = self._query_terms(job_description)
+        index = await self.index.partition(self.db, user_id)
+        top = index.top_k(query, limit)
+        names = {}
+        if top:
+            result = await self.db.execute(
+                select(Resume.id, Resume.filename).where(Resume.id.in_([doc_id for doc_id, _ in top]))
+            )
+            names = dict(result.all())
+        return {
+            "results": [
+                {"resume_id": str(doc_id), "filename": names.get(doc_id), "bm25": round(score, 3)}
+                for doc_id, score in top
+            ],
+            "indexed": len(index),
+        }
+
+    @staticmethod
+    def _query_terms(job_description: str) -> Counter:
+        terms = Counter(tokenize(job_description))
+        if not terms:
+            raise HTTPException(status_code=422, detail="Job description has no searchable terms.")
+        return terms
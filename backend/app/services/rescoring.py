@@ -0,0 +1,138 @@
+"""
+Re-scoring
+Recomputes analysis scores from stored feature vectors instead of the text.
+
+Every analysis keeps the raw measurements its scores were derived from —
+word count, action verbs, metric matches per type, ATS keyword hits per
+category, contact and section flags, formatting counts — packed as FEATURES
+float32 values in analyses.features. After a change to SCORING_WEIGHTS or a
+score band in app.services.ai_service, score_matrix() re-scores a whole
+history as NumPy array operations over the (rows × features) matrix, with
+the same tables and rounding as the analysers, so a re-score equals a fresh
+analysis of the same text.
+"""
+
+import struct
+
+import numpy as np
+
+from app.services.ai_service import (
+    ACTION_VERB_BANDS, ATS_KEYWORDS, BLANK_RUN_LIMIT, CAPS_LINE_LIMIT, ESSENTIAL_SECTIONS,
+    FORMATTING_ISSUE_COST, KEYWORD_BANDS, LENGTH_BANDS, LONG_LINE_LIMIT, QUANTIFIABLE_BANDS,
+    QUANTIFIABLE_PATTERNS, SCORING_WEIGHTS, SECTION_BONUS, SECTION_PATTERNS,
+)
+
+QUANTIFIER_TYPES = (*(ptype for _, ptype in QUANTIFIABLE_PATTERNS), "impact_metric")
+CONTACT_FIELDS = ("email", "phone", "linkedin", "github")
+
+FEATURES = (
+    "word_count",
+    "action_verbs",
+    *(f"metric_{ptype}" for ptype in QUANTIFIER_TYPES),
+    *(f"keywords_{category}" for category in ATS_KEYWORDS),
+    *(f"contact_{field}" for field in CONTACT_FIELDS),
+    *(f"section_{name}" for name in SECTION_PATTERNS),
+    "blank_runs",
+    "caps_lines",
+    "long_lines",
+    "bullets",
+)
+_COLUMN = {name: index for index, name in enumerate(FEATURES)}
+_VECTOR = struct.Struct(f"<{len(FEATURES)}f")
+FEATURE_BYTES = _VECTOR.size
+
+
+# ── packing ──────────────────────────────────────────────────────────────
+def pack_features(sections: dict) -> bytes | None:
+    """
+    The feature vector of an analysis, from its per-dimension details (the
+    stored ``sections``). None for an empty analysis, or one made before the
+    details carried every count.
+    """
+    try:
+        quantifiable = sections["quantifiable_achievements"]["counts"]
+        keywords = sections["keyword_optimization"]["by_category"]
+        contact = set(sections["contact_info"]["found"])
+        found_sections = set(sections["sections"]["found"])
+        formatting = sections["formatting"]
+        values = (
+            sections["length"]["word_count"],
+            sections["action_verbs"]["count"],
+            *(quantifiable[ptype] for ptype in QUANTIFIER_TYPES),
+            *(len(keywords.get(category, ())) for category in ATS_KEYWORDS),
+            *(field in contact for field in CONTACT_FIELDS),
+            *(name in found_sections for name in SECTION_PATTERNS),
+            formatting["blank_runs"],
+            formatting["caps_lines"],
+            formatting["long_lines"],
+            formatting["bullets"],
+        )
+    except KeyError:
+        return None
+    return _VECTOR.pack(*values)
+
+
+def feature_matrix(vectors: list[bytes]) -> np.ndarray:
+    """Stack packed vectors into a (rows × FEATURES) float32 matrix without copying each one."""
+    return np.frombuffer(b"".join(vectors), dtype="<f4").reshape(len(vectors), len(FEATURES))
+
+
+# ── scoring ──────────────────────────────────────────────────────────────
+def score_matrix(matrix: np.ndarray) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Overall scores (rounded to 0.1 like the analysers) and per-dimension
+    scores for every row of a feature matrix. Works in float64, in the same
+    operation order as AIService, so results match it exactly.
+    """
+    m = matrix.astype(np.float64)
+
+    def col(name: str) -> np.ndarray:
+        return m[:, _COLUMN[name]]
+
+    def columns(names) -> np.ndarray:
+        return m[:, [_COLUMN[name] for name in names]].sum(axis=1)
+
+    contact = np.minimum(100, np.rint(columns(f"contact_{f}" for f in CONTACT_FIELDS) / 3 * 100))
+
+    found = columns(f"section_{name}" for name in SECTION_PATTERNS)
+    essential = columns(f"section_{name}" for name in ESSENTIAL_SECTIONS)
+    bonus = np.where(found > essential, np.minimum(found - essential, 3) * SECTION_BONUS, 0)
+    sections = np.minimum(100, np.rint(essential / len(ESSENTIAL_SECTIONS) * 80 + bonus))
+
+    keyword_ratio = columns(f"keywords_{c}" for c in ATS_KEYWORDS) / sum(len(kws) for kws in ATS_KEYWORDS.values())
+    issues = (
+        (col("blank_runs") > BLANK_RUN_LIMIT).astype(np.int64)
+        + (col("caps_lines") > CAPS_LINE_LIMIT)
+        + (col("long_lines") > LONG_LINE_LIMIT)
+        + (col("bullets") == 0)
+    )
+    scores = {
+        "contact_info": contact,
+        "sections": sections,
+        "length": _banded(col("word_count"), LENGTH_BANDS),
+        "action_verbs": _banded(col("action_verbs"), ACTION_VERB_BANDS),
+        "quantifiable_achievements": _banded(columns(f"metric_{t}" for t in QUANTIFIER_TYPES), QUANTIFIABLE_BANDS),
+        "keyword_optimization": _banded(keyword_ratio, KEYWORD_BANDS),
+        "formatting": np.maximum(20, 100 - issues * FORMATTING_ISSUE_COST).astype(np.float64),
+    }
+    total = np.zeros(len(m))
+    for key, weight in SCORING_WEIGHTS.items():
+        total = total + scores[key] * weight
+    return _round1(total), scores
+
+
+def _banded(values: np.ndarray, bands: tuple[tuple, tuple]) -> np.ndarray:
+    """band_score() over an array."""
+    bounds, table = bands
+    return np.asarray(table, dtype=np.float64)[np.searchsorted(bounds, values, side="right")]
+
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    """round(x, 1) elementwise, exactly as Python rounds."""
+    rounded = np.round(values, 1)
+    # np.round scales by 10 first, which can tip a value within an ulp of a
+    # half the other way; redo those few with Python's correctly rounded round()
+    tenths = values * 10
+    close = np.flatnonzero(np.abs(tenths - np.floor(tenths) - 0.5) < 1e-6)
+    rounded[close] = [round(value, 1) for value in values[close].tolist()]
+    return rounded
@@ -0,0 +1,67 @@
+"""
+Resume Status Events
+Publishes resume status transitions (uploaded → processing → analyzed /
+failed) on the event bus and serves them as Server-Sent Events, so clients
+wait for an analysis instead of polling GET /api/resume/{id}.
+"""
+
+import json
+import uuid
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.events import Subscription, event_bus
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+from app.services.resume_service import ResumeService
+
+TERMINAL_STATUSES = ("analyzed", "failed")
+
+
+def topic(resume_id: uuid.UUID | str) -> str:
+    return f"resume:{uuid.UUID(str(resume_id))}"  # canonical form, whatever the URL used
+
+
+async def publish_status(resume: Resume, analysis: Analysis | None = None) -> None:
+    """Announce a committed status change (same shape as ResumeService.get_status)."""
+    await event_bus.publish(topic(resume.id), {
+        "resume_id": str(resume.id),
+        "status": resume.status,
+        "analysis_id": str(analysis.id) if analysis else None,
+        "overall_score": analysis.overall_score if analysis else None,
+    })
+
+
+async def status_stream(
+    subscription: Subscription, current: dict, user_id: uuid.UUID,
+) -> AsyncIterator[bytes]:
+    """
+    SSE body: the status read when the client connected, then each change
+    until the resume is analysed or fails. ``subscription`` must predate the
+    ``current`` read so nothing published in between is lost. Every
+    SSE_HEARTBEAT_SECONDS without an event the status is re-read, in case an
+    event was dropped (e.g. Redis was briefly unreachable).
+    """
+    with subscription:
+        yield f"retry: {settings.SSE_HEARTBEAT_SECONDS * 1000}\n".encode() + _sse(current)
+        last = current
+        while last["status"] not in TERMINAL_STATUSES:
+            event = await subscription.get(timeout=settings.SSE_HEARTBEAT_SECONDS)
+            if event is None:
+                try:
+                    async with async_session() as db:
+                        event = await ResumeService(db).get_status(current["resume_id"], user_id)
+                except HTTPException:  # deleted while we were waiting
+                    return
+            if event == last:
+                yield b": keep-alive\n\n"
+                continue
+            yield _sse(event)
+            last = event
+
+
+def _sse(event: dict) -> bytes:
+    return f"event: status\ndata: {json.dumps(event)}\n\n".encode()
@@ -5,15 +5,30 @@ Handles file upload, text extraction, CRUD operations, and analysis orchestratio
 
 import os
 import uuid
+from datetime import datetime
 from pathlib import Path
 
 from fastapi import UploadFile, HTTPException, status
-from sqlalchemy import select, func
+from sqlalchemy import exists, func, select, tuple_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.executor import analysis_executor
+from app.core.metrics import stage
 from app.models.resume import Resume
-from app.models.analysis import Analysis
-from app.services.ai_service import AIService
+from app.models.analysis import MISSING_SECTIONS, Analysis
+from app.services.ai_service import ESSENTIAL_SECTIONS, AIService
+from app.services.analysis_cache import analysis_cache
+from app.services.duplicate_service import DuplicateService
+from app.services.incremental_analysis import analyze_revision
+from app.services.rescoring import pack_features
+from app.services.text_extraction import extract_text_with
+from app.utils import minhash
+from app.utils.fields import InvalidFieldsError, parse_fields
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.uploads import UploadTooLargeError, save_upload
+from app.workers.queue import enqueue_resume
 
 # Upload directory (auto-created)
 UPLOAD_DIR = Path(__file__).resolve().parents[2] / "uploads"
@@ -21,6 +36,27 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt"}
 
+# Fields the resume endpoints can return (and ?fields= can select), in response order
+RESUME_FIELDS = ("id", "parent_id", "filename", "status", "created_at", "raw_text")
+ANALYSIS_FIELDS = ("id", "overall_score", "sections", "suggestions", "keywords", "created_at")
+
+
+def _json_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _signed(analyze, text: str, *args):
+    """``analyze(text, *args)`` plus the text's MinHash signature, in one executor task."""
+    return analyze(text, *args), minhash.signature(text)
+
+
+class UnreadableResumeError(ValueError):
+    """The upload parsed, but produced too little text to analyse."""
+
 
 class ResumeService:
     """Handles resume upload, parsing, analysis, and retrieval."""
@@ -28,10 +64,20 @@ class ResumeService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.ai = AIService()
+        self.executor = analysis_executor
+        self.cache = analysis_cache
 
-    # ── Upload + analyse ─────────────────────────────────────────────────
-    async def upload_and_analyze(self, file: UploadFile, user_id: uuid.UUID) -> dict:
-        """Upload a resume file, extract text, run analysis, and store results."""
+    # ── Upload ───────────────────────────────────────────────────────────
+    async def upload_and_analyze(
+        self, file: UploadFile, user_id: uuid.UUID, previous_id: uuid.UUID | None = None,
+    ) -> dict:
+        """
+        Store an uploaded resume and hand it to the background pipeline.
+        Returns immediately with status "uploaded"; if these exact bytes were
+        analysed before, the cached result is stored and returned instead.
+        The upload is linked to ``previous_id`` — or else to the user's latest
+        resume with the same filename — as a new version of it.
+        """
         filename = file.filename or "resume"
         ext = Path(filename).suffix.lower()
         if ext not in ALLOWED_EXTENSIONS:
@@ -40,144 +86,347 @@ class ResumeService:
                 detail=f"Unsupported file type '{ext}'. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
             )
 
-        # Save file to disk
+        parent_id = await self._resolve_parent(user_id, filename, previous_id)
+
+        # Starlette knows the spooled size up front; reject before copying anything
+        if file.size is not None and file.size > settings.MAX_UPLOAD_BYTES:
+            raise self._too_large()
+
+        # Stream file to disk, hashing as we go
         file_id = uuid.uuid4()
         safe_name = f"{file_id}{ext}"
         file_path = UPLOAD_DIR / safe_name
-        content = await file.read()
-        file_path.write_bytes(content)
-
-        # Extract text
-        raw_text = self._extract_text(file_path, ext)
-        if not raw_text or len(raw_text.strip()) < 20:
-            file_path.unlink(missing_ok=True)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Could not extract meaningful text from the file. Please upload a valid resume.",
-            )
+        try:
+            with stage("upload.save"):
+                file_hash, _ = await save_upload(
+                    file, file_path, settings.MAX_UPLOAD_BYTES, settings.UPLOAD_CHUNK_BYTES,
+                )
+        except UploadTooLargeError:
+            raise self._too_large()
 
-        # Create resume record
         resume = Resume(
             id=file_id,
             user_id=user_id,
+            parent_id=parent_id,
             filename=filename,
             file_path=str(file_path),
-            raw_text=raw_text,
-            status="processing",
+            content_hash=file_hash,
+            raw_text=await self.cache.get_text(file_hash),
+            status="uploaded",
         )
         self.db.add(resume)
-        await self.db.flush()
 
-        # Run AI analysis
-        result = await self.ai.analyze_resume(raw_text)
+        # Repeat upload: both cache tiers hit, so there is nothing left to queue
+        result = await self.cache.get_analysis(resume.raw_text) if resume.raw_text else None
+        if result is not None:
+            # No relationship() links the models, so the unit of work won't order
+            # the resume row before its analysis by itself: flush it first
+            await self.db.flush()
+            analysis = self.store_analysis(resume, result)
+            await self.db.flush()
+            return self._upload_response(resume, analysis)
 
-        # Store analysis
+        # Commit before enqueueing so the worker can see the row
+        await self.db.commit()
+        await enqueue_resume(str(resume.id))
+        return self._upload_response(resume, None)
+
+    # ── Pipeline (extraction → analysis → persist) ───────────────────────
+    async def run_pipeline(self, resume: Resume) -> Analysis:
+        """Extract, analyse, and store results for an already-saved upload."""
+        result = await self.extract_and_score(resume)
+        with stage("pipeline.persist"):
+            analysis = self.store_analysis(resume, result)
+            await self.db.flush()
+        return analysis
+
+    async def extract_and_score(self, resume: Resume) -> dict:
+        """
+        Extraction and analysis half of the pipeline, reusing cached text and
+        results. Sets ``resume.raw_text``; raises UnreadableResumeError.
+        """
+        raw_text = resume.raw_text
+        if raw_text is None and resume.content_hash:
+            raw_text = await self.cache.get_text(resume.content_hash)
+        if raw_text is None:
+            with stage("pipeline.extract"):
+                raw_text = await extract_text_with(self.executor, resume.file_path)
+            if raw_text and len(raw_text.strip()) >= 20 and resume.content_hash:
+                await self.cache.set_text(resume.content_hash, raw_text)
+        if not raw_text or len(raw_text.strip()) < 20:
+            raise UnreadableResumeError("Could not extract meaningful text from the file.")
+        resume.raw_text = raw_text
+
+        result = await self.cache.get_analysis(raw_text)
+        if result is None:
+            with stage("pipeline.analyze"):
+                result = await self._analyze(resume, raw_text)
+            await self.cache.set_analysis(raw_text, result)
+        return result
+
+    async def _analyze(self, resume: Resume, raw_text: str) -> dict:
+        """
+        Score the text, incrementally when this is a revision of an earlier
+        upload (or, with NEAR_DUPLICATE_REUSE, a near-duplicate among the user's
+        analysed resumes). The line features are cached so the next revision can start
+        from them; one-off uploads keep the cheaper full analysis. The result
+        carries the text's MinHash signature (hex) for store_analysis to index.
+        """
+        base_text = await self.db.scalar(
+            select(Resume.raw_text).where(Resume.id == resume.parent_id)
+        ) if resume.parent_id else None
+        signature = None
+        if not base_text and settings.NEAR_DUPLICATE_REUSE:
+            with stage("pipeline.minhash"):
+                signature = await self.executor.run(minhash.signature, raw_text)
+            if signature:
+                with stage("pipeline.near_duplicate"):
+                    base_text = await DuplicateService(self.db).closest_text(signature, resume.user_id)
+
+        if base_text:
+            previous_features = await self.cache.get_features(base_text)
+            previous_text = base_text if previous_features is not None else None
+            call = (analyze_revision, raw_text, previous_text, previous_features)
+        else:
+            call = (self.ai.analyze, raw_text)
+        if signature is None:
+            output, signature = await self.executor.run(_signed, *call)
+        else:
+            output = await self.executor.run(*call)
+
+        if base_text:
+            result, features = output
+            if features is not None:
+                await self.cache.set_features(raw_text, features)
+        else:
+            result = output
+        result["minhash"] = signature.hex() if signature else None
+        return result
+
+    async def _resolve_parent(
+        self, user_id: uuid.UUID, filename: str, previous_id: uuid.UUID | None,
+    ) -> uuid.UUID | None:
+        """The resume a new upload revises: ``previous_id`` if given, else the latest with this filename."""
+        if previous_id:
+            parent = await self.db.get(Resume, previous_id)
+            if not parent:
+                raise HTTPException(status_code=404, detail="Previous resume not found.")
+            if parent.user_id != user_id:
+                raise HTTPException(status_code=403, detail="Access denied.")
+            return parent.id
+        result = await self.db.execute(
+            select(Resume.id)
+            .where(Resume.user_id == user_id, Resume.filename == filename)
+            .order_by(Resume.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    def store_analysis(self, resume: Resume, result: dict) -> Analysis:
         analysis = Analysis(
             resume_id=resume.id,
             overall_score=result["overall_score"],
             sections=result["sections"],
             suggestions=result["suggestions"],
             keywords=result["keywords"],
+            minhash=bytes.fromhex(result["minhash"]) if result.get("minhash") else None,
+            features=pack_features(result["sections"]),
         )
         self.db.add(analysis)
         resume.status = "analyzed"
-        await self.db.flush()
+        return analysis
+
+    @staticmethod
+    def _too_large() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File is too large. Maximum size is {settings.MAX_UPLOAD_BYTES // (1024 * 1024)} MB.",
+        )
 
+    @staticmethod
+    def _upload_response(resume: Resume, analysis: Analysis | None) -> dict:
         return {
             "resume_id": str(resume.id),
-            "analysis_id": str(analysis.id),
-            "filename": filename,
-            "overall_score": result["overall_score"],
-            "status": "analyzed",
+            "parent_id": str(resume.parent_id) if resume.parent_id else None,
+            "analysis_id": str(analysis.id) if analysis else None,
+            "filename": resume.filename,
+            "overall_score": analysis.overall_score if analysis else None,
+            "status": resume.status,
         }
 
-    # ── Text extraction ──────────────────────────────────────────────────
-    def _extract_text(self, file_path: Path, ext: str) -> str:
+    # ── Read operations ──────────────────────────────────────────────────
+    async def get_resume_with_analysis(
+        self, resume_id: str, user_id: uuid.UUID, fields: str | None = None,
+    ) -> dict:
+        """
+        Get a resume and its analysis by ID, ensuring ownership.
+        ``fields`` (e.g. ``resume.filename,analysis.overall_score``) limits what is
+        loaded and returned; by default everything is, raw_text included.
+        """
+        selection = self._select_fields(fields, {"resume": RESUME_FIELDS, "analysis": ANALYSIS_FIELDS})
+        return await self._fetch(resume_id, user_id, selection)
+
+    async def get_status(self, resume_id: uuid.UUID | str, user_id: uuid.UUID) -> dict:
+        """Just the status and score of a resume (the status event stream's re-read)."""
+        data = await self._fetch(
+            resume_id, user_id, {"resume": ("id", "status"), "analysis": ("id", "overall_score")},
+        )
+        analysis = data["analysis"] or {}
+        return {
+            "resume_id": data["resume"]["id"],
+            "status": data["resume"]["status"],
+            "analysis_id": analysis.get("id"),
+            "overall_score": analysis.get("overall_score"),
+        }
+
+    async def get_analysis(
+        self, resume_id: str, user_id: uuid.UUID, fields: str | None = None,
+    ) -> dict | None:
+        """Just the analysis of a resume (None until analysed), optionally narrowed by ``fields``."""
+        selection = self._select_fields(fields, {"analysis": ANALYSIS_FIELDS})
+        data = await self._fetch(resume_id, user_id, selection)
+        return data["analysis"]
+
+    @staticmethod
+    def _select_fields(fields: str | None, groups: dict) -> dict:
         try:
-            if ext == ".pdf":
-                return self._extract_pdf(file_path)
-            elif ext in (".docx", ".doc"):
-                return self._extract_docx(file_path)
-            elif ext == ".txt":
-                return file_path.read_text(encoding="utf-8", errors="ignore")
-            return ""
-        except Exception:
-            return ""
-
-    def _extract_pdf(self, path: Path) -> str:
-        from PyPDF2 import PdfReader
-        reader = PdfReader(str(path))
-        return "\n".join(page.extract_text() or "" for page in reader.pages)
-
-    def _extract_docx(self, path: Path) -> str:
-        from docx import Document
-        doc = Document(str(path))
-        return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
+            return parse_fields(fields, groups)
+        except InvalidFieldsError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid fields: {exc}")
 
-    # ── Read operations ──────────────────────────────────────────────────
-    async def get_resume_with_analysis(self, resume_id: str, user_id: uuid.UUID) -> dict:
-        """Get a resume and its analysis by ID, ensuring ownership."""
-        rid = uuid.UUID(resume_id)
-        result = await self.db.execute(select(Resume).where(Resume.id == rid))
-        resume = result.scalar_one_or_none()
-        if not resume:
+    async def _fetch(self, resume_id: uuid.UUID | str, user_id: uuid.UUID, selection: dict) -> dict:
+        """Load only the selected resume / analysis columns, in one query."""
+        rid = uuid.UUID(str(resume_id))
+        resume_fields = selection.get("resume", ())
+        analysis_fields = selection.get("analysis")
+        query = select(
+            Resume.user_id,
+            *(getattr(Resume, f).label(f"resume_{f}") for f in resume_fields),
+        ).where(Resume.id == rid)
+        if analysis_fields is not None:
+            query = query.add_columns(
+                Analysis.id.label("analysis_pk"),
+                *(getattr(Analysis, f).label(f"analysis_{f}") for f in analysis_fields),
+            ).outerjoin(Analysis, Analysis.resume_id == Resume.id)
+
+        row = (await self.db.execute(query)).first()
+        if not row:
             raise HTTPException(status_code=404, detail="Resume not found.")
-        if resume.user_id != user_id:
+        if row.user_id != user_id:
             raise HTTPException(status_code=403, detail="Access denied.")
 
-        result = await self.db.execute(select(Analysis).where(Analysis.resume_id == rid))
-        analysis = result.scalar_one_or_none()
-
-        return {
-            "resume": {
-                "id": str(resume.id),
-                "filename": resume.filename,
-                "status": resume.status,
-                "created_at": resume.created_at.isoformat(),
-                "raw_text": resume.raw_text,
-            },
-            "analysis": {
-                "id": str(analysis.id),
-                "overall_score": analysis.overall_score,
-                "sections": analysis.sections,
-                "suggestions": analysis.suggestions,
-                "keywords": analysis.keywords,
-                "created_at": analysis.created_at.isoformat(),
-            } if analysis else None,
-        }
+        data = {}
+        if "resume" in selection:
+            data["resume"] = {f: _json_value(row._mapping[f"resume_{f}"]) for f in resume_fields}
+        if analysis_fields is not None:
+            data["analysis"] = {
+                f: _json_value(row._mapping[f"analysis_{f}"]) for f in analysis_fields
+            } if row.analysis_pk is not None else None
+        return data
 
-    async def list_user_resumes(self, user_id: uuid.UUID) -> list[dict]:
-        """List all resumes for a user with their scores."""
-        result = await self.db.execute(
-            select(Resume, Analysis.overall_score)
+    async def list_user_resumes(
+        self, user_id: uuid.UUID, limit: int = 20, cursor: str | None = None,
+    ) -> dict:
+        """
+        One page of the user's resumes, newest first, with their scores.
+        Keyset-paginated on (created_at, id): pass the returned ``next_cursor``
+        back to get the following page; it is None on the last page.
+        """
+        query = (
+            self._listing_columns()
             .outerjoin(Analysis, Resume.id == Analysis.resume_id)
             .where(Resume.user_id == user_id)
-            .order_by(Resume.created_at.desc())
         )
-        rows = result.all()
-        return [
-            {
-                "id": str(row[0].id),
-                "filename": row[0].filename,
-                "status": row[0].status,
-                "overall_score": row[1],
-                "created_at": row[0].created_at.isoformat(),
-            }
-            for row in rows
-        ]
-
-    async def get_user_stats(self, user_id: uuid.UUID) -> dict:
-        """Get aggregated stats for a user."""
-        result = await self.db.execute(
-            select(
-                func.count(Resume.id),
-                func.avg(Analysis.overall_score),
+        return await self._page(query, limit, cursor)
+
+    async def search_resumes(
+        self,
+        user_id: uuid.UUID,
+        keywords: list[str],
+        missing_sections: list[str],
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> dict:
+        """
+        The user's analysed resumes whose analysis found every keyword in
+        ``keywords`` and lacks every section in ``missing_sections``; paged
+        like list_user_resumes.
+        """
+        keywords = sorted({k.strip().lower() for k in keywords if k.strip()})
+        missing_sections = sorted({s.strip().lower() for s in missing_sections if s.strip()})
+        if not keywords and not missing_sections:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide at least one keyword or missing_section.",
             )
-            .outerjoin(Analysis, Resume.id == Analysis.resume_id)
+        unknown = [name for name in missing_sections if name not in ESSENTIAL_SECTIONS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown section(s): {', '.join(unknown)}. "
+                f"Searchable: {', '.join(sorted(ESSENTIAL_SECTIONS))}",
+            )
+
+        query = (
+            self._listing_columns()
+            .join(Analysis, Resume.id == Analysis.resume_id)
             .where(Resume.user_id == user_id)
         )
-        row = result.one()
+        if self.db.bind.dialect.name == "postgresql":
+            # jsonb containment, served by the GIN indexes from migration 007
+            if keywords:
+                query = query.where(type_coerce(Analysis.keywords, JSONB).contains(keywords))
+            if missing_sections:
+                query = query.where(MISSING_SECTIONS.contains(missing_sections))
+        else:
+            # SQLite (tests / local runs): one json_each probe per term
+            for keyword in keywords:
+                query = query.where(_json_array_has(Analysis.keywords, "$", keyword))
+            for name in missing_sections:
+                query = query.where(_json_array_has(Analysis.sections, "$.sections.missing", name))
+        return await self._page(query, limit, cursor)
+
+    @staticmethod
+    def _listing_columns():
+        return select(
+            Resume.id,
+            Resume.parent_id,
+            Resume.filename,
+            Resume.status,
+            Resume.created_at,
+            Analysis.overall_score,
+        )
+
+    async def _page(self, query, limit: int, cursor: str | None) -> dict:
+        """Apply newest-first keyset pagination to a listing query and run it."""
+        query = query.order_by(Resume.created_at.desc(), Resume.id.desc()).limit(limit + 1)
+        if cursor:
+            try:
+                created_at, last_id = decode_cursor(cursor)
+            except InvalidCursorError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+            query = query.where(tuple_(Resume.created_at, Resume.id) < tuple_(created_at, last_id))
+
+        rows = (await self.db.execute(query)).all()
+        page = rows[:limit]
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if len(rows) > limit else None
         return {
-            "resumes_analyzed": row[0] or 0,
-            "average_score": round(float(row[1]), 1) if row[1] else None,
+            "resumes": [
+                {
+                    "id": str(row.id),
+                    "parent_id": str(row.parent_id) if row.parent_id else None,
+                    "filename": row.filename,
+                    "status": row.status,
+                    "overall_score": row.overall_score,
+                    "created_at": row.created_at.isoformat(),
+                }
+                for row in page
+            ],
+            "next_cursor": next_cursor,
         }
+
+
+def _json_array_has(column, path: str, value: str):
+    """EXISTS over SQLite's json_each: the JSON array at ``path`` contains ``value``."""
+    items = func.json_each(column, path).table_valued("value")
+    return exists().select_from(items).where(items.c.value == value)
@@ -0,0 +1,227 @@
+"""
+Search Service
+Full-text search over the user's stored resumes with boolean queries
+(app.utils.search_query), ranked best first, with highlighted snippets and
+keyset pagination on (rank, id).
+
+On PostgreSQL the query becomes a tsquery matched against the GIN-indexed
+resumes.search_vector (migration 009), ranked by ts_rank_cd and
+highlighted by ts_headline. Elsewhere (SQLite test and local runs) it is
+evaluated against the user's in-memory BM25 partition shared with
+MatchService, with phrases checked on the stored text (stopwords may sit
+between their words). Ranks are only comparable within one backend.
+"""
+
+import heapq
+import re
+import uuid
+from typing import Hashable
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import stage
+from app.models.analysis import Analysis
+from app.models.resume import SEARCH_CONFIG, SEARCH_VECTOR, Resume
+from app.models.user import User
+from app.services.match_service import match_index
+from app.utils.inverted_index import STOPWORDS
+from app.utils.pagination import InvalidCursorError, decode_rank_cursor, encode_rank_cursor
+from app.utils.search_query import (
+    And, InvalidQueryError, Node, Not, Term, evaluate, excluded_terms, parse, positive_tokens, terms,
+)
+
+SNIPPET_WORDS = 30
+_HEADLINE_OPTIONS = (
+    f'StartSel="**", StopSel="**", MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}, '
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+_PHRASE_BATCH = 500  # texts loaded per query when checking phrases (SQLite bind-parameter limit)
+_PHRASE_GAP = r"[^a-z0-9+#]+(?:(?:{})[^a-z0-9+#]+)*".format("|".join(map(re.escape, sorted(STOPWORDS))))
+_WORD_EDGES = "\"'()[]{}<>.,;:!?*•"
+
+
+class SearchService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(self, user: User, query: str, limit: int = 20, cursor: str | None = None) -> dict:
+        """The user's resumes matching ``query``, best match first."""
+        if user.tier not in settings.FULLTEXT_SEARCH_TIERS:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Full-text search is not available on your plan.",
+            )
+        try:
+            node = parse(query, settings.FULLTEXT_MAX_TERMS)
+        except InvalidQueryError as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+        after = None
+        if cursor:
+            try:
+                after = decode_rank_cursor(cursor)
+            except InvalidCursorError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+        # Either backend returns up to limit + 1 row mappings with a "rank" (the
+        # extra row only signals a next page) and snippets for the first ``limit``
+        if self.db.bind.dialect.name == "postgresql":
+            rows, snippets = await self._search_postgres(user.id, node, limit, after)
+        else:
+            rows, snippets = await self._search_index(user.id, node, limit, after)
+        page = rows[:limit]
+        next_cursor = encode_rank_cursor(page[-1]["rank"], page[-1]["id"]) if len(rows) > limit else None
+        return {
+            "resumes": [
+                {
+                    "id": str(row["id"]),
+                    "parent_id": str(row["parent_id"]) if row["parent_id"] else None,
+                    "filename": row["filename"],
+                    "status": row["status"],
+                    "overall_score": row["overall_score"],
+                    "created_at": row["created_at"].isoformat(),
+                    "rank": round(row["rank"], 4),
+                    "snippet": snippets.get(row["id"]),
+                }
+                for row in page
+            ],
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def _listing_columns(*extra):
+        return select(
+            Resume.id,
+            Resume.parent_id,
+            Resume.filename,
+            Resume.status,
+            Resume.created_at,
+            Analysis.overall_score,
+            *extra,
+        ).outerjoin(Analysis, Resume.id == Analysis.resume_id)
+
+    # ── PostgreSQL: tsvector + GIN ───────────────────────────────────────
+    async def _search_postgres(self, user_id: uuid.UUID, node: Node, limit: int, after) -> tuple[list, dict]:
+        tsquery = _tsquery(node)
+        rank = func.ts_rank_cd(SEARCH_VECTOR, tsquery, 1)  # 1: divided by 1 + log(document length)
+        query = (
+            self._listing_columns(rank.label("rank"))
+            .where(Resume.user_id == user_id, SEARCH_VECTOR.op("@@")(tsquery))
+            .order_by(rank.desc(), Resume.id.desc())
+            .limit(limit + 1)
+        )
+        if after:
+            query = query.where(tuple_(rank, Resume.id) < tuple_(*after))
+        with stage("search.match"):
+            rows = [dict(row._mapping) for row in await self.db.execute(query)]
+        if not rows:
+            return rows, {}
+        # ts_headline re-parses the whole text, so only for the rows on this page
+        with stage("search.snippets"):
+            result = await self.db.execute(
+                select(Resume.id, func.ts_headline(SEARCH_CONFIG, Resume.raw_text, tsquery, _HEADLINE_OPTIONS))
+                .where(Resume.id.in_([row["id"] for row in rows[:limit]]))
+            )
+        return rows, dict(result.all())
+
+    # ── fallback: in-memory inverted index ───────────────────────────────
+    async def _search_index(self, user_id: uuid.UUID, node: Node, limit: int, after) -> tuple[list, dict]:
+        with stage("search.match"):
+            index = await match_index.partition(self.db, user_id)
+            phrases = [term for term in terms(node) if len(term.tokens) > 1]
+            if phrases:
+                # A phrase implies all of its words, so the query with each phrase as a plain
+                # AND matches a superset (unless a phrase is excluded): only check phrases there
+                within = None if any(len(term.tokens) > 1 for term in excluded_terms(node)) else evaluate(
+                    node, lambda term: _all_tokens(index, term.tokens))
+                phrase_docs = await self._phrase_matches(index, phrases, within)
+
+            def docs_for(term: Term) -> set[Hashable]:
+                if len(term.tokens) > 1:
+                    return phrase_docs[term]
+                return set(index.postings.get(term.tokens[0], ()))
+
+            ranked_terms = positive_tokens(node)
+            scored = ((index.score(doc_id, ranked_terms), doc_id) for doc_id in evaluate(node, docs_for))
+            if after:
+                scored = (key for key in scored if key < after)
+            top = heapq.nlargest(limit + 1, scored)
+        if not top:
+            return [], {}
+
+        with stage("search.snippets"):
+            result = await self.db.execute(
+                self._listing_columns(Resume.raw_text).where(Resume.id.in_([doc_id for _, doc_id in top]))
+            )
+            by_id = {row.id: row._mapping for row in result.all()}
+            rows = [
+                {**by_id[doc_id], "rank": score}
+                for score, doc_id in top if doc_id in by_id  # deleted since the partition synced
+            ]
+            highlight = set(ranked_terms)
+            snippets = {row["id"]: _snippet(row["raw_text"] or "", highlight) for row in rows[:limit]}
+        return rows, snippets
+
+    async def _phrase_matches(self, index, phrases: list[Term], within: set | None) -> dict[Term, set]:
+        """Documents (of ``within``, if given) containing each phrase: those with all its tokens, confirmed on their text."""
+        candidates = {}
+        for phrase in phrases:
+            docs = _all_tokens(index, phrase.tokens)
+            candidates[phrase] = docs & within if within is not None else docs
+        to_check = list(set().union(*candidates.values()))
+        texts: dict[uuid.UUID, str] = {}
+        for start in range(0, len(to_check), _PHRASE_BATCH):
+            result = await self.db.execute(
+                select(Resume.id, Resume.raw_text).where(Resume.id.in_(to_check[start:start + _PHRASE_BATCH]))
+            )
+            texts.update((doc_id, (raw_text or "").lower()) for doc_id, raw_text in result.all())
+        matches = {}
+        for phrase, docs in candidates.items():
+            pattern = _phrase_pattern(phrase.tokens)
+            matches[phrase] = {doc_id for doc_id in docs if pattern.search(texts.get(doc_id, ""))}
+        return matches
+
+
+def _tsquery(node: Node):
+    """The parsed query as a tsquery expression; words and phrases are bound parameters."""
+    if isinstance(node, Term):
+        text = " ".join(node.tokens)
+        if len(node.tokens) > 1:
+            return func.phraseto_tsquery(SEARCH_CONFIG, text)
+        return func.plainto_tsquery(SEARCH_CONFIG, text)
+    if isinstance(node, Not):
+        return func.tsquery_not(_tsquery(node.operand))
+    combine = func.tsquery_and if isinstance(node, And) else func.tsquery_or
+    operands = [_tsquery(operand) for operand in node.operands]
+    expression = operands[0]
+    for operand in operands[1:]:
+        expression = combine(expression, operand)
+    return expression
+
+
+def _all_tokens(index, tokens: tuple[str, ...]) -> set[Hashable]:
+    postings = sorted((index.postings.get(token, {}) for token in tokens), key=len)
+    return set(postings[0]).intersection(*postings[1:])
+
+
+def _phrase_pattern(tokens: tuple[str, ...]) -> re.Pattern:
+    """The phrase's tokens in order, in lower-cased text, with only punctuation or stopwords between them."""
+    first = re.escape(tokens[0])
+    # Literal first so the regex engine can skip ahead to it; the word-boundary check comes after
+    return re.compile(
+        first + rf"(?<![a-z0-9+#]{first})" + "".join(_PHRASE_GAP + re.escape(token) for token in tokens[1:])
+        + r"(?![a-z0-9+#])"
+    )
+
+
+def _snippet(text: str, highlight: set[str]) -> str:
+    """About SNIPPET_WORDS words around the first highlighted term, matches in **bold** (as ts_headline)."""
+    words = text.split()
+    hits = [i for i, word in enumerate(words) if word.lower().strip(_WORD_EDGES) in highlight]
+    start = max(0, hits[0] - SNIPPET_WORDS // 3) if hits else 0
+    end = min(len(words), start + SNIPPET_WORDS)
+    marked = set(hits)
+    fragment = " ".join(f"**{words[i]}**" if i in marked else words[i] for i in range(start, end))
+    return ("… " if start else "") + fragment + (" …" if end < len(words) else "")
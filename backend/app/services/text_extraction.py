@@ -0,0 +1,115 @@
+"""
+Text Extraction
+Plain functions that pull text out of uploaded PDF / DOCX / TXT files.
+Kept at module level (not on ResumeService) so they can be shipped to a
+process-pool worker by the analysis executor; extract_text_with() is the
+async entry point that schedules them.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from app.core.config import settings
+
+
+async def extract_text_with(executor, path: str | Path) -> str:
+    """
+    Extract text on ``executor`` within the PDF_MAX_PAGES / PDF_MAX_CHARS budgets.
+    On a process pool, long PDFs are split into page ranges that run side by
+    side, one wave per worker set, stopping after the wave that fills the
+    character budget.
+    """
+    ext = Path(path).suffix.lower()
+    max_pages = settings.PDF_MAX_PAGES or None
+    max_chars = settings.PDF_MAX_CHARS or None
+    # Threads share the GIL, so only a process pool gains from splitting pages
+    if ext != ".pdf" or executor.mode != "process" or not settings.PDF_PARALLEL_MIN_PAGES:
+        return await executor.run(extract_text, path, ext, max_pages, max_chars)
+
+    page_count = await executor.run(pdf_page_count, path)
+    if max_pages:
+        page_count = min(page_count, max_pages)
+    if page_count < settings.PDF_PARALLEL_MIN_PAGES:
+        return await executor.run(extract_text, path, ext, max_pages, max_chars)
+
+    step = max(1, settings.PDF_PAGES_PER_TASK)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    pages: list[str] = []
+    for i in range(0, len(ranges), executor.max_workers):
+        chunks = await asyncio.gather(
+            *(executor.run(extract_pdf_pages, path, start, stop) for start, stop in ranges[i:i + executor.max_workers])
+        )
+        if any(chunk is None for chunk in chunks):
+            return ""
+        for chunk in chunks:
+            pages.extend(chunk)
+        if max_chars and sum(map(len, pages)) + len(pages) - 1 >= max_chars:
+            break
+    return join_pages(pages, max_chars)
+
+
+def extract_text(
+    path: str | Path, ext: str, max_pages: int | None = None, max_chars: int | None = None,
+) -> str:
+    """Extract text from a saved upload; returns "" if the file can't be parsed."""
+    path = Path(path)
+    try:
+        if ext == ".pdf":
+            return extract_pdf(path, max_pages, max_chars)
+        elif ext in (".docx", ".doc"):
+            return extract_docx(path)
+        elif ext == ".txt":
+            return path.read_text(encoding="utf-8", errors="ignore")
+        return ""
+    except Exception:
+        return ""
+
+
+def extract_pdf(path: Path, max_pages: int | None = None, max_chars: int | None = None) -> str:
+    """Extract pages in order, stopping at whichever of the page/character budgets is hit first."""
+    return join_pages(iter_pdf_pages(path, 0, max_pages), max_chars)
+
+
+def iter_pdf_pages(path: str | Path, start: int = 0, stop: int | None = None) -> Iterator[str]:
+    """Yield the text of pages [start, stop) one at a time; content streams are only parsed on demand."""
+    from PyPDF2 import PdfReader
+    pages = PdfReader(str(path)).pages
+    stop = len(pages) if stop is None else min(stop, len(pages))
+    for index in range(start, stop):
+        yield pages[index].extract_text() or ""
+
+
+def join_pages(pages: Iterable[str], max_chars: int | None = None) -> str:
+    """Join page texts with newlines, pulling no more pages once ``max_chars`` is reached."""
+    parts: list[str] = []
+    size = -1
+    for text in pages:
+        parts.append(text)
+        size += len(text) + 1
+        if max_chars is not None and size >= max_chars:
+            return "\n".join(parts)[:max_chars]
+    return "\n".join(parts)
+
+
+def pdf_page_count(path: str | Path) -> int:
+    """Number of pages in a PDF, or 0 if it can't be parsed."""
+    from PyPDF2 import PdfReader
+    try:
+        return len(PdfReader(str(path)).pages)
+    except Exception:
+        return 0
+
+
+def extract_pdf_pages(path: str | Path, start: int, stop: int) -> list[str] | None:
+    """Text of pages [start, stop) for one parallel extraction task; None if the range can't be parsed."""
+    try:
+        return list(iter_pdf_pages(path, start, stop))
+    except Exception:
+        return None
+
+
+def extract_docx(path: Path) -> str:
+    from docx import Document
+    doc = Document(str(path))
+    return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
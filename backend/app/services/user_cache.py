@@ -0,0 +1,128 @@
+"""
+User Cache
+Lets get_current_user skip the JWT decode and the users SELECT on repeat
+requests.
+
+- token (SHA-256)  -> user id, until the token expires   (in-process only)
+- user id          -> snapshot of the user's profile     (LRU + optional Redis)
+
+Snapshots are dropped when a User row is updated or deleted through the ORM
+(see the session events at the bottom); code that changes users with bulk
+UPDATE statements must call ``await user_cache.invalidate(user_id)`` itself.
+Other API processes may keep a stale local copy for up to AUTH_CACHE_TTL.
+"""
+
+import asyncio
+import hashlib
+import uuid
+from datetime import datetime
+from typing import Any
+
+from jose import JWTError, jwt
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import LRUCache, TieredCache
+from app.core.config import settings
+from app.models.user import User
+
+_SNAPSHOT_FIELDS = ("email", "full_name", "is_active", "tier")
+_PENDING_KEY = "user_cache_invalidate"
+
+
+class UserCache:
+    """Decoded-token and user-snapshot caches with hit counters."""
+
+    def __init__(self):
+        self.tokens = LRUCache(settings.AUTH_CACHE_MAX_BYTES // 4)
+        self.users = TieredCache(
+            "auth-user",
+            max_bytes=settings.AUTH_CACHE_MAX_BYTES,
+            ttl=settings.AUTH_CACHE_TTL,
+            use_redis=settings.CACHE_REDIS_ENABLED,
+        )
+        self.token_hits = 0
+        self.token_misses = 0
+        self.db_lookups = 0
+
+    # ── tokens ───────────────────────────────────────────────────────────
+    def user_id_for(self, token: str) -> str | None:
+        """The token's subject, or None if it is invalid or expired."""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self.tokens.get(key)
+        if cached is not None:
+            user_id, _, expires = cached.partition(" ")
+            if float(expires) > datetime.utcnow().timestamp():
+                self.token_hits += 1
+                return user_id
+            self.tokens.delete(key)
+        self.token_misses += 1
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        except JWTError:
+            return None
+        user_id = payload.get("sub")
+        if user_id is None:
+            return None
+        self.tokens.set(key, f"{user_id} {payload.get('exp', 0)}")
+        return user_id
+
+    # ── user snapshots ───────────────────────────────────────────────────
+    async def get_user(self, user_id: str) -> User | None:
+        """A detached User built from the cached snapshot, or None on a miss."""
+        snapshot = await self.users.get(str(user_id))
+        if snapshot is None:
+            return None
+        return User(
+            id=uuid.UUID(snapshot["id"]),
+            created_at=datetime.fromisoformat(snapshot["created_at"]),
+            **{field: snapshot[field] for field in _SNAPSHOT_FIELDS},
+        )
+
+    async def set_user(self, user: User) -> None:
+        self.db_lookups += 1
+        snapshot: dict[str, Any] = {field: getattr(user, field) for field in _SNAPSHOT_FIELDS}
+        snapshot["id"] = str(user.id)
+        snapshot["created_at"] = user.created_at.isoformat()
+        await self.users.set(str(user.id), snapshot)
+
+    async def invalidate(self, user_id: uuid.UUID | str) -> None:
+        await self.users.delete(str(user_id))
+
+    def stats(self) -> dict:
+        user_hits = self.users.local_hits + self.users.redis_hits
+        return {
+            "token_hits": self.token_hits,
+            "token_misses": self.token_misses,
+            "users": self.users.stats(),
+            "db_lookups": self.db_lookups,
+            "db_lookups_saved": user_hits,
+        }
+
+
+user_cache = UserCache()
+
+
+# ── invalidation on ORM writes ───────────────────────────────────────────
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _mark_user_changed(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(str(target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_changed_users(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        user_cache.users.local.delete(user_id)
+        if user_cache.users.use_redis:
+            try:
+                asyncio.get_running_loop().create_task(user_cache.invalidate(user_id))
+            except RuntimeError:  # committed outside the event loop; Redis copy expires within the TTL
+                pass
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,46 @@
+"""
+Field Selection
+Parses ``?fields=`` query strings into the columns an endpoint should load,
+so it can fetch and serialize only what the caller asked for.
+
+``analysis.overall_score`` picks one field of a group, ``analysis`` picks the
+whole group, and a bare name (``suggestions``) picks that field from the one
+group that has it.
+"""
+
+Selection = dict[str, tuple[str, ...]]
+
+
+class InvalidFieldsError(ValueError):
+    """The selection named a field or group the endpoint does not have."""
+
+
+def parse_fields(spec: str | None, groups: Selection) -> Selection:
+    """
+    Map each selected group to its selected fields, in ``groups`` order.
+    An empty or missing spec selects everything.
+    """
+    names = [part.strip() for part in (spec or "").split(",") if part.strip()]
+    if not names:
+        return dict(groups)
+
+    chosen: dict[str, set[str]] = {}
+    for name in names:
+        group, _, field = name.rpartition(".")
+        if not group and field in groups:
+            group, field = field, ""
+        elif not group:
+            owners = [g for g, fields in groups.items() if field in fields]
+            if len(owners) != 1:
+                reason = "is ambiguous" if owners else "is not a known field"
+                raise InvalidFieldsError(f"'{name}' {reason}.")
+            group = owners[0]
+        if group not in groups or (field and field not in groups[group]):
+            raise InvalidFieldsError(f"'{name}' is not a known field.")
+        chosen.setdefault(group, set()).update([field] if field else groups[group])
+
+    return {
+        group: tuple(f for f in fields if f in chosen[group])
+        for group, fields in groups.items()
+        if group in chosen
+    }
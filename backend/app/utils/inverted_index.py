@@ -0,0 +1,129 @@
+"""
+Inverted Index
+In-memory BM25 index that documents can be added to and removed from one at
+a time. Top-k queries score term-at-a-time, rarest term first, with
+MaxScore-style pruning: once no unseen document can reach the current k-th
+best score, candidates that can't either are dropped and the remaining
+(common, long) posting lists are only probed for the survivors.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Hashable, Iterable
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could
+did do does doing during each etc for from had has have having he her here him his how i
+if in into is it its itself just me more most must my no nor not of off on once only or
+other our ours out over own per same she should so some such than that the their them
+then there these they this those through to too under until up us very was we were what
+when where which while who whom why will with within would you your yours
+ability candidate candidates ideal including join looking need needs plus preferred
+required requirements responsibilities role seeking strong
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens, keeping tech spellings like "c++", "ci/cd" and "node.js" whole."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class InvertedIndex:
+    """term → {doc_id: term frequency}, plus the document lengths BM25 needs."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict[Hashable, int]] = {}
+        self.doc_lengths: dict[Hashable, int] = {}
+        self.doc_terms: dict[Hashable, tuple[str, ...]] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self.doc_lengths
+
+    # ── maintenance ──────────────────────────────────────────────────────
+    def add(self, doc_id: Hashable, tokens: Iterable[str]) -> None:
+        """Index a document's tokens, replacing any earlier version of it."""
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        length = sum(counts.values())
+        self.doc_terms[doc_id] = tuple(counts)
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def remove(self, doc_id: Hashable) -> None:
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in self.doc_terms.pop(doc_id):
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+
+    # ── scoring ──────────────────────────────────────────────────────────
+    def idf(self, term: str) -> float:
+        """BM25 idf; always positive, and highest for terms no document contains."""
+        n = len(self.doc_lengths)
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def _norm(self, doc_id: Hashable, avgdl: float) -> float:
+        return self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avgdl)
+
+    def score(self, doc_id: Hashable, terms: Iterable[str]) -> float:
+        """BM25 score of one document for a set of query terms."""
+        if doc_id not in self.doc_lengths:
+            return 0.0
+        norm = self._norm(doc_id, self.total_length / len(self.doc_lengths))
+        total = 0.0
+        for term in set(terms):
+            tf = self.postings.get(term, {}).get(doc_id)
+            if tf:
+                total += self.idf(term) * tf * (self.k1 + 1) / (tf + norm)
+        return total
+
+    def top_k(self, terms: Iterable[str], k: int) -> list[tuple[Hashable, float]]:
+        """The ``k`` best (doc_id, score) pairs, best first; same result as scoring every document."""
+        present = [term for term in set(terms) if term in self.postings]
+        if not present or k <= 0:
+            return []
+        avgdl = self.total_length / len(self.doc_lengths)
+        # Per-term ceiling: tf / (tf + norm) < 1, so no document gains more than idf * (k1 + 1)
+        bounds = sorted(((self.idf(term) * (self.k1 + 1), term) for term in present), reverse=True)
+        remaining = sum(bound for bound, _ in bounds)
+        scores: dict[Hashable, float] = {}
+        norms: dict[Hashable, float] = {}
+        for bound, term in bounds:
+            docs = self.postings[term]
+            idf = bound / (self.k1 + 1)
+            candidates = docs.items()
+            if len(scores) >= k:
+                threshold = heapq.nlargest(k, scores.values())[-1]
+                if remaining < threshold:
+                    # No unseen document can reach the top k any more; keep only the
+                    # candidates that still can, and probe this list for those alone.
+                    scores = {doc_id: s for doc_id, s in scores.items() if s + remaining >= threshold}
+                    if len(scores) < len(docs):
+                        candidates = [(doc_id, docs[doc_id]) for doc_id in scores if doc_id in docs]
+                    else:
+                        candidates = [(doc_id, tf) for doc_id, tf in docs.items() if doc_id in scores]
+            for doc_id, tf in candidates:
+                norm = norms.get(doc_id)
+                if norm is None:
+                    norm = norms[doc_id] = self._norm(doc_id, avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+            remaining -= bound
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], str(item[0])))
@@ -0,0 +1,106 @@
+"""
+Keyword Matcher
+Aho-Corasick automaton that finds every term of a fixed dictionary in a single
+left-to-right pass, so matching cost depends on the text length rather than on
+how many terms the dictionary holds.
+"""
+
+import string
+from collections import deque
+from typing import Iterable, Iterator, NamedTuple
+
+
+class Match(NamedTuple):
+    start: int
+    end: int
+    term: str
+    tag: str
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher over lower-case terms.
+    Terms are grouped under a tag (e.g. a keyword category). A term added with
+    ``whole_word=True`` only matches when the characters on either side are not
+    in ``word_chars``; other terms match anywhere, like ``term in text``.
+    """
+
+    def __init__(self, word_chars: str = string.ascii_lowercase + string.digits):
+        self.word_chars = frozenset(word_chars)
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[list[tuple[str, str, bool]]] = [[]]
+        self._delta: list[dict[str, int]] | None = None
+        self._terminal: frozenset[int] = frozenset()
+
+    # ── construction ─────────────────────────────────────────────────────
+    def add(self, term: str, tag: str, whole_word: bool = False) -> None:
+        """Add a term to the trie. Must be called before build()."""
+        if self._delta is not None:
+            raise RuntimeError("KeywordMatcher is already built.")
+        if not term:
+            return
+        state = 0
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._out.append([])
+            state = nxt
+        self._out[state].append((term, tag, whole_word))
+
+    def add_pool(self, terms: Iterable[str], tag: str, whole_word: bool = False) -> None:
+        for term in terms:
+            self.add(term.lower(), tag, whole_word)
+
+    def build(self) -> "KeywordMatcher":
+        """Compute failure links and flatten them into a full transition table."""
+        goto, out = self._goto, self._out
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # inherit the fallback state's transitions, then override with our own edges
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            out[state] = out[state] + out[fail[state]]
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(nxt)
+        self._delta = delta
+        self._terminal = frozenset(state for state, terms in enumerate(out) if terms)
+        return self
+
+    # ── matching ─────────────────────────────────────────────────────────
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """Yield every (possibly overlapping) match with its position in ``text``."""
+        delta, out, word_chars = self._require_built(), self._out, self.word_chars
+        terminal = self._terminal
+        n = len(text)
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if state not in terminal:
+                continue
+            for term, tag, whole_word in out[state]:
+                start = end - len(term)
+                if whole_word and (
+                    (start > 0 and text[start - 1] in word_chars)
+                    or (end < n and text[end] in word_chars)
+                ):
+                    continue
+                yield Match(start, end, term, tag)
+
+    def find_terms(self, text: str) -> dict[str, set[str]]:
+        """Return the distinct terms found in ``text`` grouped by tag."""
+        found: dict[str, set[str]] = {}
+        for match in self.iter_matches(text):
+            found.setdefault(match.tag, set()).add(match.term)
+        return found
+
+    def _require_built(self) -> list[dict[str, int]]:
+        if self._delta is None:
+            raise RuntimeError("KeywordMatcher.build() must be called before matching.")
+        return self._delta
@@ -0,0 +1,42 @@
+"""
+Keyset Pagination
+Opaque cursors over a (created_at, id) or (rank, id) sort key, so each page
+continues from where the previous one stopped instead of using an OFFSET.
+"""
+
+import base64
+import uuid
+from datetime import datetime
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not produced by encode_cursor."""
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, _, row_id = raw.partition("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def encode_rank_cursor(rank: float, row_id: uuid.UUID) -> str:
+    """Cursor for a best-first (rank, id) order, e.g. search relevance."""
+    raw = f"{rank!r}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        rank, _, row_id = raw.partition("|")
+        return float(rank), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise InvalidCursorError(cursor) from exc
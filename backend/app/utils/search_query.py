@@ -0,0 +1,210 @@
+"""
+Search Query Parser
+Boolean resume-search queries such as ``python AND (kubernetes OR k8s) NOT intern``
+or ``"site reliability" -contract``.
+
+Grammar (operators are case-insensitive; AND is implied between terms)::
+
+    query := or
+    or    := and ("OR" and)*
+    and   := unary (["AND"] unary)*
+    unary := ("NOT" | "-") unary | "(" or ")" | '"phrase"' | word
+
+Words and phrases are normalised with the same tokenizer as the BM25 index,
+so stopwords drop out. A query has to require something: one made only of
+exclusions (``NOT intern``) is rejected rather than matching everything.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Hashable, Union
+
+from app.utils.inverted_index import tokenize
+
+_TOKEN_RE = re.compile(r'"([^"]*)"?|(\()|(\))|(-)(?=[^\s-])|([^\s()"]+)')
+_OPERATORS = {"and", "or", "not"}
+
+
+class InvalidQueryError(ValueError):
+    """The query does not parse, or cannot be searched."""
+
+
+@dataclass(frozen=True)
+class Term:
+    """A word, or a quoted phrase when it has more than one token."""
+
+    tokens: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "Node"
+
+
+@dataclass(frozen=True)
+class And:
+    operands: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    operands: tuple["Node", ...]
+
+
+Node = Union[Term, Not, And, Or]
+
+
+def parse(query: str, max_terms: int = 16) -> Node:
+    """The query's syntax tree; raises InvalidQueryError."""
+    tokens = _lex(query)
+    parser = _Parser(tokens)
+    node = parser.parse_or()
+    if parser.pos < len(tokens):
+        raise InvalidQueryError(f"Unexpected '{tokens[parser.pos][1]}'.")
+    if node is None:
+        raise InvalidQueryError("Query has no searchable terms.")
+    if len(terms(node)) > max_terms:
+        raise InvalidQueryError(f"Query has more than {max_terms} terms.")
+    if is_negative(node):
+        raise InvalidQueryError("Query must include a term to find, not only terms to exclude.")
+    return node
+
+
+def terms(node: Node) -> list[Term]:
+    """Every word / phrase in the query, in order."""
+    if isinstance(node, Term):
+        return [node]
+    if isinstance(node, Not):
+        return terms(node.operand)
+    return [term for operand in node.operands for term in terms(operand)]
+
+
+def excluded_terms(node: Node, negated: bool = False) -> list[Term]:
+    """Words / phrases under an odd number of NOTs."""
+    if isinstance(node, Term):
+        return [node] if negated else []
+    if isinstance(node, Not):
+        return excluded_terms(node.operand, not negated)
+    return [term for operand in node.operands for term in excluded_terms(operand, negated)]
+
+
+def positive_tokens(node: Node) -> list[str]:
+    """Tokens a matching document contains (not the excluded ones): what to rank and highlight."""
+    excluded = excluded_terms(node)
+    return [token for term in terms(node) if term not in excluded for token in term.tokens]
+
+
+def is_negative(node: Node) -> bool:
+    """True if the node matches the complement of a finite set (e.g. ``NOT intern``)."""
+    if isinstance(node, Term):
+        return False
+    if isinstance(node, Not):
+        return not is_negative(node.operand)
+    if isinstance(node, And):
+        return all(is_negative(operand) for operand in node.operands)
+    return any(is_negative(operand) for operand in node.operands)
+
+
+def evaluate(node: Node, docs_for: Callable[[Term], set[Hashable]]) -> set[Hashable]:
+    """
+    Documents matching a parsed query, given the documents matching each term.
+    Works on (set, complemented) pairs, so NOT never needs the full document list.
+    """
+    docs, negative = _evaluate(node, docs_for)
+    assert not negative, "parse() rejects negative queries"
+    return docs
+
+
+def _evaluate(node: Node, docs_for) -> tuple[set, bool]:
+    if isinstance(node, Term):
+        return docs_for(node), False
+    if isinstance(node, Not):
+        docs, negative = _evaluate(node.operand, docs_for)
+        return docs, not negative
+    parts = [_evaluate(operand, docs_for) for operand in node.operands]
+    if isinstance(node, And):
+        included = [docs for docs, negative in parts if not negative]
+        excluded = set().union(*(docs for docs, negative in parts if negative))
+        if not included:  # ¬A ∧ ¬B = ¬(A ∨ B)
+            return excluded, True
+        docs = set.intersection(*sorted(included, key=len))
+        return docs - excluded, False
+    # Or
+    included = set().union(*(docs for docs, negative in parts if not negative))
+    excluded = [docs for docs, negative in parts if negative]
+    if not excluded:
+        return included, False
+    # A ∨ ¬B ∨ ¬C = ¬((B ∩ C) − A)
+    return set.intersection(*excluded) - included, True
+
+
+# ── parsing ──────────────────────────────────────────────────────────────
+def _lex(query: str) -> list[tuple[str, str]]:
+    tokens = []
+    for phrase, lparen, rparen, minus, word in _TOKEN_RE.findall(query):
+        if lparen or rparen:
+            tokens.append((lparen or rparen, lparen or rparen))
+        elif minus:
+            tokens.append(("not", "-"))
+        elif word and word.lower() in _OPERATORS:
+            tokens.append((word.lower(), word))
+        else:
+            tokens.append(("term", phrase if not word else word))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the lexed tokens; empty (all-stopword) terms come back as None."""
+
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse_or(self) -> Node | None:
+        operands = [self.parse_and()]
+        while self._peek() == "or":
+            self._take()
+            operands.append(self.parse_and())
+        return _combine(Or, operands)
+
+    def parse_and(self) -> Node | None:
+        operands = [self.parse_unary()]
+        while self._peek() in ("and", "not", "(", "term"):
+            if self._peek() == "and":
+                self._take()
+            operands.append(self.parse_unary())
+        return _combine(And, operands)
+
+    def parse_unary(self) -> Node | None:
+        kind = self._peek()
+        if kind is None:
+            raise InvalidQueryError("Query ends where a term was expected.")
+        kind, text = self._take()
+        if kind == "not":
+            operand = self.parse_unary()
+            return Not(operand) if operand is not None else None
+        if kind == "(":
+            node = self.parse_or()
+            if self._peek() != ")":
+                raise InvalidQueryError("Unbalanced parentheses.")
+            self._take()
+            return node
+        if kind == "term":
+            tokens = tuple(tokenize(text))
+            return Term(tokens) if tokens else None
+        raise InvalidQueryError(f"Unexpected '{text}'.")
+
+
+def _combine(kind, operands: list[Node | None]) -> Node | None:
+    operands = [operand for operand in operands if operand is not None]
+    if not operands:
+        return None
+    return operands[0] if len(operands) == 1 else kind(tuple(operands))
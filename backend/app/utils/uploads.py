@@ -0,0 +1,53 @@
+"""
+Upload Storage
+Streams uploaded files to disk in fixed-size chunks, hashing as it goes,
+so memory stays flat no matter how large (or how many) the uploads are.
+"""
+
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+
+class UploadTooLargeError(ValueError):
+    """The upload exceeded the configured size cap."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds the {max_bytes}-byte limit.")
+        self.max_bytes = max_bytes
+
+
+class AsyncReadable(Protocol):
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+def _write_chunk(fh: BinaryIO, hasher, chunk: bytes) -> None:
+    # hashlib releases the GIL on large buffers, so both run off the event loop
+    hasher.update(chunk)
+    fh.write(chunk)
+
+
+async def save_upload(
+    source: AsyncReadable, dest: Path, max_bytes: int, chunk_size: int = 1024 * 1024,
+) -> tuple[str, int]:
+    """
+    Copy ``source`` to ``dest`` chunk by chunk.
+    Returns (sha256 hex digest, size in bytes). Removes the partial file and
+    raises UploadTooLargeError as soon as more than ``max_bytes`` arrive.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    fh = await asyncio.to_thread(open, dest, "wb")
+    try:
+        while chunk := await source.read(chunk_size):
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(max_bytes)
+            await asyncio.to_thread(_write_chunk, fh, hasher, chunk)
+        await asyncio.to_thread(fh.close)
+    except BaseException:
+        await asyncio.to_thread(fh.close)
+        dest.unlink(missing_ok=True)
+        raise
+    return hasher.hexdigest(), size
@@ -0,0 +1,64 @@
+"""
+Sign analyses stored before MinHash signatures existed, so the near-duplicate
+index covers them too.
+Run `python -m app.workers.backfill_minhash [--batch 500]` once after migration 008.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import insert, select, update
+
+from app.core.database import async_session
+from app.models.analysis import Analysis
+from app.models.minhash_band import MinHashBand
+from app.models.resume import Resume
+from app.utils import minhash
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill(batch: int = 500) -> int:
+    """Sign and index every unsigned analysis whose resume has text; returns how many were signed."""
+    signed = 0
+    skipped = set()  # analyses whose text has no words
+    while True:
+        async with async_session() as db:
+            query = (
+                select(Analysis.id, Resume.raw_text)
+                .join(Resume, Resume.id == Analysis.resume_id)
+                .where(Analysis.minhash.is_(None), Resume.raw_text.is_not(None))
+                .limit(batch + len(skipped))
+            )
+            rows = [row for row in await db.execute(query) if row.id not in skipped]
+            if not rows:
+                return signed
+            for row in rows:
+                signature = minhash.signature(row.raw_text)
+                if signature is None:
+                    skipped.add(row.id)
+                    continue
+                # Core statements: the ORM insert event that indexes new analyses doesn't fire here
+                await db.execute(update(Analysis).where(Analysis.id == row.id).values(minhash=signature))
+                await db.execute(insert(MinHashBand), [
+                    {"analysis_id": row.id, "band": band, "bucket": bucket}
+                    for band, bucket in enumerate(minhash.band_buckets(signature))
+                ])
+                signed += 1
+            await db.commit()
+        logger.info("signed %d analyses", signed)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Sign and LSH-index analyses that have no MinHash signature.")
+    parser.add_argument("--batch", type=int, default=500, help="analyses per transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    signed = await backfill(args.batch)
+    logger.info("done; %d analyses signed", signed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
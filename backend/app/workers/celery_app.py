@@ -0,0 +1,35 @@
+"""
+Celery Application
+Broker-backed alternative to the Redis list queue.
+Run with: celery -A app.workers.celery_app worker --loglevel=info
+"""
+
+import asyncio
+
+from celery import Celery
+
+from app.core.config import settings
+from app.core.executor import ExecutorSaturatedError
+
+celery_app = Celery("resume_analyzer", broker=settings.REDIS_URL)
+celery_app.conf.task_acks_late = True
+
+# One loop per worker process: the async DB engine's connections are bound to it
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run(coro):
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+@celery_app.task(name="resume.process", bind=True, max_retries=None)
+def process_resume_task(self, resume_id: str) -> None:
+    from app.workers.resume_worker import process_resume
+
+    try:
+        _run(process_resume(resume_id))
+    except ExecutorSaturatedError as exc:
+        raise self.retry(countdown=exc.retry_after)
@@ -0,0 +1,258 @@
+"""
+Resume Processing Queue
+Pluggable hand-off between the upload endpoint and the analysis pipeline.
+
+Backends (settings.RESUME_QUEUE_BACKEND):
+- "inprocess": asyncio.Queue consumed by tasks inside the API process (dev/tests)
+- "redis":     Redis list; consumed by `python -m app.workers.resume_worker`
+- "celery":    Celery task on the Redis broker; consumed by a Celery worker
+
+A queued job can still be lost: the broker is down when the upload commits,
+a worker dies mid-job, or the in-process queue goes with a restart. The
+recovery sweep (recover_stalled, run periodically by the API and the Redis
+worker) re-enqueues resumes left "uploaded" or "processing" too long; the
+worker's claim on the row makes a job queued twice run once.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.executor import ExecutorSaturatedError
+from app.models.resume import Resume
+from app.services.dashboard_service import mark_dashboards_changed
+
+logger = logging.getLogger(__name__)
+
+QUEUE_BACKENDS = ("inprocess", "redis", "celery")
+_RECOVERY_BATCH = 500  # resumes re-enqueued per sweep
+
+
+async def run_job(resume_id: str) -> None:
+    """Run the pipeline for one resume, waiting out executor saturation instead of failing."""
+    from app.workers.resume_worker import process_resume
+
+    while True:
+        try:
+            await process_resume(resume_id)
+            return
+        except ExecutorSaturatedError as exc:
+            await asyncio.sleep(exc.retry_after)
+        except Exception:
+            logger.exception("Processing resume %s failed", resume_id)
+            return
+
+
+class InProcessQueue:
+    """asyncio.Queue with a fixed number of consumer tasks in the current process."""
+
+    def __init__(self, concurrency: int = 4):
+        self.concurrency = max(1, concurrency)
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._consumers: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if not self._consumers:
+            self._consumers = [asyncio.create_task(self._consume()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        for task in self._consumers:
+            task.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+
+    async def enqueue(self, resume_id: str) -> None:
+        self._queue.put_nowait(resume_id)
+
+    requeue = enqueue
+
+    async def join(self) -> None:
+        """Wait until every enqueued resume has been processed."""
+        await self._queue.join()
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def _consume(self) -> None:
+        while True:
+            resume_id = await self._queue.get()
+            try:
+                await run_job(resume_id)
+            finally:
+                self._queue.task_done()
+
+
+class RedisQueue:
+    """
+    Redis list. The API only produces (LPUSH); workers call consume(), which
+    BLMOVEs each job onto a processing list until it has run, so a crashed
+    worker's jobs stay visible there until the recovery sweep requeues them.
+    """
+
+    KEY = "resume-queue"
+    PROCESSING_KEY = "resume-queue:processing"
+
+    def __init__(self, concurrency: int = 4):
+        self.concurrency = max(1, concurrency)
+        self._redis = None
+
+    def _client(self):
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def enqueue(self, resume_id: str) -> None:
+        await self._client().lpush(self.KEY, resume_id)
+
+    async def requeue(self, resume_id: str) -> None:
+        """Enqueue again, dropping any copy a dead worker left on the processing list."""
+        async with self._client().pipeline(transaction=True) as pipe:
+            pipe.lrem(self.PROCESSING_KEY, 0, resume_id)
+            pipe.lpush(self.KEY, resume_id)
+            await pipe.execute()
+
+    async def depth(self) -> int:
+        return await self._client().llen(self.KEY)
+
+    async def consume(self) -> None:
+        """Run ``concurrency`` consumer loops until cancelled."""
+        await asyncio.gather(*(self._consume() for _ in range(self.concurrency)))
+
+    async def _consume(self) -> None:
+        client = self._client()
+        while True:
+            resume_id = await client.blmove(self.KEY, self.PROCESSING_KEY, 5, "RIGHT", "LEFT")
+            if resume_id is None:
+                continue
+            try:
+                await run_job(resume_id)
+            finally:
+                await client.lrem(self.PROCESSING_KEY, 1, resume_id)
+
+
+class CeleryQueue:
+    """Dispatches to the `resume.process` Celery task (see app.workers.celery_app)."""
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def enqueue(self, resume_id: str) -> None:
+        from app.workers.celery_app import process_resume_task
+        # .delay() talks to the broker synchronously; keep it off the event loop
+        await asyncio.to_thread(process_resume_task.delay, resume_id)
+
+    requeue = enqueue
+
+
+async def enqueue_resume(resume_id: str) -> bool:
+    """
+    Enqueue a committed "uploaded" resume. If the queue backend is unreachable
+    the row is left for the recovery sweep rather than failing the upload.
+    """
+    try:
+        await get_resume_queue().enqueue(resume_id)
+        return True
+    except Exception:
+        logger.warning("Could not enqueue resume %s; the recovery sweep will retry it", resume_id, exc_info=True)
+        return False
+
+
+async def recover_stalled(queue=None) -> tuple[int, int]:
+    """
+    Re-enqueue resumes stuck before analysis: "processing" rows older than
+    RESUME_PROCESSING_TIMEOUT (their worker died) go back to "uploaded"
+    first, and "uploaded" rows waiting longer than RESUME_REQUEUE_AFTER are
+    queued again (and not re-queued for another RESUME_REQUEUE_AFTER).
+    Returns (requeued, reset).
+    """
+    queue = queue or get_resume_queue()
+    now = datetime.utcnow()
+    async with async_session() as db:
+        result = await db.execute(
+            update(Resume)
+            .where(
+                Resume.status == "processing",
+                Resume.updated_at < now - timedelta(seconds=settings.RESUME_PROCESSING_TIMEOUT),
+            )
+            .values(status="uploaded", updated_at=now)
+            .returning(Resume.id, Resume.user_id)
+        )
+        reset_rows = result.all()
+        reset = [row.id for row in reset_rows]
+        # Core UPDATE: tell the dashboard cache itself (the ORM event doesn't fire)
+        mark_dashboards_changed(db, {row.user_id for row in reset_rows})
+        await db.commit()
+        result = await db.execute(
+            select(Resume.id)
+            .where(
+                Resume.status == "uploaded",
+                Resume.updated_at < now - timedelta(seconds=settings.RESUME_REQUEUE_AFTER),
+            )
+            .order_by(Resume.updated_at)
+            .limit(_RECOVERY_BATCH)
+        )
+        queued = []
+        for resume_id in [*reset, *result.scalars()]:
+            try:
+                await queue.requeue(str(resume_id))
+            except Exception:
+                logger.warning("Recovery sweep could not enqueue resumes; retrying next sweep", exc_info=True)
+                break
+            queued.append(resume_id)
+        if queued:
+            await db.execute(
+                update(Resume)
+                .where(Resume.id.in_(queued), Resume.status == "uploaded")
+                .values(updated_at=now)
+            )
+            await db.commit()
+    if reset or queued:
+        logger.warning("Recovery sweep: %d stalled resumes reset, %d re-enqueued", len(reset), len(queued))
+    return len(queued), len(reset)
+
+
+async def run_recovery(queue=None) -> None:
+    """Sweep for stalled resumes now and every RESUME_RECOVERY_INTERVAL seconds, until cancelled."""
+    if settings.RESUME_RECOVERY_INTERVAL <= 0:
+        return
+    while True:
+        try:
+            await recover_stalled(queue)
+        except Exception:
+            logger.exception("Resume recovery sweep failed")
+        await asyncio.sleep(settings.RESUME_RECOVERY_INTERVAL)
+
+
+_queue: InProcessQueue | RedisQueue | CeleryQueue | None = None
+
+
+def get_resume_queue() -> InProcessQueue | RedisQueue | CeleryQueue:
+    """Return the process-wide queue for the configured backend."""
+    global _queue
+    if _queue is None:
+        backend = settings.RESUME_QUEUE_BACKEND
+        if backend == "inprocess":
+            _queue = InProcessQueue(settings.RESUME_QUEUE_CONCURRENCY)
+        elif backend == "redis":
+            _queue = RedisQueue(settings.RESUME_QUEUE_CONCURRENCY)
+        elif backend == "celery":
+            _queue = CeleryQueue()
+        else:
+            raise ValueError(f"Unknown RESUME_QUEUE_BACKEND '{backend}'. Expected one of {QUEUE_BACKENDS}.")
+    return _queue
@@ -0,0 +1,79 @@
+"""
+Rebuild the user_stats rollup from resumes/analyses.
+Run `python -m app.workers.reconcile_stats [--user USER_ID]` after bulk SQL
+changes, restores, or whenever the rollup is suspected to have drifted.
+"""
+
+import argparse
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+from app.models.user_stats import UserStats
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ("resume_count", "scored_count", "score_sum")
+
+
+def _for_user(query, column, user_id: uuid.UUID | None):
+    return query.where(column == user_id) if user_id else query
+
+
+def _totals(row) -> tuple:
+    # Running float sums and a fresh SUM() differ in the last bits; that is not drift
+    resume_count, scored_count, score_sum = row[1:]
+    return resume_count, scored_count, round(score_sum, 6)
+
+
+async def rebuild_user_stats(db: AsyncSession, user_id: uuid.UUID | None = None) -> int:
+    """Recompute the rollup (for one user or everyone); returns how many rows changed."""
+    if db.bind.dialect.name == "postgresql":
+        # Writers queue behind the rebuild and then apply their deltas to the fresh rows
+        await db.execute(text("LOCK TABLE user_stats IN SHARE ROW EXCLUSIVE MODE"))
+
+    current = _for_user(select(UserStats.user_id, *(getattr(UserStats, c) for c in _COLUMNS)), UserStats.user_id, user_id)
+    before = {row[0]: _totals(row) for row in await db.execute(current)}
+
+    await db.execute(_for_user(delete(UserStats), UserStats.user_id, user_id))
+    totals = (
+        select(
+            Resume.user_id,
+            func.count(Resume.id),
+            func.count(Analysis.overall_score),
+            func.coalesce(func.sum(Analysis.overall_score), 0.0),
+            func.current_timestamp(),
+        )
+        .outerjoin(Analysis, Analysis.resume_id == Resume.id)
+        .group_by(Resume.user_id)
+    )
+    totals = _for_user(totals, Resume.user_id, user_id)
+    await db.execute(insert(UserStats).from_select([UserStats.user_id, *_COLUMNS, UserStats.updated_at], totals))
+
+    after = {row[0]: _totals(row) for row in await db.execute(current)}
+    changed = [uid for uid in before.keys() | after.keys() if before.get(uid) != after.get(uid)]
+    for uid in changed:
+        logger.warning("user_stats for %s: %s -> %s", uid, before.get(uid), after.get(uid))
+    return len(changed)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the user_stats rollup.")
+    parser.add_argument("--user", type=uuid.UUID, help="only this user's row")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    async with async_session() as db:
+        changed = await rebuild_user_stats(db, args.user)
+        await db.commit()
+    logger.info("user_stats rebuilt; %d row(s) corrected", changed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
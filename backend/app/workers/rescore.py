@@ -0,0 +1,180 @@
+"""
+Re-score stored analyses from their feature vectors (app.services.rescoring)
+after a change to SCORING_WEIGHTS or a score band, without re-analysing text.
+Run `python -m app.workers.rescore` for a dry run (how many scores would move),
+`--apply` to write them, and `--backfill` once after migration 010 to give
+older analyses a vector. Bump RULESET_VERSION with the change as well, so
+cached analyses of new uploads are not served with the old scores.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import numpy as np
+from sqlalchemy import select, update
+
+from app.core.database import async_session
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+from app.services.ai_service import (
+    LENGTH_BANDS, LENGTH_FEEDBACK, SCORING_WEIGHTS, AIService, band_index, formatting_issues,
+)
+from app.services.rescoring import feature_matrix, pack_features, score_matrix
+from app.workers.reconcile_stats import rebuild_user_stats
+
+logger = logging.getLogger(__name__)
+
+_WRITE_BATCH = 1000  # rows whose details are compared and rewritten per statement (SQLite bind-parameter limit)
+
+
+async def backfill(batch: int = 500) -> int:
+    """Analyse the text of every analysis without a feature vector; returns how many were filled."""
+    filled = 0
+    skipped = set()  # analyses whose text scores as empty
+    service = AIService()
+    while True:
+        async with async_session() as db:
+            query = (
+                select(Analysis.id, Resume.raw_text)
+                .join(Resume, Resume.id == Analysis.resume_id)
+                .where(Analysis.features.is_(None), Resume.raw_text.is_not(None))
+                .limit(batch + len(skipped))
+            )
+            rows = [row for row in await db.execute(query) if row.id not in skipped]
+            if not rows:
+                return filled
+            values = []
+            for row in rows:
+                features = pack_features(service.analyze(row.raw_text)["sections"])
+                if features is None:
+                    skipped.add(row.id)
+                    continue
+                values.append({"id": row.id, "features": features})
+            if values:
+                await db.execute(update(Analysis), values)
+            await db.commit()
+            filled += len(values)
+        logger.info("filled %d feature vectors", filled)
+
+
+def _rescored_sections(sections: dict, scores: dict[str, int]) -> dict:
+    """The stored details with new scores and weights, and the feedback that depends on them."""
+    sections = {key: dict(detail) for key, detail in sections.items()}
+    for key, weight in SCORING_WEIGHTS.items():
+        sections[key]["score"] = scores[key]
+        sections[key]["weight"] = weight
+    sections["length"]["feedback"] = LENGTH_FEEDBACK[band_index(sections["length"]["word_count"], LENGTH_BANDS)]
+    formatting = sections["formatting"]
+    formatting["issues"] = formatting_issues(
+        formatting["blank_runs"], formatting["caps_lines"], formatting["long_lines"], formatting["bullets"],
+    )
+    return sections
+
+
+async def _write(
+    db, ids: list, overall: np.ndarray, stored: np.ndarray, scores: dict[str, np.ndarray], suggester: AIService,
+) -> int:
+    """Rewrite the rows whose score or details (a weight, a dimension score) differ; returns how many."""
+    result = await db.execute(select(Analysis.id, Analysis.sections).where(Analysis.id.in_(ids)))
+    details = dict(result.all())
+    values = []
+    for i, analysis_id in enumerate(ids):
+        sections = _rescored_sections(details[analysis_id], {key: int(column[i]) for key, column in scores.items()})
+        if overall[i] == stored[i] and sections == details[analysis_id]:
+            continue
+        values.append({
+            "id": analysis_id,
+            "overall_score": float(overall[i]),
+            "sections": sections,
+            "suggestions": suggester._generate_suggestions(sections),
+        })
+    if values:
+        # Bulk update by primary key: the rollup's ORM events don't fire, so rescore() rebuilds it
+        await db.execute(update(Analysis), values)
+    return len(values)
+
+
+async def rescore(batch: int = 50_000, apply: bool = False) -> dict:
+    """
+    Score every analysis with a feature vector, in id-ordered batches, and
+    count those whose overall score moves. With ``apply``, also compare the
+    stored details and rewrite every row that differs, which includes rows
+    where only a weight or a dimension score changed. Returns counts, the
+    mean change and where the time went.
+    """
+    summary = {
+        "scored": 0, "changed": 0, "rewritten": 0, "delta_sum": 0.0, "load_s": 0.0, "score_s": 0.0, "write_s": 0.0,
+    }
+    suggester = AIService()
+    after = None
+    while True:
+        async with async_session() as db:
+            start = time.perf_counter()
+            query = (
+                select(Analysis.id, Analysis.features, Analysis.overall_score)
+                .where(Analysis.features.is_not(None))
+                .order_by(Analysis.id)
+                .limit(batch)
+            )
+            if after is not None:
+                query = query.where(Analysis.id > after)
+            rows = (await db.execute(query)).all()
+            summary["load_s"] += time.perf_counter() - start
+            if not rows:
+                break
+            after = rows[-1].id
+
+            start = time.perf_counter()
+            overall, scores = score_matrix(feature_matrix([row.features for row in rows]))
+            stored = np.array([row.overall_score if row.overall_score is not None else np.nan for row in rows])
+            changed = np.flatnonzero(overall != stored)
+            summary["score_s"] += time.perf_counter() - start
+            summary["scored"] += len(rows)
+            summary["changed"] += len(changed)
+            summary["delta_sum"] += float(np.nansum(overall[changed] - stored[changed]))
+
+            if apply:
+                start = time.perf_counter()
+                for first in range(0, len(rows), _WRITE_BATCH):
+                    chunk = slice(first, first + _WRITE_BATCH)
+                    summary["rewritten"] += await _write(
+                        db, [row.id for row in rows[chunk]], overall[chunk], stored[chunk],
+                        {key: column[chunk] for key, column in scores.items()}, suggester,
+                    )
+                await db.commit()
+                summary["write_s"] += time.perf_counter() - start
+        logger.info("scored %d analyses, %d changed", summary["scored"], summary["changed"])
+
+    if summary["rewritten"]:
+        async with async_session() as db:
+            await rebuild_user_stats(db)
+            await db.commit()
+    return summary
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score stored analyses from their feature vectors.")
+    parser.add_argument("--apply", action="store_true", help="write the new scores (default: dry run)")
+    parser.add_argument("--backfill", action="store_true", help="first compute vectors for analyses without one")
+    parser.add_argument("--batch", type=int, default=50_000, help="analyses scored per query")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.backfill:
+        logger.info("backfill done; %d feature vectors filled", await backfill())
+    summary = await rescore(args.batch, args.apply)
+    changed = summary["changed"]
+    logger.info(
+        "%d analyses scored, %d overall scores %s (mean change %+.2f); load %.1fs, score %.2fs, write %.1fs",
+        summary["scored"], changed, "changed" if args.apply else "would change",
+        summary["delta_sum"] / changed if changed else 0.0,
+        summary["load_s"], summary["score_s"], summary["write_s"],
+    )
+    if args.apply:
+        logger.info("%d analyses rewritten", summary["rewritten"])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,25 @@
-"""Background worker for processing resume analyses asynchronously."""
+"""
+Background worker for processing resume analyses asynchronously.
+Run `python -m app.workers.resume_worker` to consume the Redis queue.
+"""
+
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import update
+from sqlalchemy.orm import undefer
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.executor import ExecutorSaturatedError, analysis_executor
+from app.core.metrics import stage
+from app.models.resume import Resume
+from app.services.dashboard_service import mark_dashboards_changed  # (also drops cached dashboards on commit)
+from app.services.resume_events import publish_status
+from app.services.resume_service import ResumeService, UnreadableResumeError
+
+logger = logging.getLogger(__name__)
 
 
 async def process_resume(resume_id: str):
@@ -7,7 +28,65 @@ async def process_resume(resume_id: str):
     1. Extract text from uploaded resume
     2. Run AI analysis
     3. Store results in database
-    4. Update resume status
+    4. Update resume status (processing → analyzed / failed), announcing
+       each change on the event bus once it is committed
     """
-    # TODO: Implement background processing pipeline
-    pass
+    async with async_session() as db:
+        resume = await db.get(Resume, uuid.UUID(resume_id), options=[undefer(Resume.raw_text)])
+        if resume is None or resume.status in ("analyzed", "processing"):
+            return
+        # Claim the row: the recovery sweep may queue a resume twice, and only one worker may run it
+        claimed = await db.execute(
+            update(Resume).where(Resume.id == resume.id, Resume.status == resume.status).values(status="processing")
+        )
+        if claimed.rowcount != 1:
+            await db.rollback()
+            return
+        mark_dashboards_changed(db, (resume.user_id,))  # a Core UPDATE: the ORM event doesn't see it
+        await db.commit()
+        await publish_status(resume)
+
+        try:
+            analysis = await ResumeService(db).run_pipeline(resume)
+        except ExecutorSaturatedError:
+            # Put it back so the queue consumer can retry once the pool drains
+            await _set_status(db, resume, "uploaded")
+            raise
+        except UnreadableResumeError:
+            await _set_status(db, resume, "failed")
+            return
+        except Exception:
+            await _set_status(db, resume, "failed")
+            raise
+        with stage("pipeline.commit"):
+            await db.commit()
+        await publish_status(resume, analysis)
+
+
+async def _set_status(db, resume: Resume, status: str) -> None:
+    """Discard the half-finished pipeline work and record the resume's new status."""
+    await db.rollback()
+    resume.status = status
+    await db.commit()
+    await publish_status(resume)
+
+
+async def main() -> None:
+    from app.workers.queue import RedisQueue, get_resume_queue, run_recovery
+
+    queue = get_resume_queue()
+    if not isinstance(queue, RedisQueue):
+        raise SystemExit(
+            f"RESUME_QUEUE_BACKEND={settings.RESUME_QUEUE_BACKEND!r} has no standalone worker; "
+            "use 'redis' (or run a Celery worker for 'celery')."
+        )
+    analysis_executor.start()
+    try:
+        await asyncio.gather(queue.consume(), run_recovery(queue))
+    finally:
+        analysis_executor.shutdown()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
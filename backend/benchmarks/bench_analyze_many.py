@@ -0,0 +1,57 @@
+"""
+Batch Analysis Throughput
+Compares AIService.analyze_many against a per-item analyze_resume loop.
+
+Usage (from backend/):
+    python -m benchmarks.bench_analyze_many --count 500 --profile standard
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.services.ai_service import AIService
+from benchmarks.corpus import PROFILES, build_corpus
+
+
+def _per_item(service: AIService, texts: list[str]) -> list[dict]:
+    async def run() -> list[dict]:
+        return [await service.analyze_resume(text) for text in texts]
+    return asyncio.run(run())
+
+
+def _throughput(fn, texts: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(texts)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="standard")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    service = AIService()
+    texts = build_corpus(args.count, args.profile)
+    assert service.analyze_many(texts) == _per_item(service, texts)
+
+    loop_rate = _throughput(lambda t: _per_item(service, t), texts, args.repeat)
+    batch_rate = _throughput(lambda t: service.analyze_many(t, batch_size=args.batch_size), texts, args.repeat)
+    stream_rate = _throughput(
+        lambda t: sum(1 for _ in service.analyze_many(t, stream=True, batch_size=args.batch_size)),
+        texts, args.repeat,
+    )
+    print(f"profile={args.profile} count={args.count} batch_size={args.batch_size}")
+    print(f"  per-item loop      {loop_rate:9.1f} resumes/sec")
+    print(f"  analyze_many       {batch_rate:9.1f} resumes/sec  ({batch_rate / loop_rate:.2f}x)")
+    print(f"  analyze_many/gen   {stream_rate:9.1f} resumes/sec  ({stream_rate / loop_rate:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Login Load
+Fires concurrent logins at the app (in-process, SQLite) while probing an
+unrelated endpoint, once with bcrypt inline on the event loop and once on
+the password executor, and reports login throughput and probe latency.
+
+Usage (from backend/):
+    python -m benchmarks.bench_auth_load --logins 40 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="bench-auth-"), "bench.sqlite")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+os.environ.setdefault("ANALYSIS_EXECUTOR", "inline")
+
+import httpx  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+from app.core.database import Base, engine  # noqa: E402
+from app.core.executor import password_executor  # noqa: E402
+from app.main import app as api  # noqa: E402
+
+_USER = {"email": "bench@example.com", "password": "correct horse battery", "full_name": "Bench"}
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _run(client: httpx.AsyncClient, logins: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: list[int] = []
+    probes: list[float] = []
+    done = asyncio.Event()
+
+    async def login() -> None:
+        async with semaphore:
+            r = await client.post("/api/auth/login", json={"email": _USER["email"], "password": _USER["password"]})
+            statuses.append(r.status_code)
+
+    async def probe() -> None:
+        # Latency is measured from when the probe was due, so event-loop stalls count
+        while not done.is_set():
+            due = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            await client.get("/health")
+            probes.append((time.perf_counter() - due) * 1000)
+
+    prober = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await prober
+    return {
+        "logins_per_sec": logins / elapsed,
+        "ok": statuses.count(200),
+        "shed": statuses.count(503),
+        "probe_p50": statistics.median(probes),
+        "probe_p99": _percentile(probes, 0.99),
+        "probe_max": max(probes),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=password_executor.max_workers)
+    parser.add_argument("--max-pending", type=int, default=password_executor.max_pending)
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    transport = httpx.ASGITransport(app=api)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        r = await client.post("/api/auth/register", json=_USER)
+        assert r.status_code == 200, r.text
+
+        print(
+            f"logins={args.logins} concurrency={args.concurrency} "
+            f"workers={args.workers} max_pending={args.max_pending}"
+        )
+        for mode in ("inline", "thread"):
+            password_executor.shutdown()
+            password_executor.mode = mode
+            password_executor.max_workers = args.workers
+            password_executor.max_pending = args.max_pending
+            password_executor.start()
+            stats = await _run(client, args.logins, args.concurrency)
+            label = "bcrypt on event loop" if mode == "inline" else "password executor"
+            print(
+                f"  {label:<21} {stats['logins_per_sec']:6.1f} logins/s  ok={stats['ok']} shed={stats['shed']}  "
+                f"/health p50={stats['probe_p50']:.1f}ms p99={stats['probe_p99']:.1f}ms max={stats['probe_max']:.1f}ms"
+            )
+        password_executor.shutdown()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
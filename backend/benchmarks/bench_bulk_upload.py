@@ -0,0 +1,105 @@
+"""
+Bulk Upload
+Times getting N resumes analysed through the app (in-process, SQLite): one
+POST /api/resume/upload per file followed by the background queue draining,
+against a single POST /api/resume/bulk with the same files in one ZIP.
+
+Usage (from backend/):
+    python -m benchmarks.bench_bulk_upload --files 200 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+_TMP = Path(tempfile.mkdtemp(prefix="bench-bulk-"))
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_TMP / 'bench.sqlite'}"
+
+import httpx  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+import app.services.resume_service as resume_service  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, engine  # noqa: E402
+from app.main import app as api  # noqa: E402
+from app.workers.queue import get_resume_queue  # noqa: E402
+from benchmarks.corpus import build_corpus  # noqa: E402
+
+_USER = {"email": "bench@example.com", "password": "correct horse battery", "full_name": "Bench"}
+
+
+async def _one_by_one(client: httpx.AsyncClient, headers: dict, texts: list[str], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    queue = get_resume_queue()
+
+    async def upload(i: int, text: str) -> None:
+        async with semaphore:
+            files = {"file": (f"single-{i}.txt", text.encode(), "text/plain")}
+            r = await client.post("/api/resume/upload", headers=headers, files=files)
+            assert r.status_code == 200, r.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(upload(i, text) for i, text in enumerate(texts)))
+    if hasattr(queue, "join"):  # wait until the background worker has analysed them too
+        await queue.join()
+    return time.perf_counter() - start
+
+
+async def _bulk(client: httpx.AsyncClient, headers: dict, texts: list[str]) -> tuple[float, dict]:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        for i, text in enumerate(texts):
+            archive.writestr(f"resumes/bulk-{i}.txt", text)
+    files = [("files", ("resumes.zip", buf.getvalue(), "application/zip"))]
+
+    start = time.perf_counter()
+    async with client.stream("POST", "/api/resume/bulk", headers=headers, files=files) as r:
+        assert r.status_code == 200, await r.aread()
+        lines = [json.loads(line) async for line in r.aiter_lines() if line]
+    return time.perf_counter() - start, lines[-1]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel single uploads")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    resume_service.UPLOAD_DIR = _TMP / "uploads"
+    resume_service.UPLOAD_DIR.mkdir()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Separate corpora, so neither run is served from the other's caches
+    singles = build_corpus(args.files, seed=args.seed)
+    bulk = build_corpus(args.files, seed=args.seed + 1)
+
+    async with api.router.lifespan_context(api):
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+            assert (await client.post("/api/auth/register", json=_USER)).status_code == 200
+            r = await client.post("/api/auth/login", json={"email": _USER["email"], "password": _USER["password"]})
+            headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+            print(
+                f"files={args.files} executor={settings.ANALYSIS_EXECUTOR} "
+                f"bulk_concurrency={settings.BULK_CONCURRENCY} batch={settings.BULK_INSERT_BATCH}"
+            )
+            elapsed = await _one_by_one(client, headers, singles, args.concurrency)
+            print(f"  /upload x{args.files:<6} {elapsed:7.2f}s  {args.files / elapsed:7.1f} resumes/s")
+            elapsed, summary = await _bulk(client, headers, bulk)
+            print(
+                f"  /bulk (one zip)  {elapsed:7.2f}s  {args.files / elapsed:7.1f} resumes/s  "
+                f"analyzed={summary['analyzed']} queued={summary['queued']} failed={summary['failed']}"
+            )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+"""
+Dashboard Query
+Seeds one user with many analysed resumes (temp SQLite) and times the old
+dashboard path (stats query + every resume row with raw_text, sliced in
+Python) against DashboardService's single LIMITed query, cold and cached.
+
+Usage (from backend/):
+    python -m benchmarks.bench_dashboard --resumes 3000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="bench-dashboard-"), "bench.sqlite")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.orm import undefer  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+from app.core.database import Base, async_session, engine  # noqa: E402
+from app.models.analysis import Analysis  # noqa: E402
+from app.models.resume import Resume  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.dashboard_service import RECENT_RESUMES, DashboardService, dashboard_cache  # noqa: E402
+from benchmarks.corpus import iter_corpus  # noqa: E402
+
+
+async def legacy_dashboard(db, user_id: uuid.UUID) -> dict:
+    """The pre-DashboardService path: two queries, all rows and columns loaded."""
+    row = (await db.execute(
+        select(func.count(Resume.id), func.avg(Analysis.overall_score))
+        .outerjoin(Analysis, Resume.id == Analysis.resume_id)
+        .where(Resume.user_id == user_id)
+    )).one()
+    rows = (await db.execute(
+        select(Resume, Analysis.overall_score)
+        .outerjoin(Analysis, Resume.id == Analysis.resume_id)
+        .where(Resume.user_id == user_id)
+        .order_by(Resume.created_at.desc())
+        .options(undefer(Resume.raw_text))
+    )).all()
+    return {
+        "stats": {
+            "resumes_analyzed": row[0] or 0,
+            "average_score": round(float(row[1]), 1) if row[1] else None,
+        },
+        "recent_resumes": [
+            {
+                "id": str(r.id),
+                "parent_id": str(r.parent_id) if r.parent_id else None,
+                "filename": r.filename,
+                "status": r.status,
+                "overall_score": score,
+                "created_at": r.created_at.isoformat(),
+            }
+            for r, score in rows[:RECENT_RESUMES]
+        ],
+    }
+
+
+async def seed(count: int) -> uuid.UUID:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    user = User(email="bench@example.com", hashed_password="x", full_name="Bench")
+    start = datetime.utcnow() - timedelta(days=count)
+    async with async_session() as db:
+        db.add(user)
+        await db.flush()
+        for i, text in enumerate(iter_corpus(count, "long")):
+            resume = Resume(
+                user_id=user.id, filename=f"resume-{i}.pdf", file_path=f"/tmp/{i}.pdf",
+                raw_text=text, status="analyzed", created_at=start + timedelta(days=i),
+            )
+            db.add(resume)
+            await db.flush()
+            db.add(Analysis(resume_id=resume.id, overall_score=float(40 + i % 60)))
+        await db.commit()
+    return user.id
+
+
+async def _ms_per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    user_id = await seed(args.resumes)
+    async with async_session() as db:
+        service = DashboardService(db)
+        expected = await legacy_dashboard(db, user_id)
+        assert await service._load(user_id) == expected, "dashboard summaries differ"
+
+        async def legacy():
+            await legacy_dashboard(db, user_id)
+            db.expunge_all()
+
+        async def cold():
+            dashboard_cache.local.clear()
+            await service.summary(user_id)
+
+        async def cached():
+            await service.summary(user_id)
+
+        print(f"resumes={args.resumes} repeat={args.repeat}")
+        for label, fn in (("legacy (all rows)", legacy), ("single query", cold), ("cached", cached)):
+            print(f"  {label:<18} {await _ms_per_call(fn, args.repeat):9.3f} ms/request")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
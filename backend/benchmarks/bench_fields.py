@@ -0,0 +1,91 @@
+"""
+Resume Detail Payloads
+Times GET /api/resume/{id}/analysis-style reads (temp SQLite, long resumes
+with full analyses): the old path that loaded the whole Resume row and the
+whole Analysis, versus ResumeService.get_analysis with and without ?fields=.
+Each read includes JSON encoding of the response.
+
+Usage (from backend/):
+    python -m benchmarks.bench_fields --resumes 200 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import undefer
+
+from benchmarks.bench_dashboard import seed  # noqa: I001  (points DATABASE_URL at a temp SQLite file)
+from app.core.database import async_session, engine
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+from app.services.ai_service import AIService
+from app.services.resume_service import ResumeService
+from benchmarks.corpus import make_resume
+
+
+async def legacy_analysis(db, resume_id) -> dict:
+    """The old endpoint: full Resume (raw_text included) and full Analysis, analysis returned."""
+    resume = (await db.execute(
+        select(Resume).where(Resume.id == uuid.UUID(resume_id)).options(undefer(Resume.raw_text))
+    )).scalar_one()
+    analysis = (await db.execute(
+        select(Analysis).where(Analysis.resume_id == resume.id).options(undefer(Analysis.sections))
+    )).scalar_one()
+    data = {
+        "resume": {"id": str(resume.id), "filename": resume.filename, "raw_text": resume.raw_text},
+        "analysis": {
+            "id": str(analysis.id),
+            "overall_score": analysis.overall_score,
+            "sections": analysis.sections,
+            "suggestions": analysis.suggestions,
+            "keywords": analysis.keywords,
+            "created_at": analysis.created_at.isoformat(),
+        },
+    }
+    return data["analysis"]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    user_id = await seed(args.resumes)
+    result = AIService().analyze(make_resume(random.Random(1), "long"))
+    async with async_session() as db:
+        await db.execute(update(Analysis).values(
+            sections=result["sections"], suggestions=result["suggestions"], keywords=result["keywords"],
+        ))
+        await db.commit()
+        ids = [str(rid) for rid in (await db.scalars(select(Resume.id).where(Resume.user_id == user_id)))]
+
+    async def run(fn) -> tuple[float, int]:
+        sent = 0
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            async with async_session() as db:
+                for rid in ids:
+                    sent += len(json.dumps(await fn(db, rid)))
+        reads = args.repeat * len(ids)
+        return (time.perf_counter() - start) / reads * 1000, sent // reads
+
+    variants = (
+        ("legacy (full rows)", lambda db, rid: legacy_analysis(db, rid)),
+        ("get_analysis", lambda db, rid: ResumeService(db).get_analysis(rid, user_id)),
+        ("fields=overall_score", lambda db, rid: ResumeService(db).get_analysis(rid, user_id, "overall_score")),
+    )
+    print(f"resumes={len(ids)} repeat={args.repeat}")
+    for label, fn in variants:
+        ms, size = await run(fn)
+        print(f"  {label:<21} {ms:7.3f} ms/read  {size:6d} B/response")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
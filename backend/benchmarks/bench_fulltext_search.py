@@ -0,0 +1,158 @@
+"""
+Full-Text Search
+Loads synthetic resumes for one user and measures SearchService latency per
+query shape (first page and a deep page, p50 / p95), next to an ILIKE scan
+over resumes.raw_text for the same words (newest first, unranked).
+
+Runs on a temp SQLite file (the in-memory inverted-index fallback; the
+partition build is reported separately). Set BENCH_DATABASE_URL to an empty
+PostgreSQL database to measure the tsvector + GIN path instead.
+
+Usage (from backend/):
+    python -m benchmarks.bench_fulltext_search --resumes 100000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_DB_PATH = Path(tempfile.mkdtemp(prefix="bench-fts-")) / "bench.sqlite"
+os.environ["DATABASE_URL"] = os.environ.get("BENCH_DATABASE_URL") or f"sqlite+aiosqlite:///{_DB_PATH}"
+
+from sqlalchemy import insert, select, text  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+from app.core.database import Base, async_session, engine  # noqa: E402
+from app.models.resume import Resume  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.user_stats import UserStats  # noqa: E402
+from app.services.match_service import match_index  # noqa: E402
+from app.services.search_service import SearchService  # noqa: E402
+from benchmarks.corpus import iter_corpus  # noqa: E402
+
+QUERIES = {
+    "and-not": ("python AND kubernetes NOT intern", ["python", "kubernetes"], ["intern"]),
+    "phrase": ('"machine learning" docker', ["machine learning", "docker"], []),
+    "or-group": ("(aws OR docker) typescript -intern", None, None),
+    "selective": ("scrum AND roi AND kpi", ["scrum", "roi", "kpi"], []),
+}
+_INTERN_LINES = ["Software Engineering Intern, Summer", "Data intern on the analytics team"]
+_BATCH = 5000
+
+
+async def _load(count: int, seed: int) -> User:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if conn.dialect.name == "postgresql":  # not mapped on the model: add it as migration 009 does
+            await conn.execute(text(
+                "ALTER TABLE resumes ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                "GENERATED ALWAYS AS (to_tsvector('english'::regconfig, coalesce(raw_text, ''))) STORED"
+            ))
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_resumes_search_vector ON resumes USING gin (search_vector)"
+            ))
+    rnd = random.Random(seed)
+    async with async_session() as db:
+        user = User(email=f"bench-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", tier="enterprise")
+        db.add(user)
+        await db.flush()
+        start_at = datetime(2026, 1, 1)
+        batch = []
+        for n, body in enumerate(iter_corpus(count, seed=seed)):
+            if rnd.random() < 0.05:
+                body += "\n" + rnd.choice(_INTERN_LINES)
+            batch.append({
+                "id": uuid.uuid4(), "user_id": user.id, "filename": f"resume-{n}.txt", "file_path": "-",
+                "raw_text": body, "status": "analyzed", "created_at": start_at + timedelta(seconds=n),
+            })
+            if len(batch) == _BATCH:
+                await db.execute(insert(Resume), batch)
+                batch = []
+        if batch:
+            await db.execute(insert(Resume), batch)
+        # Core inserts skip the ORM events that keep the rollup (the search index's change marker)
+        await db.execute(insert(UserStats).values(user_id=user.id, resume_count=count, scored_count=0, score_sum=0.0))
+        await db.commit()
+    return user
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+async def _ilike_ms(user_id: uuid.UUID, include: list[str], exclude: list[str], limit: int) -> float:
+    query = (
+        select(Resume.id, Resume.filename)
+        .where(
+            Resume.user_id == user_id,
+            *(Resume.raw_text.ilike(f"%{word}%") for word in include),
+            *(~Resume.raw_text.ilike(f"%{word}%") for word in exclude),
+        )
+        .order_by(Resume.created_at.desc())
+        .limit(limit)
+    )
+    async with async_session() as db:
+        start = time.perf_counter()
+        await db.execute(query)
+        return (time.perf_counter() - start) * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per query and page")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--deep", type=int, default=5, help="page number for the deep-page timing")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    user = await _load(args.resumes, args.seed)
+    print(f"loaded {args.resumes} resumes in {time.perf_counter() - start:.1f}s ({engine.dialect.name})")
+
+    async with async_session() as db:
+        service = SearchService(db)
+        if engine.dialect.name != "postgresql":
+            start = time.perf_counter()
+            await match_index.partition(db, user.id)
+            print(f"index partition build      {time.perf_counter() - start:8.2f} s (first query only)")
+
+        print(f"{'query':<12} {'matches':>8} {'p50 ms':>8} {'p95 ms':>8} {'page':>5} {'p50 ms':>8} {'ILIKE ms':>9}")
+        for name, (query, include, exclude) in QUERIES.items():
+            first, deep, cursor, pages, seen = [], [], None, 0, 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                page = await service.search(user, query, args.limit)
+                first.append((time.perf_counter() - start) * 1000)
+            # Walk to the deep page once for its cursor, then time that page alone
+            cursor = page["next_cursor"]
+            seen = len(page["resumes"])
+            while cursor and pages < args.deep - 1:
+                deep_cursor = cursor
+                page = await service.search(user, query, args.limit, cursor)
+                cursor, pages, seen = page["next_cursor"], pages + 1, seen + len(page["resumes"])
+            if pages:
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    await service.search(user, query, args.limit, deep_cursor)
+                    deep.append((time.perf_counter() - start) * 1000)
+            while cursor:  # count the rest of the matches
+                page = await service.search(user, query, 100, cursor)
+                cursor, seen = page["next_cursor"], seen + len(page["resumes"])
+            p50, p95 = _percentiles(first)
+            deep_p50 = f"{statistics.median(deep):8.2f}" if deep else f"{'-':>8}"
+            ilike = f"{await _ilike_ms(user.id, include, exclude, args.limit):9.1f}" if include else f"{'-':>9}"
+            print(f"{name:<12} {seen:>8} {p50:8.2f} {p95:8.2f} {pages + 1:>5} {deep_p50} {ilike}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
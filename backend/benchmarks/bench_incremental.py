@@ -0,0 +1,79 @@
+"""
+Incremental Re-analysis
+Compares a full AIService.analyze against analyze_revision starting from the
+previous version's line features, over small edits to each resume.
+
+Usage (from backend/):
+    python -m benchmarks.bench_incremental --count 200 --profile long --edits 3
+"""
+
+import argparse
+import random
+import time
+
+from app.services.ai_service import AIService
+from app.services.incremental_analysis import analyze_revision, line_features
+from benchmarks.corpus import PROFILES, build_corpus
+
+_NEW_LINES = [
+    "• Increased conversion by 18% using python and sql.",
+    "• Led a team of 6 engineers through a kubernetes migration.",
+    "• Reduced cloud spend by $120,000 per year.",
+    "Volunteer",
+    "",
+]
+
+
+def revise(rnd: random.Random, text: str, edits: int) -> str:
+    """Apply ``edits`` single-line insertions, deletions or rewrites."""
+    lines = text.split("\n")
+    for _ in range(edits):
+        i = rnd.randrange(len(lines))
+        op = rnd.random()
+        if op < 0.4:
+            lines.insert(i, rnd.choice(_NEW_LINES))
+        elif op < 0.6 and len(lines) > 1:
+            del lines[i]
+        else:
+            lines[i] = f"{lines[i]} {rnd.choice(['with python', 'across 3 regions', 'by 25%'])}"
+    return "\n".join(lines)
+
+
+def _us_per_doc(fn, items: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(*item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="standard")
+    parser.add_argument("--edits", type=int, default=2, help="line edits per revision")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    service = AIService()
+    originals = build_corpus(args.count, args.profile)
+    revisions = [revise(rnd, text, args.edits) for text in originals]
+    features = [analyze_revision(text)[1] for text in originals]
+    pairs = list(zip(revisions, originals, features))
+    assert all(analyze_revision(*pair)[0] == service.analyze(pair[0]) for pair in pairs)
+
+    full = _us_per_doc(lambda text, *_: service.analyze(text), pairs, args.repeat)
+    line_features.cache_clear()
+    cold = _us_per_doc(lambda text, *_: analyze_revision(text), pairs, 1)
+    incremental = _us_per_doc(analyze_revision, pairs, args.repeat)
+    print(f"profile={args.profile} count={args.count} edits={args.edits}")
+    print(f"  full analysis              {full:9.1f} us/resume")
+    print(f"  features from scratch      {cold:9.1f} us/resume  ({full / cold:.2f}x)")
+    print(f"  incremental from previous  {incremental:9.1f} us/resume  ({full / incremental:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Resume Listing
+Walks every page of GET /api/resume/'s keyset pagination for one user
+(temp SQLite) and compares per-page latency at the start and the end of the
+walk with the old unpaginated listing that loaded every full Resume row.
+
+Usage (from backend/):
+    python -m benchmarks.bench_listing --resumes 5000 --limit 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+
+from benchmarks.bench_dashboard import seed  # noqa: I001  (points DATABASE_URL at a temp SQLite file)
+from app.core.database import async_session, engine
+from app.models.analysis import Analysis
+from app.models.resume import Resume
+from app.services.resume_service import ResumeService
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    user_id = await seed(args.resumes)
+    async with async_session() as db:
+        start = time.perf_counter()
+        legacy = (await db.execute(
+            select(Resume, Analysis.overall_score)
+            .outerjoin(Analysis, Resume.id == Analysis.resume_id)
+            .where(Resume.user_id == user_id)
+            .order_by(Resume.created_at.desc())
+            .options(undefer(Resume.raw_text))
+        )).all()
+        legacy_ms = (time.perf_counter() - start) * 1000
+        expected = [str(resume.id) for resume, _ in legacy]
+        db.expunge_all()
+
+        service = ResumeService(db)
+        seen: list[str] = []
+        timings: list[float] = []
+        cursor = None
+        while True:
+            start = time.perf_counter()
+            page = await service.list_user_resumes(user_id, args.limit, cursor)
+            timings.append((time.perf_counter() - start) * 1000)
+            seen.extend(item["id"] for item in page["resumes"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == expected, "keyset walk does not match the full listing"
+
+    edge = max(1, len(timings) // 10)
+    print(f"resumes={args.resumes} limit={args.limit} pages={len(timings)}")
+    print(f"  unpaginated listing      {legacy_ms:9.2f} ms")
+    print(f"  first {edge:>3} pages (avg)   {sum(timings[:edge]) / edge:9.2f} ms/page")
+    print(f"  last  {edge:>3} pages (avg)   {sum(timings[-edge:]) / edge:9.2f} ms/page")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
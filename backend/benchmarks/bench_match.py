@@ -0,0 +1,65 @@
+"""
+Job-Description Ranking
+Compares InvertedIndex.top_k (pruned, term-at-a-time) against scoring every
+indexed resume for the same job descriptions.
+
+Usage (from backend/):
+    python -m benchmarks.bench_match --count 20000 --queries 50 --k 10
+"""
+
+import argparse
+import random
+import time
+
+from app.utils.inverted_index import InvertedIndex, tokenize
+from benchmarks.corpus import PROFILES, iter_corpus
+
+
+def make_job_description(rnd: random.Random, vocabulary: list[str], size: int) -> list[str]:
+    """A bag of JD terms: mostly common resume words plus a few rarer ones."""
+    return tokenize(" ".join(rnd.choice(vocabulary) for _ in range(size)))
+
+
+def _ms_per_query(fn, queries: list[list[str]]) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="standard")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--terms", type=int, default=40, help="words per job description")
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    index = InvertedIndex()
+    start = time.perf_counter()
+    for doc_id, text in enumerate(iter_corpus(args.count, args.profile)):
+        index.add(doc_id, tokenize(text))
+    build = time.perf_counter() - start
+
+    rnd = random.Random(11)
+    # Sample words by corpus frequency so JDs look like real postings (many common terms)
+    vocabulary = [term for term, docs in index.postings.items() for _ in range(min(len(docs), 50))]
+    queries = [make_job_description(rnd, vocabulary, args.terms) for _ in range(args.queries)]
+
+    def exhaustive(query: list[str]) -> list[float]:
+        return sorted((index.score(doc_id, query) for doc_id in index.doc_lengths), reverse=True)[:args.k]
+
+    for query in queries[:5]:
+        expected = [round(score, 9) for score in exhaustive(query) if score > 0]
+        assert [round(score, 9) for _, score in index.top_k(query, args.k)][:len(expected)] == expected
+
+    pruned = _ms_per_query(lambda q: index.top_k(q, args.k), queries)
+    brute = _ms_per_query(exhaustive, queries[: max(1, args.queries // 10)])
+    print(f"docs={args.count} terms={len(index.postings)} build={build:.1f}s k={args.k}")
+    print(f"  score every resume   {brute:9.2f} ms/query")
+    print(f"  top_k (pruned)       {pruned:9.2f} ms/query  ({brute / pruned:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
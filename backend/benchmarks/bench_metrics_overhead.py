@@ -0,0 +1,74 @@
+"""
+Metrics Overhead
+Measures what the instrumentation costs: one stage() observation, its share
+of a full resume analysis (seven per-dimension stages), and GET /health
+through the ASGI app with and without MetricsMiddleware.
+
+Usage (from backend/):
+    python -m benchmarks.bench_metrics_overhead --count 500 --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.metrics import MetricsMiddleware, stage
+from app.main import app as api
+from app.services.ai_service import AIService
+from benchmarks.corpus import build_corpus
+
+
+def _stage_cost(n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        with stage("bench.noop"):
+            pass
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def _analysis_ms(texts: list[str]) -> float:
+    service = AIService()
+    start = time.perf_counter()
+    for text in texts:
+        service.analyze(text)
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+
+async def _request_us(asgi_app, n: int) -> float:
+    transport = httpx.ASGITransport(app=asgi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/health")
+        start = time.perf_counter()
+        for _ in range(n):
+            await client.get("/health")
+    return (time.perf_counter() - start) / n * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=500, help="resumes to analyse")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3, help="best-of rounds per variant")
+    args = parser.parse_args()
+
+    stage_us = _stage_cost(200_000)
+    print(f"stage() observation        {stage_us:8.2f} us")
+    texts = build_corpus(args.count)
+    _analysis_ms(texts)  # warm-up
+    analysis_ms = min(_analysis_ms(texts) for _ in range(args.rounds))
+    share = 7 * stage_us / 1000 / analysis_ms
+    print(f"analysis (7 stages)        {analysis_ms:8.3f} ms/resume  (stages ~{7 * stage_us:.0f} us, {share:.1%})")
+
+    # Strip the app's own MetricsMiddleware (before its stack is built) for the baseline
+    api.user_middleware = [m for m in api.user_middleware if m.cls is not MetricsMiddleware]
+    timed_app = MetricsMiddleware(api)
+    bare_us = min([await _request_us(api, args.requests) for _ in range(args.rounds)])
+    timed_us = min([await _request_us(timed_app, args.requests) for _ in range(args.rounds)])
+    print(f"GET /health via middleware {timed_us:8.1f} us/request  (bare {bare_us:.1f}, {timed_us / bare_us - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""
+Near Duplicates
+Plants edited copies of resumes in a synthetic corpus, then measures the
+MinHash signature cost, how many planted duplicates the LSH bands recall at
+the configured threshold (and how many candidates each lookup checks), and
+the DuplicateService lookup time against SQLite at that corpus size, next to
+the brute-force alternative of comparing the new signature with every one.
+
+Usage (from backend/):
+    python -m benchmarks.bench_near_duplicates --docs 5000 --copies 3 --edits 5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+_DB_PATH = Path(tempfile.mkdtemp(prefix="bench-dup-")) / "bench.sqlite"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+
+from sqlalchemy import insert  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, async_session, engine  # noqa: E402
+from app.models.analysis import Analysis  # noqa: E402
+from app.models.minhash_band import MinHashBand  # noqa: E402
+from app.models.resume import Resume  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.duplicate_service import DuplicateService  # noqa: E402
+from app.utils import minhash  # noqa: E402
+from benchmarks.corpus import build_corpus  # noqa: E402
+
+
+def _edit(text: str, edits: int, rnd: random.Random) -> str:
+    words = text.split(" ")
+    for _ in range(edits):
+        words[rnd.randrange(len(words))] = f"edit{rnd.randrange(10_000)}"
+    return " ".join(words)
+
+
+async def _load(signatures: list[bytes]) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as db:
+        user = User(email="bench@example.com", hashed_password="x", full_name="Bench")
+        db.add(user)
+        await db.flush()
+        resumes, analyses, bands = [], [], []
+        for signature in signatures:
+            resume_id, analysis_id = uuid.uuid4(), uuid.uuid4()
+            resumes.append({"id": resume_id, "user_id": user.id, "filename": "r.txt", "file_path": "-", "status": "analyzed"})
+            analyses.append({"id": analysis_id, "resume_id": resume_id, "overall_score": 50.0, "minhash": signature})
+            bands.extend(
+                {"analysis_id": analysis_id, "band": band, "bucket": bucket}
+                for band, bucket in enumerate(minhash.band_buckets(signature))
+            )
+        for model, rows in ((Resume, resumes), (Analysis, analyses), (MinHashBand, bands)):
+            await db.execute(insert(model), rows)
+        await db.commit()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=5000, help="distinct resumes in the corpus")
+    parser.add_argument("--copies", type=int, default=3, help="edited copies planted per query resume")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--edits", type=int, default=5, help="words replaced in each copy")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rnd = random.Random(args.seed)
+
+    texts = build_corpus(args.docs, seed=args.seed)
+    start = time.perf_counter()
+    signatures = [minhash.signature(text) for text in texts]
+    per_doc = (time.perf_counter() - start) / len(texts)
+    print(f"signature                {per_doc * 1e6:8.0f} us/resume")
+
+    # Each query is an edited copy of a corpus resume that also has `copies` edited copies stored
+    queries, planted = [], []
+    for index in rnd.sample(range(args.docs), args.queries):
+        queries.append(minhash.signature(_edit(texts[index], args.edits, rnd)))
+        planted.append({index, *range(len(signatures), len(signatures) + args.copies)})
+        signatures.extend(minhash.signature(_edit(texts[index], args.edits, rnd)) for _ in range(args.copies))
+    stored = list(enumerate(signatures))
+
+    buckets: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for n, sig in stored:
+        for key in enumerate(minhash.band_buckets(sig)):
+            buckets[key].append(n)
+    threshold = settings.NEAR_DUPLICATE_THRESHOLD
+    found = eligible = total = 0
+    candidate_counts = []
+    for query, expected in zip(queries, planted):
+        candidates = {n for key in enumerate(minhash.band_buckets(query)) for n in buckets.get(key, ())}
+        candidate_counts.append(len(candidates))
+        # Recall of the banding itself: copies whose signatures clear the threshold
+        above = {n for n in expected if minhash.similarity(query, signatures[n]) >= threshold}
+        found += len(above & candidates)
+        eligible += len(above)
+        total += len(expected)
+    print(
+        f"LSH recall               {found / eligible:8.1%}  of the {eligible}/{total} planted copies "
+        f"at similarity >= {threshold} ({args.edits} words edited per copy)"
+    )
+    print(f"candidates per lookup    {statistics.mean(candidate_counts):8.1f}  (corpus {len(stored)})")
+
+    start = time.perf_counter()
+    for query in queries[:20]:
+        [minhash.similarity(query, sig) for _, sig in stored]
+    brute_ms = (time.perf_counter() - start) / 20 * 1000
+
+    await _load([sig for _, sig in stored])
+    async with async_session() as db:
+        service = DuplicateService(db)
+        await service.similar(queries[0])  # warm-up
+        start = time.perf_counter()
+        for query in queries:
+            await service.similar(query)
+        lookup_ms = (time.perf_counter() - start) / len(queries) * 1000
+    await engine.dispose()
+    print(f"DuplicateService.similar {lookup_ms:8.2f} ms/lookup (SQLite)")
+    print(f"brute force              {brute_ms:8.2f} ms/lookup (compare every signature, in memory)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
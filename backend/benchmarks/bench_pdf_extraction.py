@@ -0,0 +1,79 @@
+"""
+PDF Extraction Latency
+Compares the old whole-document extraction against budgeted serial
+extraction and page-parallel extraction on the process pool, over
+generated multi-page PDFs.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pdf_extraction --count 10 --pages 2,10,40 --workers 4
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.executor import TaskExecutor
+from app.services.text_extraction import extract_pdf, extract_text, extract_text_with
+from benchmarks.corpus import build_pdf_corpus
+
+
+def _ms_per_doc(fn, paths: list[Path], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            fn(path)
+        best = min(best, time.perf_counter() - start)
+    return best / len(paths) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--pages", default="2,10,40", help="comma-separated page counts")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pages", type=int, default=settings.PDF_MAX_PAGES)
+    parser.add_argument("--max-chars", type=int, default=settings.PDF_MAX_CHARS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    settings.PDF_MAX_PAGES = args.max_pages
+    settings.PDF_MAX_CHARS = args.max_chars
+    max_pages, max_chars = args.max_pages or None, args.max_chars or None
+
+    executor = TaskExecutor("bench", "process", max_workers=args.workers, max_pending=args.workers * 4)
+    executor.start()
+    loop = asyncio.new_event_loop()
+    parallel = lambda path: loop.run_until_complete(extract_text_with(executor, path))  # noqa: E731
+    budgeted = lambda path: extract_text(path, ".pdf", max_pages, max_chars)  # noqa: E731
+
+    print(f"workers={executor.max_workers} mode={executor.mode} "
+          f"max_pages={args.max_pages} max_chars={args.max_chars} "
+          f"parallel_min_pages={settings.PDF_PARALLEL_MIN_PAGES} pages_per_task={settings.PDF_PAGES_PER_TASK}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for page_count in (int(p) for p in args.pages.split(",")):
+                paths = []
+                for i, data in enumerate(build_pdf_corpus(args.count, page_count)):
+                    path = Path(tmp) / f"{page_count}-{i}.pdf"
+                    path.write_bytes(data)
+                    paths.append(path)
+                assert all(parallel(path) == budgeted(path) for path in paths)
+
+                full = _ms_per_doc(extract_pdf, paths, args.repeat)
+                serial = _ms_per_doc(budgeted, paths, args.repeat)
+                split = _ms_per_doc(parallel, paths, args.repeat)
+                print(f"pages={page_count:<4} count={args.count}")
+                print(f"  whole document     {full:8.1f} ms/doc")
+                print(f"  serial, budgeted   {serial:8.1f} ms/doc  ({full / serial:.2f}x)")
+                print(f"  page-parallel      {split:8.1f} ms/doc  ({full / split:.2f}x)")
+    finally:
+        loop.close()
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Vectorised Re-scoring
+Compares re-scoring a corpus by re-running AIService over every text with
+score_matrix() over the stored feature vectors, after checking that both
+give the same scores. The vectors are tiled up to --rows for the array
+timing; --db-rows also loads that many analyses into a temp SQLite file and
+times app.workers.rescore end to end (dry run, then --apply after a weight
+change).
+
+Usage (from backend/):
+    python -m benchmarks.bench_rescoring --count 2000 --rows 1000000 --db-rows 100000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+_DB_PATH = Path(tempfile.mkdtemp(prefix="bench-rescore-")) / "bench.sqlite"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+
+from sqlalchemy import insert  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+from app.core.database import Base, async_session, engine  # noqa: E402
+from app.models.analysis import Analysis  # noqa: E402
+from app.models.resume import Resume  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.user_stats import UserStats  # noqa: E402
+from app.services.ai_service import SCORING_WEIGHTS, AIService  # noqa: E402
+from app.services.rescoring import feature_matrix, pack_features, score_matrix  # noqa: E402
+from app.workers.rescore import rescore  # noqa: E402
+from benchmarks.corpus import build_corpus  # noqa: E402
+
+_BATCH = 5000
+
+
+async def _load(results: list[dict], vectors: list[bytes], rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as db:
+        user = User(email="bench@example.com", hashed_password="x", full_name="Bench")
+        db.add(user)
+        await db.flush()
+        for start in range(0, rows, _BATCH):
+            resumes, analyses = [], []
+            for n in range(start, min(rows, start + _BATCH)):
+                result, resume_id = results[n % len(results)], uuid.uuid4()
+                resumes.append({"id": resume_id, "user_id": user.id, "filename": "r.txt", "file_path": "-", "status": "analyzed"})
+                analyses.append({
+                    "resume_id": resume_id, "overall_score": result["overall_score"], "sections": result["sections"],
+                    "suggestions": result["suggestions"], "features": vectors[n % len(vectors)],
+                })
+            await db.execute(insert(Resume), resumes)
+            await db.execute(insert(Analysis), analyses)
+        # Core inserts skip the ORM events that keep the rollup; --apply rebuilds it
+        score_sum = sum(results[n % len(results)]["overall_score"] for n in range(rows))
+        await db.execute(insert(UserStats).values(user_id=user.id, resume_count=rows, scored_count=rows, score_sum=score_sum))
+        await db.commit()
+
+
+def _report(label: str, summary: dict) -> None:
+    print(
+        f"{label:<26} {summary['changed']:>8} changed {summary['rewritten']:>8} rewritten  load {summary['load_s']:6.2f} s  "
+        f"score {summary['score_s']:6.3f} s  write {summary['write_s']:6.2f} s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="distinct resumes analysed")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="feature vectors scored in memory")
+    parser.add_argument("--db-rows", type=int, default=0, help="analyses loaded into SQLite for the worker run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    texts = build_corpus(args.count, seed=args.seed)
+    start = time.perf_counter()
+    results = AIService().analyze_many(texts)
+    analyse_s = time.perf_counter() - start
+    vectors = [pack_features(result["sections"]) for result in results]
+
+    overall, scores = score_matrix(feature_matrix(vectors))
+    mismatches = sum(
+        overall[i] != result["overall_score"]
+        or any(scores[key][i] != result["sections"][key]["score"] for key in SCORING_WEIGHTS)
+        for i, result in enumerate(results)
+    )
+    print(f"vector check               {mismatches} of {len(results)} resumes score differently")
+
+    tiled = [vectors[n % len(vectors)] for n in range(args.rows)]
+    start = time.perf_counter()
+    matrix = feature_matrix(tiled)
+    stack_s = time.perf_counter() - start
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        score_matrix(matrix)
+        best = min(best, time.perf_counter() - start)
+    per_text = analyse_s / args.count
+    print(f"re-analyse text            {per_text * 1e6:8.0f} us/resume  ({per_text * args.rows:8.1f} s for {args.rows} rows)")
+    print(f"score_matrix               {best / args.rows * 1e6:8.3f} us/resume  ({best:8.3f} s for {args.rows} rows, "
+          f"+{stack_s:.3f} s to stack the vectors)")
+
+    if args.db_rows:
+        start = time.perf_counter()
+        await _load(results, vectors, args.db_rows)
+        print(f"loaded {args.db_rows} analyses in {time.perf_counter() - start:.1f}s")
+        _report("rescore (dry run)", await rescore())
+        # Move weight from formatting to metrics, as a tuning change would
+        SCORING_WEIGHTS["formatting"] -= 0.05
+        SCORING_WEIGHTS["quantifiable_achievements"] += 0.05
+        _report("rescore (weights changed)", await rescore())
+        _report("rescore --apply", await rescore(apply=True))
+        _report("rescore (after apply)", await rescore())
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,153 @@
+"""
+Synthetic Resume Corpus
+Deterministic generator of resume-shaped text used by the benchmarks.
+The same seed always yields the same corpus, so numbers are comparable
+between commits.
+"""
+
+import io
+import random
+from typing import Iterator
+
+from app.services.ai_service import ACTION_VERBS, ATS_KEYWORDS
+
+_VERBS = sorted(ACTION_VERBS)
+_KEYWORDS = [kw for pool in ATS_KEYWORDS.values() for kw in pool]
+_NOUNS = [
+    "platform", "pipeline", "service", "dashboard", "API", "team", "roadmap",
+    "infrastructure", "release process", "data model", "onboarding flow",
+    "billing system", "test suite", "search index", "mobile app", "budget",
+]
+_FILLER = [
+    "across", "several", "teams", "with", "for", "the", "new", "core",
+    "customer", "internal", "legacy", "regional", "weekly", "production",
+]
+_METRICS = ["by 35%", "by $1,200,000", "to 12,000 users", "by 40 %", "saving $45,000", "in 3 months"]
+_HEADINGS = [
+    "PROFESSIONAL SUMMARY", "Experience", "Education", "Technical Skills",
+    "Projects", "Certifications", "Awards", "Languages", "Volunteer",
+]
+
+# Named corpus shapes: (min bullets, max bullets, keyword rate, metric rate)
+PROFILES = {
+    "short": (4, 10, 0.15, 0.2),
+    "standard": (15, 30, 0.25, 0.35),
+    "long": (60, 120, 0.25, 0.35),
+    "bullet_heavy": (80, 160, 0.1, 0.6),
+    "keyword_heavy": (15, 30, 0.9, 0.2),
+}
+
+
+def make_resume(rnd: random.Random, profile: str = "standard") -> str:
+    """Build one resume-shaped document for the given profile."""
+    lo, hi, keyword_rate, metric_rate = PROFILES[profile]
+    name = f"Candidate {rnd.randint(1000, 9999)}"
+    lines = [
+        name.upper(),
+        f"{name.lower().replace(' ', '.')}@example.com | +1 (555) {rnd.randint(100, 999)}-{rnd.randint(1000, 9999)}",
+        f"linkedin.com/in/{name.lower().replace(' ', '')} | github.com/{name.split()[1]}",
+        "",
+    ]
+    headings = _HEADINGS[: rnd.randint(4, len(_HEADINGS))]
+    bullets = rnd.randint(lo, hi)
+    per_section = max(1, bullets // len(headings))
+    for heading in headings:
+        lines.extend([heading, ""])
+        for _ in range(per_section):
+            words = [rnd.choice(_VERBS).title(), rnd.choice(_NOUNS)]
+            words += rnd.sample(_FILLER, rnd.randint(2, 6))
+            if rnd.random() < keyword_rate:
+                words += ["using"] + rnd.sample(_KEYWORDS, rnd.randint(1, 4))
+            if rnd.random() < metric_rate:
+                words.append(rnd.choice(_METRICS))
+            lines.append(f"• {' '.join(words)}.")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def iter_corpus(n: int, profile: str = "standard", seed: int = 42) -> Iterator[str]:
+    """Yield ``n`` resumes of one profile from a fixed seed."""
+    rnd = random.Random(f"{seed}:{profile}")
+    for _ in range(n):
+        yield make_resume(rnd, profile)
+
+
+def build_corpus(n: int, profile: str = "standard", seed: int = 42) -> list[str]:
+    return list(iter_corpus(n, profile, seed))
+
+
+# ── PDF ─────────────────────────────────────────────────────────────────
+_PDF_LINES_PER_PAGE = 60
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.replace("•", "-").encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    """Minimal text-only PDF (Helvetica, one content stream per page) that PyPDF2 can extract."""
+    objects: list[bytes] = [b"", b""]  # 1: catalog, 2: page tree (filled in below)
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    kids = []
+    for text in pages:
+        ops = ["BT", "/F1 10 Tf", "12 TL", "40 800 Td"]
+        ops += [f"({_pdf_escape(line)}) '" for line in text.splitlines()]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        kids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids),
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def make_pdf_resume(rnd: random.Random, page_count: int) -> bytes:
+    """A ``page_count``-page PDF built from consecutive "long" resumes."""
+    lines: list[str] = []
+    while len(lines) < page_count * _PDF_LINES_PER_PAGE:
+        lines.extend(make_resume(rnd, "long").splitlines())
+    return make_pdf([
+        "\n".join(lines[i * _PDF_LINES_PER_PAGE:(i + 1) * _PDF_LINES_PER_PAGE]) for i in range(page_count)
+    ])
+
+
+def build_pdf_corpus(n: int, page_count: int, seed: int = 42) -> list[bytes]:
+    rnd = random.Random(f"{seed}:pdf:{page_count}")
+    return [make_pdf_resume(rnd, page_count) for _ in range(n)]
+
+
+# ── DOCX ────────────────────────────────────────────────────────────────
+def make_docx(text: str) -> bytes:
+    """A .docx with one paragraph per line (headings as Heading 1), as python-docx writes it."""
+    from docx import Document
+
+    document = Document()
+    for line in text.splitlines():
+        if line in _HEADINGS or (line and line == line.upper()):
+            document.add_heading(line, level=1)
+        else:
+            document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def build_docx_corpus(n: int, profile: str = "standard", seed: int = 42) -> list[bytes]:
+    return [make_docx(text) for text in iter_corpus(n, profile, seed)]
@@ -0,0 +1,217 @@
+"""
+Load Test
+Signs N concurrent virtual users in (register → login), then drives the
+API through upload → list → dashboard loops for a fixed duration, at one
+or more concurrency levels, and reports per-endpoint throughput, latency
+percentiles and error rates.
+
+By default the real app (app.main:app, lifespan included) is served
+in-process against a temp SQLite database. Point --database-url at a local
+Postgres to use that instead, or use --url to load a separately started
+server (the honest "one backend process" number, since the in-process
+client shares the server's event loop):
+
+    uvicorn app.main:app --port 8000          # in another shell
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000
+
+In-process runs also wait for the upload queue to drain and report how many
+uploads/sec were actually analysed, not just accepted.
+
+Usage (from backend/):
+    python -m benchmarks.loadtest --concurrency 1,4,16,64 --duration 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.corpus import make_resume
+
+ENDPOINTS = ("register", "login", "upload", "list", "dashboard")
+SIGN_IN = ("register", "login")
+
+
+class Recorder:
+    """Per-endpoint latency samples and status codes (0 = transport error)."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, list[int]] = defaultdict(list)
+
+    async def call(self, endpoint: str, request) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            response = None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        self.statuses[endpoint].append(response.status_code if response is not None else 0)
+        return response if response is not None and response.status_code < 400 else None
+
+    def report(self, elapsed: float, sign_in_elapsed: float) -> dict[str, dict]:
+        """Per-endpoint summary; register/login rates are over the sign-in phase only."""
+        report = {}
+        for endpoint in ENDPOINTS:
+            samples = sorted(self.latencies.get(endpoint, ()))
+            if not samples:
+                continue
+            statuses = self.statuses[endpoint]
+            errors = sum(1 for code in statuses if not 200 <= code < 400)
+            report[endpoint] = {
+                "requests": len(samples),
+                "per_sec": round(len(samples) / (sign_in_elapsed if endpoint in SIGN_IN else elapsed), 2),
+                "error_rate": round(errors / len(samples), 4),
+                "errors": {str(code): statuses.count(code) for code in sorted(set(statuses)) if not 200 <= code < 400},
+                **{f"p{pct}_ms": round(_percentile(samples, pct / 100) * 1000, 2) for pct in (50, 90, 99)},
+                "max_ms": round(samples[-1] * 1000, 2),
+            }
+        return report
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def sign_in(client: httpx.AsyncClient, recorder: Recorder, user_no: int, run_id: str) -> dict | None:
+    """Register and log in one virtual user; returns its auth headers, or None if either failed."""
+    account = {"email": f"load-{run_id}-{user_no}@example.com", "password": "load-test-pw", "full_name": "Load"}
+    if await recorder.call("register", client.post("/api/auth/register", json=account)) is None:
+        return None
+    login = await recorder.call("login", client.post("/api/auth/login", json={
+        "email": account["email"], "password": account["password"],
+    }))
+    return {"Authorization": f"Bearer {login.json()['access_token']}"} if login is not None else None
+
+
+async def browse(client: httpx.AsyncClient, recorder: Recorder, headers: dict, rnd: random.Random, deadline: float):
+    iteration = 0
+    while time.perf_counter() < deadline:
+        # A fresh document every time, so the content-hash caches don't short-circuit the pipeline
+        text = make_resume(rnd, "standard").encode()
+        files = {"file": (f"resume-{iteration}.txt", text, "text/plain")}
+        await recorder.call("upload", client.post("/api/resume/upload", headers=headers, files=files))
+        await recorder.call("list", client.get("/api/resume/", headers=headers, params={"limit": 20}))
+        await recorder.call("dashboard", client.get("/api/dashboard/", headers=headers))
+        iteration += 1
+
+
+async def run_level(client: httpx.AsyncClient, concurrency: int, duration: float, queue=None) -> dict:
+    """
+    Sign every virtual user in (bcrypt-bound, timed on its own), then run the
+    upload → list → dashboard loop for ``duration`` seconds.
+    """
+    recorder = Recorder()
+    run_id = f"{concurrency}-{int(time.time() * 1000)}"
+    start = time.perf_counter()
+    sessions = await asyncio.gather(*(sign_in(client, recorder, n, run_id) for n in range(concurrency)))
+    sign_in_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        browse(client, recorder, headers, random.Random(f"{run_id}:{n}"), start + duration)
+        for n, headers in enumerate(sessions) if headers is not None
+    ))
+    elapsed = time.perf_counter() - start
+    level = {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 2),
+        "sign_in_elapsed_s": round(sign_in_elapsed, 2),
+        "endpoints": recorder.report(elapsed, sign_in_elapsed),
+    }
+    if queue is not None:
+        backlog = queue.depth()
+        await queue.join()
+        drained = time.perf_counter() - start
+        accepted = recorder.statuses["upload"].count(200)
+        level["queue_backlog_at_end"] = backlog
+        level["uploads_analysed_per_sec"] = round(accepted / drained, 2)
+    return level
+
+
+def print_level(level: dict) -> None:
+    print(
+        f"\nconcurrency={level['concurrency']}  load={level['elapsed_s']}s  "
+        f"(sign-in phase {level['sign_in_elapsed_s']}s)"
+    )
+    print(f"  {'endpoint':<10} {'reqs':>7} {'req/s':>8} {'err%':>6} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for endpoint, stats in level["endpoints"].items():
+        print(
+            f"  {endpoint:<10} {stats['requests']:7d} {stats['per_sec']:8.1f} {stats['error_rate']:6.1%} "
+            f"{stats['p50_ms']:8.1f} {stats['p90_ms']:8.1f} {stats['p99_ms']:8.1f} {stats['max_ms']:8.1f}"
+            + (f"  {stats['errors']}" if stats["errors"] else "")
+        )
+    if "uploads_analysed_per_sec" in level:
+        print(
+            f"  analysed {level['uploads_analysed_per_sec']:.1f} uploads/s "
+            f"(queue backlog at end of load: {level['queue_backlog_at_end']})"
+        )
+
+
+def _sqlite_for_concurrency(dbapi_connection, _record) -> None:
+    """WAL + a busy timeout, so concurrent writers queue on the lock instead of failing at once."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=10000")
+    cursor.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated virtual-user counts, run in turn")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds of load per concurrency level")
+    parser.add_argument("--url", help="load an already running server instead of the in-process app")
+    parser.add_argument("--database-url", help="in-process only; default: a temp SQLite file")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+    levels = [int(n) for n in args.concurrency.split(",")]
+
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+            results = [await run_level(client, n, args.duration) for n in levels]
+    else:
+        # Settings are read at import time, so the database has to be chosen before the app is imported
+        scratch = Path(tempfile.mkdtemp(prefix="loadtest-"))
+        os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{scratch / 'load.sqlite'}"
+        import app.models  # noqa: F401  (register tables)
+        import app.services.resume_service as resume_service
+        from app.core.database import Base, engine
+        from app.main import app as api
+        from app.workers.queue import get_resume_queue
+
+        resume_service.UPLOAD_DIR = scratch / "uploads"
+        resume_service.UPLOAD_DIR.mkdir()
+        if engine.dialect.name == "sqlite":
+            event.listen(engine.sync_engine, "connect", _sqlite_for_concurrency)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        # Unhandled errors become 500s in the report instead of aborting the run
+        transport = httpx.ASGITransport(app=api, raise_app_exceptions=False)
+        async with api.router.lifespan_context(api):
+            queue = get_resume_queue()
+            queue = queue if hasattr(queue, "join") else None  # only the in-process queue can be drained
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://loadtest", timeout=args.timeout, limits=limits,
+            ) as client:
+                results = [await run_level(client, n, args.duration, queue) for n in levels]
+        await engine.dispose()
+
+    for level in results:
+        print_level(level)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"target": args.url or "in-process", "levels": results}, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
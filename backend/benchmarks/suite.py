@@ -0,0 +1,239 @@
+"""
+Benchmark Suite
+Runs the analyser, extraction and upload-pipeline benchmarks over the fixed
+synthetic corpus and writes every result as JSON, so runs from two commits
+can be compared with --compare.
+
+- analyze.<profile>.total / .<dimension>: AIService.analyze per resume, with
+  per-dimension times taken from its analyze.* stages
+- extract.<format>: extract_text per file (txt, docx, 2- and 10-page pdf)
+- pipeline.<format>.upload / .process / .total: upload_and_analyze, then the
+  background worker's process_resume, against a temp SQLite database
+
+Each entry reports median/p95/min milliseconds per operation over every
+sample of every round. ANALYSIS_EXECUTOR defaults to inline here so the
+numbers do not depend on process-pool scheduling; set it to compare modes.
+
+Usage (from backend/):
+    python -m benchmarks.suite --out bench-before.json
+    python -m benchmarks.suite --out bench-after.json --compare bench-before.json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+_TMP = Path(tempfile.mkdtemp(prefix="bench-suite-"))
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_TMP / 'bench.sqlite'}"
+os.environ.setdefault("ANALYSIS_EXECUTOR", "inline")
+
+from sqlalchemy import func, select  # noqa: E402
+from starlette.datastructures import UploadFile  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables)
+import app.services.resume_service as resume_service  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, async_session, engine  # noqa: E402
+from app.core.executor import analysis_executor  # noqa: E402
+from app.core.metrics import collect_stages  # noqa: E402
+from app.models.analysis import Analysis  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.ai_service import AIService  # noqa: E402
+from app.services.text_extraction import extract_text  # noqa: E402
+from app.workers.resume_worker import process_resume  # noqa: E402
+from benchmarks.corpus import PROFILES, build_corpus, build_pdf_corpus, make_docx  # noqa: E402
+
+SUITES = ("analyze", "extract", "pipeline")
+FORMATS = ("txt", "docx", "pdf-2p", "pdf-10p")
+
+
+def _summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "n": len(ordered),
+    }
+
+
+def _make_files(fmt: str, count: int, seed: int) -> list[tuple[str, bytes]]:
+    """``count`` (extension, bytes) documents of one format; each format gets its own texts."""
+    if fmt.startswith("pdf-"):
+        return [(".pdf", data) for data in build_pdf_corpus(count, int(fmt[4:-1]), seed)]
+    texts = build_corpus(count, "standard", seed + 1000 * FORMATS.index(fmt))
+    if fmt == "docx":
+        return [(".docx", make_docx(text)) for text in texts]
+    return [(".txt", text.encode()) for text in texts]
+
+
+# ── benchmarks ───────────────────────────────────────────────────────────
+def bench_analyze(count: int, rounds: int, seed: int) -> dict[str, dict]:
+    service = AIService()
+    samples: dict[str, list[float]] = defaultdict(list)
+    for profile in PROFILES:
+        texts = build_corpus(count, profile, seed)
+        for text in texts[:10]:  # warm-up
+            service.analyze(text)
+        for _ in range(rounds):
+            for text in texts:
+                start = time.perf_counter()
+                _, stages = collect_stages(service.analyze, text)
+                samples[f"analyze.{profile}.total"].append(time.perf_counter() - start)
+                for name, seconds in stages:
+                    samples[f"analyze.{profile}.{name.removeprefix('analyze.')}"].append(seconds)
+    return {name: _summary(values) for name, values in samples.items()}
+
+
+def bench_extract(count: int, rounds: int, seed: int) -> dict[str, dict]:
+    results = {}
+    for fmt in FORMATS:
+        paths = []
+        for i, (ext, data) in enumerate(_make_files(fmt, count, seed)):
+            path = _TMP / f"extract-{fmt}-{i}{ext}"
+            path.write_bytes(data)
+            paths.append(path)
+        samples = []
+        for _ in range(rounds):
+            for path in paths:
+                start = time.perf_counter()
+                text = extract_text(path, path.suffix, settings.PDF_MAX_PAGES or None, settings.PDF_MAX_CHARS or None)
+                samples.append(time.perf_counter() - start)
+                assert text, f"no text extracted from {path.name}"
+        results[f"extract.{fmt}"] = _summary(samples)
+    return results
+
+
+async def bench_pipeline(count: int, rounds: int, seed: int) -> dict[str, dict]:
+    resume_service.UPLOAD_DIR = _TMP / "uploads"
+    resume_service.UPLOAD_DIR.mkdir(exist_ok=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as db:
+        user = User(email="bench@example.com", hashed_password="x", full_name="Bench")
+        db.add(user)
+        await db.commit()
+        user_id = user.id
+
+    results = {}
+    for fmt in FORMATS:
+        samples: dict[str, list[float]] = defaultdict(list)
+        for round_no in range(rounds):
+            # Fresh documents every round so the text/analysis caches never hit
+            files = _make_files(fmt, count, seed + round_no + 1)
+            for i, (ext, data) in enumerate(files):
+                upload = UploadFile(io.BytesIO(data), size=len(data), filename=f"{fmt}-{round_no}-{i}{ext}")
+                start = time.perf_counter()
+                async with async_session() as db:
+                    response = await resume_service.ResumeService(db).upload_and_analyze(upload, user_id)
+                uploaded = time.perf_counter()
+                await process_resume(response["resume_id"])
+                done = time.perf_counter()
+                samples["upload"].append(uploaded - start)
+                samples["process"].append(done - uploaded)
+                samples["total"].append(done - start)
+        results.update({f"pipeline.{fmt}.{part}": _summary(values) for part, values in samples.items()})
+
+    async with async_session() as db:
+        analysed = await db.scalar(select(func.count(Analysis.id)))
+    assert analysed == len(FORMATS) * rounds * count, f"only {analysed} uploads were analysed"
+    return results
+
+
+# ── reporting ────────────────────────────────────────────────────────────
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Print old/new medians side by side; return the benchmarks slower than ``1 + threshold``."""
+    regressions = []
+    print(f"{'benchmark':<46} {'base ms':>10} {'new ms':>10} {'change':>8}")
+    for name in sorted(results.keys() & baseline.keys()):
+        old, new = baseline[name]["median_ms"], results[name]["median_ms"]
+        change = new / old - 1 if old else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<46} {old:10.4f} {new:10.4f} {change:+8.1%}{flag}")
+    for name in sorted(results.keys() - baseline.keys()):
+        print(f"{name:<46} {'-':>10} {results[name]['median_ms']:10.4f}      new")
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", default=",".join(SUITES), help=f"comma-separated subset of {', '.join(SUITES)}")
+    parser.add_argument("--count", type=int, default=200, help="resumes per analyser profile")
+    parser.add_argument("--files", type=int, default=20, help="documents per format for extract/pipeline")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="baseline results JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="median slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    suites = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    results: dict[str, dict] = {}
+    analysis_executor.start()
+    try:
+        if "analyze" in suites:
+            results.update(bench_analyze(args.count, args.rounds, args.seed))
+        if "extract" in suites:
+            results.update(bench_extract(args.files, args.rounds, args.seed))
+        if "pipeline" in suites:
+            results.update(await bench_pipeline(args.files, args.rounds, args.seed))
+    finally:
+        analysis_executor.shutdown()
+        await engine.dispose()
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "executor": settings.ANALYSIS_EXECUTOR,
+            "args": {key: value for key, value in vars(args).items() if key not in ("out", "compare")},
+        },
+        "results": dict(sorted(results.items())),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print(f"\nvs {args.compare} (commit {baseline['meta'].get('commit')})")
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -9,7 +9,7 @@ import { useEffect, useState } from "react";
 import { useParams, useRouter } from "next/navigation";
 import Link from "next/link";
 import { useAuth } from "@/contexts/AuthContext";
-import { getResumeAnalysis } from "@/services/resume";
+import { getResumeAnalysis, watchResumeStatus } from "@/services/resume";
 import type { ResumeWithAnalysis, AnalysisSection } from "@/types/resume";
 import Navbar from "@/components/Header";
 import Footer from "@/components/Footer";
@@ -119,6 +119,10 @@ function SectionRow({ data }: { data: AnalysisSection }) {
   );
 }
 
+/* ── background analysis status ──────────────────────────────────────── */
+const PENDING_STATUSES = ["uploaded", "processing"];
+const POLL_INTERVAL_MS = 1500; // only if the status stream is unavailable
+
 /* ── main page ───────────────────────────────────────────────────────── */
 export default function AnalysisPage() {
   const { id } = useParams<{ id: string }>();
@@ -135,10 +139,52 @@ export default function AnalysisPage() {
       return;
     }
     if (user && id) {
-      getResumeAnalysis(id)
-        .then(setData)
-        .catch((e) => setError(e.message))
-        .finally(() => setLoading(false));
+      let cancelled = false;
+      let timer: ReturnType<typeof setTimeout> | undefined;
+      const stream = new AbortController();
+      const load = () =>
+        getResumeAnalysis(id)
+          .then((res) => {
+            if (cancelled) return;
+            setData(res);
+            if (PENDING_STATUSES.includes(res.resume.status)) {
+              follow();
+            } else {
+              setLoading(false);
+            }
+          })
+          .catch((e) => {
+            if (cancelled) return;
+            setError(e.message);
+            setLoading(false);
+          });
+      // Analysis runs in the background — wait for it to settle on the status
+      // stream, then load the full result once (falling back to polling)
+      const follow = () =>
+        watchResumeStatus(
+          id,
+          (event) =>
+            setData((prev) => prev && { ...prev, resume: { ...prev.resume, status: event.status } }),
+          stream.signal
+        )
+          .then((last) => {
+            if (cancelled) return;
+            // The stream only ends early if the connection dropped; don't reconnect in a tight loop
+            if (last && PENDING_STATUSES.includes(last.status)) {
+              timer = setTimeout(load, POLL_INTERVAL_MS);
+            } else {
+              load();
+            }
+          })
+          .catch(() => {
+            if (!cancelled) timer = setTimeout(load, POLL_INTERVAL_MS);
+          });
+      load();
+      return () => {
+        cancelled = true;
+        stream.abort();
+        clearTimeout(timer);
+      };
     }
   }, [authLoading, user, id, router]);
 
@@ -157,7 +203,12 @@ export default function AnalysisPage() {
         <main className="min-h-[70vh] flex flex-col items-center justify-center bg-[#f5f7fa] px-6 text-center">
           <AlertTriangle size={48} className="text-red-400 mb-4" />
           <h2 className="text-lg font-semibold text-gray-900 mb-2">Analysis not found</h2>
-          <p className="text-sm text-gray-500 mb-6">{error || "We couldn't load the analysis for this resume."}</p>
+          <p className="text-sm text-gray-500 mb-6">
+            {error ||
+              (data?.resume.status === "failed"
+                ? "We couldn't read any text from this file. Please upload a valid PDF or DOCX."
+                : "We couldn't load the analysis for this resume.")}
+          </p>
           <Link href="/dashboard" className="text-teal-700 font-medium text-sm flex items-center gap-1">
             <ArrowLeft size={14} /> Back to dashboard
           </Link>
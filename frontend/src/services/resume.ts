@@ -7,7 +7,8 @@ import { apiFetch } from "./api";
 import type {
   ResumeUploadResult,
   ResumeWithAnalysis,
-  ResumeListItem,
+  ResumeStatusEvent,
+  ResumeListPage,
   DashboardData,
 } from "@/types/resume";
 
@@ -55,10 +56,69 @@ export async function getResumeAnalysis(
 }
 
 /**
- * List all resumes for the current user.
+ * Follow a resume's status over Server-Sent Events until it is analyzed or
+ * failed (or `signal` aborts). Uses fetch rather than EventSource so the
+ * bearer token can be sent; resolves with the last status received.
  */
-export async function listResumes(): Promise<{ resumes: ResumeListItem[] }> {
-  return apiFetch<{ resumes: ResumeListItem[] }>("/api/resume/");
+export async function watchResumeStatus(
+  resumeId: string,
+  onStatus: (event: ResumeStatusEvent) => void,
+  signal?: AbortSignal
+): Promise<ResumeStatusEvent | null> {
+  const token =
+    typeof window !== "undefined"
+      ? localStorage.getItem("access_token")
+      : null;
+
+  const headers: Record<string, string> = { Accept: "text/event-stream" };
+  if (token) {
+    headers["Authorization"] = `Bearer ${token}`;
+  }
+
+  const res = await fetch(`${API_BASE_URL}/api/resume/${resumeId}/events`, {
+    headers,
+    signal,
+  });
+  if (!res.ok || !res.body) {
+    throw new Error(`Status stream failed with status ${res.status}`);
+  }
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  let last: ResumeStatusEvent | null = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return last;
+    buffer += value;
+    // Events are separated by a blank line; comments (": keep-alive") carry no data
+    let end;
+    while ((end = buffer.indexOf("\n\n")) !== -1) {
+      const data = buffer
+        .slice(0, end)
+        .split("\n")
+        .filter((line) => line.startsWith("data:"))
+        .map((line) => line.slice(5).trim())
+        .join("\n");
+      buffer = buffer.slice(end + 2);
+      if (data) {
+        last = JSON.parse(data) as ResumeStatusEvent;
+        onStatus(last);
+      }
+    }
+  }
+}
+
+/**
+ * List the current user's resumes, newest first, one page at a time.
+ * Pass the previous page's `next_cursor` to fetch the next one.
+ */
+export async function listResumes(
+  cursor?: string | null,
+  limit = 20
+): Promise<ResumeListPage> {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) params.set("cursor", cursor);
+  return apiFetch<ResumeListPage>(`/api/resume/?${params}`);
 }
 
 /**
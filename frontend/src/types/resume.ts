@@ -5,21 +5,36 @@
 /* ── Upload response ─────────────────────────────────────────────────── */
 export interface ResumeUploadResult {
   resume_id: string;
-  analysis_id: string;
+  parent_id: string | null; // previous version this upload revises
+  analysis_id: string | null; // null until the background analysis finishes
   filename: string;
-  overall_score: number;
+  overall_score: number | null;
   status: string;
 }
 
+/* ── Status event (GET /api/resume/:id/events) ─────────────────────── */
+export interface ResumeStatusEvent {
+  resume_id: string;
+  status: string;
+  analysis_id: string | null;
+  overall_score: number | null;
+}
+
 /* ── List item ───────────────────────────────────────────────────────── */
 export interface ResumeListItem {
   id: string;
+  parent_id: string | null;
   filename: string;
   status: string;
   overall_score: number | null;
   created_at: string;
 }
 
+export interface ResumeListPage {
+  resumes: ResumeListItem[];
+  next_cursor: string | null;
+}
+
 /* ── Analysis section detail ─────────────────────────────────────────── */
 export interface AnalysisSection {
   score: number;
@@ -49,6 +64,7 @@ export interface AnalysisResult {
 /* ── Resume detail ───────────────────────────────────────────────────── */
 export interface ResumeDetail {
   id: string;
+  parent_id: string | null;
   filename: string;
   status: string;
   created_at: string;